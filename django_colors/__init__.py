@@ -1 +1,23 @@
 """Django Colors application."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from django_colors.warmup import WarmupReport
+
+
+def preload(freeze: bool = True) -> WarmupReport:
+    """
+    Warm up every color field before the workers are forked.
+
+    See django_colors.warmup.preload(). Imported lazily so the package can
+    be imported before the apps are loaded.
+
+    :argument freeze: Whether to call gc.freeze() at the end
+    :returns: The report of what was warmed and how long it took
+    """
+    from django_colors.warmup import preload
+
+    return preload(freeze=freeze)
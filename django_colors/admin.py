@@ -0,0 +1,188 @@
+"""Admin integration for color fields."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Count, Field, Model
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from django_colors.fields import ColorModelField
+
+REQUEST_COUNTS_ATTR = "_django_colors_filter_counts"
+
+
+def get_last_value(params: dict, key: str) -> str | None:
+    """
+    Get the last value of a changelist parameter.
+
+    Changelist parameters are lists of values since Django 5.0.
+
+    :argument params: The changelist parameters
+    :argument key: The parameter name
+    :returns: The last value or None if missing
+    """
+    value = params.get(key)
+    if isinstance(value, list):
+        return value[-1] if value else None
+    return value
+
+
+class ColorListFilter(admin.FieldListFilter):
+    """
+    Changelist filter listing every color of a ColorModelField.
+
+    Each palette and custom color is shown with its number of rows. The
+    counts come from a single GROUP BY query over the admin queryset and
+    are computed once per request, however many times the filter is built.
+    Stored values that are not one of the current choices are listed too.
+    """
+
+    def __init__(
+        self,
+        field: Field,
+        request: HttpRequest,
+        params: dict,
+        model: type[Model],
+        model_admin: admin.ModelAdmin,
+        field_path: str,
+    ) -> None:
+        """
+        Initialize the filter.
+
+        :argument field: The color field
+        :argument request: The changelist request
+        :argument params: The changelist parameters
+        :argument model: The model of the changelist
+        :argument model_admin: The model admin
+        :argument field_path: The path of the field from the model
+        :returns: None
+        """
+        self.lookup_kwarg = f"{field_path}__exact"
+        self.lookup_kwarg_isnull = f"{field_path}__isnull"
+        self.lookup_val = get_last_value(params, self.lookup_kwarg)
+        self.lookup_val_isnull = get_last_value(
+            params, self.lookup_kwarg_isnull
+        )
+        self.request = request
+        self.model_admin = model_admin
+        super().__init__(
+            field, request, params, model, model_admin, field_path
+        )
+        self.color_field = (
+            field if isinstance(field, ColorModelField) else None
+        )
+
+    def expected_parameters(self) -> list[str]:
+        """
+        Get the parameters used by the filter.
+
+        :returns: List of parameter names
+        """
+        return [self.lookup_kwarg, self.lookup_kwarg_isnull]
+
+    def has_output(self) -> bool:
+        """
+        Check if the filter should be shown.
+
+        :returns: True, the filter always lists its colors
+        """
+        return True
+
+    def get_counts(self) -> dict[str | None, int]:
+        """
+        Get the number of rows of each stored value.
+
+        :returns: Dict mapping stored values to row counts
+        """
+        request_counts = self.request.__dict__.setdefault(
+            REQUEST_COUNTS_ATTR, {}
+        )
+        key = (self.model_admin.model, self.field_path)
+        if key not in request_counts:
+            request_counts[key] = dict(
+                self.model_admin.get_queryset(self.request)
+                .order_by()
+                .values_list(self.field_path)
+                .annotate(count=Count("pk"))
+                .values_list(self.field_path, "count")
+            )
+        return request_counts[key]
+
+    def get_color_choices(
+        self, counts: dict[str | None, int]
+    ) -> list[tuple[str, str]]:
+        """
+        Get the colors to list, followed by other stored values.
+
+        :argument counts: The row counts of the stored values
+        :returns: List of (value, label) tuples
+        """
+        choices = list(self.field.get_choices())
+        listed = {value for value, _ in choices}
+        others = {
+            value
+            for value in counts
+            if value not in self.field.empty_values and value not in listed
+        }
+        if others:
+            options = {}
+            if self.color_field is not None:
+                options = self.color_field.get_color_options(others)
+            choices.extend(
+                (value, options[value].label if value in options else value)
+                for value in sorted(others)
+            )
+        return choices
+
+    def choices(self, changelist: ChangeList) -> Iterator[dict]:
+        """
+        Get the filter choices with their row counts.
+
+        :argument changelist: The changelist
+        :returns: Iterator of choice dicts for the filter template
+        """
+        counts = self.get_counts()
+        yield {
+            "selected": self.lookup_val is None
+            and self.lookup_val_isnull is None,
+            "query_string": changelist.get_query_string(
+                remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]
+            ),
+            "display": _("All"),
+        }
+        for value, label in self.get_color_choices(counts):
+            yield {
+                "selected": self.lookup_val == str(value),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg: value}, [self.lookup_kwarg_isnull]
+                ),
+                "display": f"{label} ({counts.get(value, 0)})",
+            }
+        empty_display = self.model_admin.get_empty_value_display()
+        if "" in counts:
+            yield {
+                "selected": self.lookup_val == "",
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg: ""}, [self.lookup_kwarg_isnull]
+                ),
+                "display": f"{empty_display} ({counts['']})",
+            }
+        if None in counts:
+            yield {
+                "selected": bool(self.lookup_val_isnull),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg_isnull: "True"}, [self.lookup_kwarg]
+                ),
+                "display": f"{empty_display} ({counts[None]})",
+            }
+
+
+admin.FieldListFilter.register(
+    lambda field: isinstance(field, ColorModelField),
+    ColorListFilter,
+    take_priority=True,
+)
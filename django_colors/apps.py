@@ -1,6 +1,8 @@
 """App configuration for the django_colors app."""
 
 from django.apps import AppConfig
+from django.core.signals import setting_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class DjangoColorsConfig(AppConfig):
@@ -9,3 +11,41 @@ class DjangoColorsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_colors"
     verbose_name = "Django Colors"
+
+    def ready(self) -> None:
+        """
+        Compile the configuration and connect the signals.
+
+        The configuration table is recompiled whenever COLORS_APP_CONFIG
+        changes. Importing the checks module registers the system checks.
+        The choice models of every color field are tracked, so saving any of
+        their rows bumps the shared cache versions in every process.
+
+        :returns: None
+        """
+        from django_colors.cache import (
+            bump_shared_versions,
+            clear_request_choices,
+            track_choice_models,
+        )
+        from django_colors.checks import get_color_fields
+        from django_colors.settings import (
+            compile_config_table,
+            settings_changed,
+        )
+
+        compile_config_table()
+        setting_changed.connect(
+            settings_changed, dispatch_uid="django_colors_settings_changed"
+        )
+
+        for signal in (post_save, post_delete, m2m_changed):
+            signal.connect(
+                bump_shared_versions,
+                dispatch_uid="django_colors_bump_shared_versions",
+            )
+            signal.connect(
+                clear_request_choices,
+                dispatch_uid="django_colors_clear_request_choices",
+            )
+        track_choice_models(get_color_fields(None))
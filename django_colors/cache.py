@@ -0,0 +1,622 @@
+"""Caching of resolved color choices for the django_colors app."""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.functional import Promise
+
+from django_colors.settings import get_cache_aliases
+
+SHARED_KEY_PREFIX = "django_colors"
+
+_request_choices: ContextVar[dict[tuple, tuple] | None] = ContextVar(
+    "django_colors_request_choices", default=None
+)
+
+
+def freeze(value: object) -> Hashable:
+    """
+    Convert a value into a hashable representation for use in cache keys.
+
+    Dicts are converted into sorted tuples of items, lists and tuples into
+    tuples and sets into frozensets, recursively.
+
+    :argument value: The value to freeze
+    :returns: A hashable representation of the value
+    :raises TypeError: If the value (or a nested value) is not hashable
+    """
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((key, freeze(item)) for key, item in value.items()),
+                key=lambda pair: pair[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, Promise):
+        # lazy translations are keyed by their value in the active language
+        return str(value)
+    hash(value)
+    return value
+
+
+def make_key(*parts: object) -> tuple | None:
+    """
+    Build a cache key from the resolved call parameters.
+
+    :argument parts: The parameters that identify a set of choices
+    :returns: A hashable tuple, or None if any part cannot be hashed
+    """
+    try:
+        return freeze(parts)
+    except TypeError:
+        return None
+
+
+def is_importable(cls: type) -> bool:
+    """
+    Check that a class can be found at its module and qualified name.
+
+    :argument cls: The class to check
+    :returns: True if the name leads back to the class
+    """
+    found = sys.modules.get(cls.__module__)
+    for name in cls.__qualname__.split("."):
+        found = getattr(found, name, None)
+    return found is cls
+
+
+def serialize_class(cls: type) -> str:
+    """
+    Serialize a class into a string that is the same everywhere.
+
+    :argument cls: The class to serialize
+    :returns: The serialized class
+    :raises TypeError: If the class has no stable serialization
+    """
+    if issubclass(cls, Model):
+        return f"model:{cls._meta.label_lower}"
+    # generated classes (such as loaded palettes) carry their own digest
+    content_digest = cls.__dict__.get("content_digest")
+    if content_digest:
+        return f"digest:{content_digest}"
+    if not is_importable(cls):
+        raise TypeError(f"{cls.__qualname__} can't be imported by name.")
+    return f"class:{cls.__module__}.{cls.__qualname__}"
+
+
+def serialize(value: object) -> str:
+    """
+    Serialize a frozen key part into a string that is the same everywhere.
+
+    Only values with a stable serialization are accepted: plain values,
+    enums, classes importable by name or with a content_digest, model
+    instances (as their label and primary key),
+    deconstructible objects such as F() expressions, and tuples and
+    frozensets of those. Set items are sorted, so the result does not
+    depend on hash randomization.
+
+    :argument value: The frozen value to serialize
+    :returns: The serialized value
+    :raises TypeError: If the value has no stable serialization
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, tuple):
+        return f"({','.join(serialize(item) for item in value)})"
+    if isinstance(value, frozenset):
+        return f"{{{','.join(sorted(serialize(item) for item in value))}}}"
+    if isinstance(value, type):
+        return serialize_class(value)
+    if isinstance(value, Model):
+        if value.pk is None:
+            raise TypeError("Unsaved model instances have no stable key.")
+        return f"instance:{value._meta.label_lower}:{serialize(value.pk)}"
+    if hasattr(value, "deconstruct") and not isinstance(value, type):
+        path, args, kwargs = value.deconstruct()
+        return (
+            f"{path}{serialize(freeze(list(args)))}{serialize(freeze(kwargs))}"
+        )
+    raise TypeError(f"{type(value).__qualname__} has no stable key.")
+
+
+def make_shared_key(key: tuple) -> str | None:
+    """
+    Build the key of an entry in a shared cache.
+
+    Unlike make_key(), the result must be the same in every process, so
+    it is built from serialize() instead of repr().
+
+    :argument key: The key built with make_key()
+    :returns: The serialized key, or None if the key can't be shared
+    """
+    try:
+        return serialize(key)
+    except TypeError:
+        return None
+
+
+def repeat_on_commit(func: Callable[[], None], using: str | None) -> None:
+    """
+    Run an invalidation now and again when the transaction commits.
+
+    Signals are sent inside the writer's transaction. Another process can
+    still read the old rows until the commit and cache them as if they were
+    current, so the invalidation is repeated once the new rows are visible.
+    Outside of a transaction the rows are already committed and the
+    function only runs once.
+
+    :argument func: The invalidation to run
+    :argument using: The alias of the database the signal was sent for
+    :returns: None
+    """
+    func()
+    using = using or DEFAULT_DB_ALIAS
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(func, using=using)
+
+
+def get_through_models(choice_model: type[Model]) -> list[type[Model]]:
+    """
+    Get the many-to-many through models related to a choice model.
+
+    :argument choice_model: The choice model to inspect
+    :returns: List of through model classes
+    """
+    through_models = [
+        m2m.remote_field.through for m2m in choice_model._meta.many_to_many
+    ]
+    through_models.extend(
+        relation.through
+        for relation in choice_model._meta.related_objects
+        if relation.many_to_many
+    )
+    return [through for through in through_models if isinstance(through, type)]
+
+
+class ChoicesCache:
+    """
+    Process-local cache of resolved choices, grouped by choice model.
+
+    Entries are stored as tuples so they can never be modified in place.
+    Entries for a choice model are dropped whenever a row of that model is
+    saved, deleted or has its many-to-many relations changed, and again
+    when the transaction making the change commits.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty cache.
+
+        :returns: None
+        """
+        self._store: dict[type[Model] | None, dict[tuple, tuple]] = {}
+        self._generations: dict[type[Model] | None, int] = {}
+        self._senders: dict[type[Model], set[type[Model]]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        choice_model: type[Model] | None,
+        key: tuple,
+        version: int | None = None,
+    ) -> tuple | None:
+        """
+        Get the cached choices for a choice model and key.
+
+        Only entries of the current version are ever kept, so the version
+        is accepted for compatibility with SharedChoicesCache and ignored.
+
+        :argument choice_model: The choice model the choices were built from
+        :argument key: The cache key built from the call parameters
+        :argument version: The version read with version()
+        :returns: The cached tuple of choices or None if not cached
+        """
+        return self._store.get(choice_model, {}).get(key)
+
+    def version(self, choice_model: type[Model] | None) -> int:
+        """
+        Get the current version of a choice model.
+
+        The version changes each time the choice model is invalidated, so
+        results built while a row was changing are never stored.
+
+        :argument choice_model: The choice model to check
+        :returns: The current version number
+        """
+        return self._generations.get(choice_model, 0)
+
+    def set(
+        self,
+        choice_model: type[Model] | None,
+        key: tuple,
+        choices: list | tuple,
+        version: int | None = None,
+    ) -> tuple:
+        """
+        Store the choices for a choice model and key.
+
+        :argument choice_model: The choice model the choices were built from
+        :argument key: The cache key built from the call parameters
+        :argument choices: The choices to store
+        :argument version: The version read before building the choices;
+            if the model was invalidated since, nothing is stored
+        :returns: The immutable tuple of choices
+        """
+        frozen = tuple(choices)
+        if choice_model is not None:
+            self.watch(choice_model)
+        with self._lock:
+            if version is None or version == self._generations.get(
+                choice_model, 0
+            ):
+                self._store.setdefault(choice_model, {})[key] = frozen
+        return frozen
+
+    def invalidate(self, choice_model: type[Model] | None) -> None:
+        """
+        Drop every cached entry for a choice model.
+
+        :argument choice_model: The choice model to invalidate
+        :returns: None
+        """
+        with self._lock:
+            self._store.pop(choice_model, None)
+            self._generations[choice_model] = (
+                self._generations.get(choice_model, 0) + 1
+            )
+
+    def clear(self) -> None:
+        """
+        Drop every cached entry.
+
+        :returns: None
+        """
+        with self._lock:
+            for choice_model in list(self._store):
+                self._generations[choice_model] = (
+                    self._generations.get(choice_model, 0) + 1
+                )
+            self._store.clear()
+
+    def watch(self, choice_model: type[Model]) -> None:
+        """
+        Connect the invalidation signals for a choice model.
+
+        Only the choice model itself and the through models of its
+        many-to-many relations are connected, so changes to unrelated models
+        never touch the cache.
+
+        :argument choice_model: The choice model to watch
+        :returns: None
+        """
+        if choice_model in self._senders.get(choice_model, ()):
+            return
+        with self._lock:
+            self._senders.setdefault(choice_model, set()).add(choice_model)
+            post_save.connect(self._receiver, sender=choice_model, weak=False)
+            post_delete.connect(
+                self._receiver, sender=choice_model, weak=False
+            )
+            for through in get_through_models(choice_model):
+                self._senders.setdefault(through, set()).add(choice_model)
+                m2m_changed.connect(self._receiver, sender=through, weak=False)
+
+    def _receiver(self, sender: type[Model], **kwargs: dict) -> None:
+        """
+        Invalidate the choice models affected by a signal.
+
+        :argument sender: The model class that sent the signal
+        :argument kwargs: The signal arguments
+        :returns: None
+        """
+        choice_models = self._senders.get(sender, ())
+        if not choice_models:
+            return
+
+        def invalidate() -> None:
+            for choice_model in choice_models:
+                self.invalidate(choice_model)
+
+        repeat_on_commit(invalidate, kwargs.get("using"))
+
+
+choices_cache = ChoicesCache()
+
+
+class SharedChoicesCache:
+    """
+    Choices cache stored in one of the project's configured CACHES.
+
+    Every choice model has a version counter stored next to the entries.
+    The version is part of each entry key and is bumped whenever a row of
+    the choice model changes, so every process stops reading the old
+    entries at once.
+    """
+
+    def __init__(self, alias: str, timeout: int | None = None) -> None:
+        """
+        Initialize the shared cache for a cache alias.
+
+        :argument alias: The alias of the cache in the CACHES setting
+        :argument timeout: Timeout for the stored entries in seconds
+        :returns: None
+        """
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self) -> BaseCache:
+        """
+        Get the Django cache backend for the alias.
+
+        :returns: The cache backend instance
+        """
+        return caches[self.alias]
+
+    @staticmethod
+    def get_model_label(choice_model: type[Model] | None) -> str:
+        """
+        Get the label used for a choice model in the cache keys.
+
+        :argument choice_model: The choice model
+        :returns: The lowercased "app_label.model_name" label or "default"
+        """
+        if choice_model is None:
+            return "default"
+        return choice_model._meta.label_lower
+
+    def get_version_key(self, choice_model: type[Model] | None) -> str:
+        """
+        Get the cache key holding the version of a choice model.
+
+        :argument choice_model: The choice model
+        :returns: The version cache key
+        """
+        label = self.get_model_label(choice_model)
+        return f"{SHARED_KEY_PREFIX}:version:{label}"
+
+    def get_entry_key(
+        self, choice_model: type[Model] | None, key: tuple, version: int
+    ) -> str | None:
+        """
+        Get the cache key of an entry.
+
+        :argument choice_model: The choice model
+        :argument key: The cache key built from the call parameters
+        :argument version: The current version of the choice model
+        :returns: The entry cache key, or None if the key has no stable
+            serialization and the entry can't be shared
+        """
+        shared_key = make_shared_key(key)
+        if shared_key is None:
+            return None
+        digest = hashlib.sha256(shared_key.encode()).hexdigest()
+        label = self.get_model_label(choice_model)
+        return f"{SHARED_KEY_PREFIX}:choices:{label}:{version}:{digest}"
+
+    def version(self, choice_model: type[Model] | None) -> int:
+        """
+        Get the current version of a choice model.
+
+        A missing version (never set or evicted) is initialized from the
+        clock, so it can never repeat a version used for older entries.
+
+        :argument choice_model: The choice model
+        :returns: The current version
+        """
+        version_key = self.get_version_key(choice_model)
+        version = self.cache.get(version_key)
+        if version is None:
+            self.cache.add(version_key, time.time_ns(), None)
+            version = self.cache.get(version_key, 0)
+        return version
+
+    def bump(self, choice_model: type[Model] | None) -> None:
+        """
+        Bump the version of a choice model, expiring its entries.
+
+        :argument choice_model: The choice model
+        :returns: None
+        """
+        version_key = self.get_version_key(choice_model)
+        try:
+            self.cache.incr(version_key)
+        except ValueError:
+            self.cache.set(version_key, time.time_ns(), None)
+
+    def get(
+        self, choice_model: type[Model] | None, key: tuple, version: int
+    ) -> tuple | None:
+        """
+        Get the cached choices for a choice model and key.
+
+        :argument choice_model: The choice model the choices were built from
+        :argument key: The cache key built from the call parameters
+        :argument version: The version read with version()
+        :returns: The cached tuple of choices or None if not cached
+        """
+        entry_key = self.get_entry_key(choice_model, key, version)
+        if entry_key is None:
+            return None
+        return self.cache.get(entry_key)
+
+    def set(
+        self,
+        choice_model: type[Model] | None,
+        key: tuple,
+        choices: list | tuple,
+        version: int,
+    ) -> tuple:
+        """
+        Store the choices for a choice model and key.
+
+        :argument choice_model: The choice model the choices were built from
+        :argument key: The cache key built from the call parameters
+        :argument choices: The choices to store
+        :argument version: The version read before building the choices
+        :returns: The immutable tuple of choices
+        """
+        frozen = tuple(choices)
+        entry_key = self.get_entry_key(choice_model, key, version)
+        if entry_key is None:
+            # nothing that can't be keyed the same everywhere is shared
+            return frozen
+        if choice_model is not None:
+            tracked_models.add(choice_model)
+        self.cache.set(entry_key, frozen, self.timeout)
+        return frozen
+
+
+# choice models that are not ColorModel subclasses but are used for choices
+tracked_models: set[type[Model]] = set()
+
+
+def track_choice_models(color_fields: Iterable) -> None:
+    """
+    Track the choice models of color fields for the shared versions.
+
+    Called when the app is ready, so every process bumps the versions of
+    every choice model, not only of those it stored choices for. Fields
+    whose configuration can't be resolved are skipped, the system checks
+    report them.
+
+    :argument color_fields: The color fields of the installed models
+    :returns: None
+    """
+    for color_field in color_fields:
+        try:
+            choice_model = color_field.field_config.choice_model
+        except Exception:  # noqa: S112
+            continue
+        if choice_model is not None:
+            tracked_models.add(choice_model)
+
+
+def get_changed_models(
+    sender: type[Model], **kwargs: dict
+) -> set[type[Model]]:
+    """
+    Get the choice models affected by a model signal.
+
+    :argument sender: The model class that sent the signal
+    :argument kwargs: The signal arguments
+    :returns: Set of affected choice model classes
+    """
+    # imported here so this module can be imported before apps are loaded
+    from django_colors.models import ColorModel
+
+    return {
+        model
+        for model in get_signal_models(sender, **kwargs)
+        if issubclass(model, ColorModel) or model in tracked_models
+    }
+
+
+def get_signal_models(sender: type[Model], **kwargs: dict) -> set[type]:
+    """
+    Get the model classes whose rows a model signal reports as changed.
+
+    :argument sender: The model class that sent the signal
+    :argument kwargs: The signal arguments
+    :returns: Set of model classes
+    """
+    candidates = {sender}
+    if "pk_set" in kwargs:
+        # m2m_changed is sent by the through model
+        candidates.add(type(kwargs.get("instance")))
+        candidates.add(kwargs.get("model"))
+    return {model for model in candidates if isinstance(model, type)}
+
+
+def bump_shared_versions(sender: type[Model], **kwargs: dict) -> None:
+    """
+    Bump the shared cache version of choice models that changed.
+
+    Connected to post_save, post_delete and m2m_changed when the app is
+    ready. The versions are bumped again when the transaction making the
+    change commits.
+
+    :argument sender: The model class that sent the signal
+    :argument kwargs: The signal arguments
+    :returns: None
+    """
+    changed_models = get_changed_models(sender, **kwargs)
+    if not changed_models:
+        return
+
+    def bump() -> None:
+        for alias in get_cache_aliases():
+            shared_cache = SharedChoicesCache(alias)
+            for choice_model in changed_models:
+                shared_cache.bump(choice_model)
+
+    repeat_on_commit(bump, kwargs.get("using"))
+
+
+def clear_request_choices(sender: type[Model], **kwargs: dict) -> None:
+    """
+    Drop the memoized choices of changed models from the active scope.
+
+    Connected to post_save, post_delete and m2m_changed when the app is
+    ready. Any choice model can be memoized, so unlike the shared versions
+    this is not limited to ColorModel subclasses and tracked models.
+
+    :argument sender: The model class that sent the signal
+    :argument kwargs: The signal arguments
+    :returns: None
+    """
+    request_choices = _request_choices.get()
+    if not request_choices:
+        return
+    changed_models = get_signal_models(sender, **kwargs)
+    for key in list(request_choices):
+        # the first part of every key is the choice model
+        if key[0] in changed_models:
+            del request_choices[key]
+
+
+def get_request_choices() -> dict[tuple, tuple] | None:
+    """
+    Get the choices memoized in the active choices scope.
+
+    :returns: The memoized choices or None if no scope is active
+    """
+    return _request_choices.get()
+
+
+@contextmanager
+def choices_scope() -> Iterator[dict[tuple, tuple]]:
+    """
+    Memoize the choices of every color field until the scope exits.
+
+    Scopes are bound to the current context, so concurrent requests,
+    threads and async tasks each see their own memoized choices. Nesting
+    a scope inside another starts with an empty memo.
+
+    :returns: Iterator yielding the dict of memoized choices
+    """
+    request_choices: dict[tuple, tuple] = {}
+    token = _request_choices.set(request_choices)
+    try:
+        yield request_choices
+    finally:
+        _request_choices.reset(token)
@@ -0,0 +1,214 @@
+"""System checks for the django_colors app."""
+
+from django.apps import AppConfig, apps
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, UniqueConstraint
+from django.db.models.constants import LOOKUP_SEP
+
+from django_colors.fields import ColorModelField
+
+
+def get_indexed_fields(model: type[Model]) -> set[str]:
+    """
+    Get the names of the fields leading an index of a model.
+
+    Only the first column of a multi-column index can serve lookups and
+    ordering on its own, so the other columns are not included.
+
+    :argument model: The model to inspect
+    :returns: Set of field names
+    """
+    opts = model._meta
+    indexed = {
+        field.name
+        for field in opts.concrete_fields
+        if field.primary_key or field.unique or field.db_index
+    }
+    indexed.update(
+        index.fields[0].lstrip("-") for index in opts.indexes if index.fields
+    )
+    indexed.update(
+        constraint.fields[0]
+        for constraint in opts.constraints
+        if isinstance(constraint, UniqueConstraint)
+        and constraint.fields
+        and constraint.condition is None
+    )
+    indexed.update(fields[0] for fields in opts.unique_together if fields)
+    return indexed
+
+
+def get_lookup_fields(model: type[Model], lookups: list[str]) -> list[str]:
+    """
+    Get the local, non-relational fields used by filter or ordering lookups.
+
+    Lookups spanning relations are skipped, as foreign keys are indexed by
+    default and related columns belong to other models.
+
+    :argument model: The model the lookups apply to
+    :argument lookups: Filter keys or ordering strings
+    :returns: List of field names, in lookup order without duplicates
+    """
+    names = []
+    for lookup in lookups:
+        name = lookup.lstrip("-").split(LOOKUP_SEP)[0]
+        if name in ("pk", "?") or name in names:
+            continue
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if not field.is_relation and field.concrete:
+            names.append(field.name)
+    return names
+
+
+def check_field_indexes(field: ColorModelField) -> list[checks.CheckMessage]:
+    """
+    Check that the choice model columns a field queries are indexed.
+
+    :argument field: The color field to check
+    :returns: List of warnings, one per unindexed column
+    """
+    try:
+        choice_model = field.field_config.choice_model
+    except Exception:
+        # invalid configurations are reported by check_field_configs
+        return []
+    if not isinstance(choice_model, type) or not issubclass(
+        choice_model, Model
+    ):
+        return []
+    filters = field.field_config.get("choice_filters") or {}
+    ordering = [item for item in field.ordering or () if isinstance(item, str)]
+    indexed = get_indexed_fields(choice_model)
+    return [
+        checks.Warning(
+            f"{field} filters or orders choices from "
+            f"{choice_model._meta.label} by '{name}', which is not indexed.",
+            hint=(
+                f"Add an index on '{name}' to the Meta.indexes of "
+                f"{choice_model._meta.label}, or subclass IndexedColorModel."
+            ),
+            obj=field,
+            id="django_colors.W001",
+        )
+        for name in get_lookup_fields(choice_model, [*filters, *ordering])
+        if name not in indexed
+    ]
+
+
+def check_field_config(field: ColorModelField) -> list[checks.CheckMessage]:
+    """
+    Resolve the configuration of a field, reporting what fails.
+
+    The resolved configuration, choice model and palette are kept on the
+    field, so requests never resolve them again.
+
+    :argument field: The color field to check
+    :returns: List of errors
+    """
+    try:
+        field_config = field.field_config
+    except Exception as error:
+        return [
+            checks.Error(
+                f"{field} has an invalid configuration: {error}",
+                obj=field,
+                id="django_colors.E001",
+            )
+        ]
+    messages = []
+    try:
+        field_config.choice_model  # noqa: B018
+    except ValueError as error:
+        messages.append(
+            checks.Error(
+                str(error),
+                hint="Use 'app_label.ModelName' for the choice model.",
+                obj=field,
+                id="django_colors.E002",
+            )
+        )
+    try:
+        palette = field_config.default_color_choices
+    except ValueError as error:
+        messages.append(
+            checks.Error(
+                str(error),
+                hint=(
+                    "Use a palette registered with register_palette() or "
+                    "the import path of a ColorChoices subclass."
+                ),
+                obj=field,
+                id="django_colors.E003",
+            )
+        )
+    else:
+        # interns and presorts the palette choices for the field type
+        palette.for_field_type(field_config.get("color_type"))
+    return messages
+
+
+def get_color_fields(
+    app_configs: list[AppConfig] | None,
+) -> list[ColorModelField]:
+    """
+    Get the color fields of the models of the checked apps.
+
+    :argument app_configs: The app configs to check, or None for all
+    :returns: List of the color fields
+    """
+    if app_configs is None:
+        models = apps.get_models()
+    else:
+        models = [
+            model
+            for app_config in app_configs
+            for model in app_config.get_models()
+        ]
+    return [
+        field
+        for model in models
+        for field in model._meta.local_fields
+        if isinstance(field, ColorModelField)
+    ]
+
+
+@checks.register(checks.Tags.models)
+def check_field_configs(
+    app_configs: list[AppConfig] | None = None, **kwargs: dict
+) -> list[checks.CheckMessage]:
+    """
+    Resolve the configuration of every color field in one pass.
+
+    Invalid settings, choice model references and palette references are
+    all reported at startup instead of failing the first request that uses
+    the field.
+
+    :argument app_configs: The app configs to check, or None for all
+    :argument kwargs: Additional check arguments
+    :returns: List of errors
+    """
+    messages = []
+    for field in get_color_fields(app_configs):
+        messages.extend(check_field_config(field))
+    return messages
+
+
+@checks.register(checks.Tags.models)
+def check_choice_model_indexes(
+    app_configs: list[AppConfig] | None = None, **kwargs: dict
+) -> list[checks.CheckMessage]:
+    """
+    Warn about unindexed choice model columns used by color fields.
+
+    :argument app_configs: The app configs to check, or None for all
+    :argument kwargs: Additional check arguments
+    :returns: List of warnings
+    """
+    messages = []
+    for field in get_color_fields(app_configs):
+        messages.extend(check_field_indexes(field))
+    return messages
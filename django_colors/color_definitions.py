@@ -2,12 +2,37 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from operator import itemgetter
+from types import MappingProxyType
 
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from django_colors.field_type import FieldType
 
+SORT_BY_INDEX = {"value": 0, "label": 1}
+
+
+def choice_sort_key(
+    sort_by: str, ignore_case: bool = True
+) -> Callable[[tuple[str, str]], str]:
+    """
+    Get the key function used to sort (value, label) choices.
+
+    :argument sort_by: Sort key ("value" or "label")
+    :argument ignore_case: Whether to ignore case when sorting
+    :returns: The key function for sort() and sorted()
+    """
+    getter = itemgetter(SORT_BY_INDEX[sort_by])
+    if ignore_case:
+        return lambda choice: getter(choice).casefold()
+    return getter
+
 
 @dataclass(frozen=True, slots=True)
 class ColorOption:
@@ -43,6 +68,11 @@ class ColorChoices:
     """
     Choices for various colors.
 
+    The options of every subclass are compiled once, when the subclass is
+    defined, into a read-only value map and a tuple of choices per
+    FieldType. Instances using the class options share the compiled data,
+    and for_field_type() returns one shared instance per FieldType.
+
     Attributes:
         _value_map: Internal mapping of color values to ColorOption instances
         field_type: The field type to use for value selection
@@ -53,14 +83,102 @@ class ColorChoices:
     )
     field_type: FieldType = field(default=FieldType.BACKGROUND)
 
+    def __init_subclass__(cls) -> None:
+        """
+        Compile the palette of a subclass when it is defined.
+
+        No zero-argument super() here: slots dataclasses are recreated by the
+        decorator, which breaks the implicit __class__ cell.
+
+        :returns: None
+        """
+        cls._compile_palette()
+
+    @classmethod
+    def _compile_palette(cls) -> None:
+        """
+        Compile the options of the class into shared, read-only data.
+
+        Options are collected from class attributes and from dataclass field
+        defaults (slots dataclasses replace the class attributes with slot
+        descriptors), following the definition order.
+
+        :returns: None
+        """
+        options: dict[str, ColorOption] = {}
+        for klass in reversed(cls.__mro__):
+            class_vars = vars(klass)
+            for name, dataclass_field in class_vars.get(
+                "__dataclass_fields__", {}
+            ).items():
+                if isinstance(dataclass_field.default, ColorOption):
+                    options[name] = dataclass_field.default
+            for name, attr in class_vars.items():
+                if isinstance(attr, ColorOption):
+                    options[name] = attr
+        value_map = {option.value: option for option in options.values()}
+        cls._class_options = tuple(options.items())
+        cls._class_value_map = MappingProxyType(value_map)
+        cls._class_choices = {
+            field_type: tuple(
+                option.instance_choices(field_type)
+                for option in value_map.values()
+            )
+            for field_type in FieldType
+        }
+        cls._class_values = {
+            field_type: frozenset(value for value, _ in choices)
+            for field_type, choices in cls._class_choices.items()
+        }
+        cls._class_choice_options = {
+            field_type: MappingProxyType(
+                {
+                    getattr(option, field_type.value): option
+                    for option in value_map.values()
+                }
+            )
+            for field_type in FieldType
+        }
+        cls._interned = {}
+        cls._sorted_choices = {}
+
+    @classmethod
+    def for_field_type(
+        cls, field_type: FieldType = FieldType.BACKGROUND
+    ) -> ColorChoices:
+        """
+        Get the shared instance of the class for a field type.
+
+        :argument field_type: The field type to use for value selection
+        :returns: The interned instance for the class and field type
+        """
+        try:
+            return cls._interned[field_type]
+        except KeyError:
+            instance = cls(field_type=field_type)
+            # presort the shared choices for every sort option up front
+            for sort_by in SORT_BY_INDEX:
+                for ignore_case in (True, False):
+                    instance.sorted_choices(sort_by, ignore_case)
+            return cls._interned.setdefault(field_type, instance)
+
     def __post_init__(self) -> None:
         """
-        Create dict of ColorOptions using slots to avoid additional iterations.
+        Set the map of ColorOptions for the instance.
+
+        Instances using the class options share the compiled map; a new map
+        is only built when options are overridden on the instance.
 
         :returns: None
         """
-        for color in self.__slots__:
-            option = getattr(self, color)
+        if all(
+            getattr(self, name, None) is option
+            for name, option in self._class_options
+        ):
+            object.__setattr__(self, "_value_map", self._class_value_map)
+            return
+        for name, _option in self._class_options:
+            option = getattr(self, name, None)
             if isinstance(option, ColorOption):
                 self.get_options_dict[option.value] = option
 
@@ -69,6 +187,8 @@ class ColorChoices:
         """
         Get the options in a dict.
 
+        The dict is read-only when shared with the class.
+
         :returns: Dictionary mapping color values to ColorOption instances
         """
         return self._value_map
@@ -104,10 +224,102 @@ class ColorChoices:
 
         :returns: A list of (value, label) tuples used in Django choice fields
         """
-        return [
+        return list(self.frozen_choices)
+
+    @property
+    def frozen_choices(self) -> tuple[tuple[str, str], ...]:
+        """
+        Get the choices as an immutable tuple.
+
+        Shared instances return the tuple compiled with the class, without
+        building anything.
+
+        :returns: A tuple of (value, label) tuples
+        """
+        if self._value_map is self._class_value_map:
+            return self._class_choices[self.field_type]
+        return tuple(
             color.instance_choices(self.field_type)
             for color in self.get_options_dict.values()
-        ]
+        )
+
+    @property
+    def choice_values(self) -> frozenset[str]:
+        """
+        Get the set of choice values for membership checks.
+
+        :returns: Frozenset of the values used for the field type
+        """
+        if self._value_map is self._class_value_map:
+            return self._class_values[self.field_type]
+        return frozenset(value for value, _ in self.frozen_choices)
+
+    @property
+    def choice_options(self) -> MappingProxyType[str, ColorOption]:
+        """
+        Get the options keyed by their choice value for the field type.
+
+        Shared instances return the read-only map compiled with the class.
+
+        :returns: Mapping of choice values to ColorOption instances
+        """
+        if self._value_map is self._class_value_map:
+            return self._class_choice_options[self.field_type]
+        return MappingProxyType(
+            {
+                getattr(option, self.field_type.value): option
+                for option in self.get_options_dict.values()
+            }
+        )
+
+    def get_by_choice_value(self, value: str) -> ColorOption | None:
+        """
+        Get the ColorOption stored as the given choice value.
+
+        :argument value: The choice value, such as "bg-primary"
+        :returns: The ColorOption instance if found, None otherwise
+        """
+        return self.choice_options.get(value)
+
+    def sorted_choices(
+        self, sort_by: str | None, ignore_case: bool = True
+    ) -> tuple[tuple[str, str], ...]:
+        """
+        Get the choices sorted by value or label as an immutable tuple.
+
+        The sorted choices of instances sharing the class options are
+        computed once per (field_type, sort_by, ignore_case) and stored with
+        the class. Lazy labels sort in the active language, so label sorts
+        are stored per language too.
+
+        :argument sort_by: Sort key ("value" or "label"), None to keep the
+            definition order
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: A tuple of (value, label) tuples
+        """
+        if sort_by not in SORT_BY_INDEX:
+            return self.frozen_choices
+        if self._value_map is not self._class_value_map:
+            return tuple(
+                sorted(
+                    self.frozen_choices,
+                    key=choice_sort_key(sort_by, ignore_case),
+                )
+            )
+        language = get_language() if sort_by == "label" else None
+        key = (self.field_type, sort_by, ignore_case, language)
+        try:
+            return self._sorted_choices[key]
+        except KeyError:
+            return self._sorted_choices.setdefault(
+                key,
+                tuple(
+                    sorted(
+                        self.frozen_choices,
+                        key=choice_sort_key(sort_by, ignore_case),
+                    )
+                ),
+            )
 
     def __iter__(self) -> iter:
         """
@@ -118,6 +330,207 @@ class ColorChoices:
         return iter(self.get_options_dict.values())
 
 
+ColorChoices._compile_palette()
+
+
+COLUMNS = ("value", "label", "background_css", "text_css")
+
+
+def intern_value(value: object) -> object:
+    """
+    Intern a string so equal strings share one object.
+
+    Lazy translations and other non-string values are returned unchanged.
+
+    :argument value: The value to intern
+    :returns: The interned string or the value itself
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class CompactOptions(Mapping):
+    """
+    Read-only map of a compact palette, keyed by one of its columns.
+
+    Only an index of row numbers is stored. Each ColorOption is created
+    from the palette columns when it is accessed and is not kept.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(
+        self, columns: tuple[tuple[str, ...], ...], index: dict[str, int]
+    ) -> None:
+        """
+        Initialize the map.
+
+        :argument columns: The value, label, background_css and text_css
+            columns of the palette
+        :argument index: Mapping of keys to row numbers
+        :returns: None
+        """
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> ColorOption:
+        """
+        Get the option of a key.
+
+        :argument key: The key to look up
+        :returns: A new ColorOption for the row
+        :raises KeyError: If the key is not in the palette
+        """
+        row = self._index[key]
+        return ColorOption(*(column[row] for column in self._columns))
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the keys in palette order.
+
+        :returns: Iterator over the keys
+        """
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """
+        Get the number of keys.
+
+        :returns: The number of keys
+        """
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check if a key is in the palette without creating an option.
+
+        :argument key: The key to check
+        :returns: True if the key is in the palette
+        """
+        return key in self._index
+
+
+class FieldTypeData(dict):
+    """Dict of per-FieldType palette data, computed on first access."""
+
+    def __init__(self, factory: Callable[[FieldType], object]) -> None:
+        """
+        Initialize the dict with the function computing missing entries.
+
+        :argument factory: Function computing the data of a field type
+        :returns: None
+        """
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, field_type: FieldType) -> object:
+        """
+        Compute and store the data of a field type.
+
+        :argument field_type: The field type
+        :returns: The computed data
+        """
+        return self.setdefault(field_type, self.factory(field_type))
+
+
+@dataclass(frozen=True, slots=True)
+class CompactColorChoices(ColorChoices):
+    """
+    Palette stored as parallel columns of interned strings.
+
+    Built with from_options() for generated palettes with thousands of
+    colors. Instead of one ColorOption per color, the palette keeps one
+    tuple per column and a dict of row numbers per lookup key, and creates
+    ColorOptions only when they are accessed. The choices of each
+    FieldType are built the first time the field type is used. The API is
+    the same as ColorChoices.
+    """
+
+    _columns = ((), (), (), ())
+
+    @classmethod
+    def from_options(
+        cls,
+        name: str,
+        options: Iterable[ColorOption | tuple[str, str, str, str]],
+    ) -> type[CompactColorChoices]:
+        """
+        Create a compact palette class from options.
+
+        Options sharing a value are merged like ColorChoices class
+        attributes: the last one wins and keeps the first one's position.
+        The class can't be imported by name, so it gets a content_digest of
+        its options to identify it in shared cache keys instead.
+
+        :argument name: The name of the palette class
+        :argument options: ColorOptions or (value, label, background_css,
+            text_css) tuples
+        :returns: The new palette class
+        """
+        rows = {}
+        for option in options:
+            if isinstance(option, ColorOption):
+                option = tuple(getattr(option, column) for column in COLUMNS)
+            rows[option[0]] = tuple(intern_value(item) for item in option)
+        columns = tuple(zip(*rows.values(), strict=True)) or cls._columns
+        content = json.dumps(columns, default=str).encode()
+        return type(
+            name,
+            (cls,),
+            {
+                "__slots__": (),
+                "__module__": cls.__module__,
+                "_columns": columns,
+                "content_digest": hashlib.sha256(content).hexdigest(),
+            },
+        )
+
+    @classmethod
+    def _compile_palette(cls) -> None:
+        """
+        Set up the lazily computed palette data of the class.
+
+        :returns: None
+        """
+        columns = cls._columns
+        cls._class_options = ()
+        cls._class_value_map = CompactOptions(
+            columns, {value: row for row, value in enumerate(columns[0])}
+        )
+        cls._class_choice_options = FieldTypeData(cls._build_choice_options)
+        cls._class_choices = FieldTypeData(cls._build_choices)
+        cls._class_values = FieldTypeData(
+            lambda field_type: frozenset(cls._class_choice_options[field_type])
+        )
+        cls._interned = {}
+        cls._sorted_choices = {}
+
+    @classmethod
+    def _build_choice_options(cls, field_type: FieldType) -> CompactOptions:
+        """
+        Build the options map keyed by the choice values of a field type.
+
+        :argument field_type: The field type
+        :returns: The options map
+        """
+        keys = cls._columns[COLUMNS.index(field_type.value)]
+        return CompactOptions(
+            cls._columns, {key: row for row, key in enumerate(keys)}
+        )
+
+    @classmethod
+    def _build_choices(cls, field_type: FieldType) -> tuple[tuple, ...]:
+        """
+        Build the (value, label) choices of a field type.
+
+        :argument field_type: The field type
+        :returns: A tuple of (value, label) tuples
+        """
+        keys = cls._columns[COLUMNS.index(field_type.value)]
+        return tuple(zip(keys, cls._columns[1], strict=True))
+
+
 @dataclass(frozen=True, slots=True)
 class BootstrapColorChoices(ColorChoices):
     """
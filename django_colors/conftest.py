@@ -1,9 +1,10 @@
 """Pytest setup for color tests."""
 
+from collections.abc import Callable, Iterator
 from unittest.mock import MagicMock
 
 import pytest
-from django.db import models
+from django.db import connection, models
 
 from django_colors.color_definitions import (
     BootstrapColorChoices,
@@ -12,6 +13,7 @@ from django_colors.color_definitions import (
 )
 from django_colors.field_type import FieldType
 from django_colors.models import ColorModel
+from django_colors.tests.models import Palette, Thing
 
 
 class MockModel(models.Model):
@@ -108,6 +110,13 @@ def mock_field_config() -> type:
         "only_use_custom_colors": False,
         "layout": "defaults_first",
         "ordering": (),
+        "cache_choices": False,
+        "cache_alias": None,
+        "cache_timeout": 300,
+        "validate_choices": False,
+        "sort_in_database": False,
+        "search_index": False,
+        "autocomplete": False,
     }[key]
     return mocked_field_config
 
@@ -120,3 +129,51 @@ def color_model() -> type:
     :return: A concrete ColorModel subclass
     """
     return ConcreteColorModel
+
+
+@pytest.fixture
+def color_model_table(transactional_db: pytest.fixture) -> type:
+    """
+    Create the database table of the concrete ColorModel for a test.
+
+    :param transactional_db: The pytest-django transactional_db fixture
+    :return: The concrete ColorModel subclass
+    """
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(ConcreteColorModel)
+    yield ConcreteColorModel
+    with connection.schema_editor() as schema_editor:
+        schema_editor.delete_model(ConcreteColorModel)
+
+
+@pytest.fixture
+def palette_tables(
+    transactional_db: pytest.fixture,
+) -> Iterator[Callable[..., None]]:
+    """
+    Create the tables of the shared Palette and Thing models for a test.
+
+    The fixture returns a function creating the tables and the palette
+    rows given as (name, background_css, text_css) tuples. The tables are
+    dropped when the test ends.
+
+    :param transactional_db: The pytest-django transactional_db fixture
+    :return: Function creating the tables
+    """
+    created = []
+
+    def create_tables(*palette_rows: tuple[str, str, str]) -> None:
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(Palette)
+            schema_editor.create_model(Thing)
+        created.append(True)
+        for name, background_css, text_css in palette_rows:
+            Palette.objects.create(
+                name=name, background_css=background_css, text_css=text_css
+            )
+
+    yield create_tables
+    if created:
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(Thing)
+            schema_editor.delete_model(Palette)
@@ -0,0 +1,154 @@
+"""Database expressions for color fields."""
+
+from __future__ import annotations
+
+from django.db.models import (
+    Case,
+    CharField,
+    Expression,
+    F,
+    Model,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Coalesce
+from django.db.models.sql.query import Query
+
+from django_colors.fields import ColorModelField
+
+
+def get_color_field(model: type[Model], field_path: str) -> ColorModelField:
+    """
+    Get a color field from a field path, following relations.
+
+    :argument model: The model the path starts from
+    :argument field_path: The field name, such as "color" or "owner__color"
+    :returns: The color field
+    :raises ValueError: If the path does not end with a ColorModelField
+    """
+    *relations, field_name = field_path.split(LOOKUP_SEP)
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field = model._meta.get_field(field_name)
+    if not isinstance(field, ColorModelField):
+        raise ValueError(f"'{field_path}' is not a ColorModelField.")
+    return field
+
+
+def get_label_expression(
+    field: ColorModelField,
+    field_path: str,
+    default: Expression | F | str | None = None,
+) -> Expression:
+    """
+    Build the expression computing the label of a color field's value.
+
+    Default colors are matched by a CASE over the palette, and the other
+    values by a subquery against the choice model, like
+    get_<field>_option().
+
+    :argument field: The color field
+    :argument field_path: The path of the field from the queried model
+    :argument default: Label for values that are not a known color
+    :returns: The label expression
+    """
+    if field.choices is not None:
+        labels = [(value, label) for value, label in field.flatchoices]
+    else:
+        labels = [
+            (value, option.label)
+            for value, option in field.get_palette_options().items()
+        ]
+    expressions = []
+    if labels:
+        expressions.append(
+            Case(
+                *(
+                    When(**{field_path: value}, then=Value(str(label)))
+                    for value, label in labels
+                ),
+                output_field=CharField(),
+            )
+        )
+    choice_model = field.field_config.choice_model
+    if field.choices is None and choice_model:
+        column = field.field_config.get("color_type").value
+        expressions.append(
+            Subquery(
+                choice_model.objects.filter(**{column: OuterRef(field_path)})
+                .order_by("pk")
+                .values("name")[:1],
+                output_field=CharField(),
+            )
+        )
+    if default is not None:
+        expressions.append(
+            default
+            if hasattr(default, "resolve_expression")
+            else Value(default)
+        )
+    if not expressions:
+        return Value(None, output_field=CharField())
+    if len(expressions) == 1:
+        return expressions[0]
+    return Coalesce(*expressions, output_field=CharField())
+
+
+class ColorLabel(Expression):
+    """
+    Label of the value of a color field, computed in the database.
+
+    For annotations and values() exports without loading instances:
+
+        Thing.objects.annotate(label=ColorLabel("background_color"))
+    """
+
+    def __init__(
+        self, field_path: str, default: Expression | F | str | None = None
+    ) -> None:
+        """
+        Initialize the expression.
+
+        :argument field_path: The color field name, relations may be
+            followed with "__"
+        :argument default: Label for values that are not a known color,
+            NULL when not set
+        :returns: None
+        """
+        super().__init__(output_field=CharField())
+        self.field_path = field_path
+        self.default = default
+
+    def __repr__(self) -> str:
+        """
+        Get the representation of the expression.
+
+        :returns: The representation
+        """
+        return f"{self.__class__.__name__}({self.field_path!r})"
+
+    def resolve_expression(
+        self,
+        query: Query | None = None,
+        allow_joins: bool = True,
+        reuse: set | None = None,
+        summarize: bool = False,
+        for_save: bool = False,
+    ) -> Expression:
+        """
+        Resolve into the label expression of the queried model's field.
+
+        :argument query: The query the expression is used in
+        :argument allow_joins: Whether joins are allowed
+        :argument reuse: Reusable table aliases
+        :argument summarize: Whether the expression is an aggregate summary
+        :argument for_save: Whether the expression is used in a save
+        :returns: The resolved expression
+        """
+        field = get_color_field(query.model, self.field_path)
+        return get_label_expression(
+            field, self.field_path, self.default
+        ).resolve_expression(query, allow_joins, reuse, summarize, for_save)
@@ -1,19 +1,50 @@
 """Provides custom field types for color selection in Django models."""
 
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator, Mapping
+from functools import partialmethod
 from typing import Any
+from weakref import WeakSet
 
+from django.core.exceptions import ValidationError
+from django.db.models import F, OrderBy, Q, QuerySet
 from django.db.models.base import Model
 from django.db.models.fields import CharField
-from django.forms import ChoiceField
+from django.db.models.functions import Lower
 from django.utils.choices import BlankChoiceIterator
 from django.utils.translation import gettext as _
 
 from django_colors import settings as color_settings
-from django_colors.color_definitions import ColorChoices
+from django_colors.cache import (
+    ChoicesCache,
+    SharedChoicesCache,
+    get_request_choices,
+    make_key,
+)
+from django_colors.cache import choices_cache as local_choices_cache
+from django_colors.color_definitions import (
+    SORT_BY_INDEX,
+    ColorChoices,
+    ColorOption,
+    choice_sort_key,
+)
 from django_colors.field_type import FieldType
-from django_colors.widgets import ColorChoiceWidget
+from django_colors.forms import ColorAutocompleteField, ColorChoiceField
+from django_colors.search import (
+    ChoiceSearchIndex,
+    search_indexes,
+    search_match,
+)
+from django_colors.widgets import ColorAutocompleteWidget, ColorChoiceWidget
 
 BLANK_CHOICE_DASH = "---------"
+FIELD_TYPE_COLUMNS = tuple(field_type.value for field_type in FieldType)
+OPTION_CACHE_ATTR = "_color_option_cache"
+DEFAULT_CHUNK_SIZE = 2000
+
+# every color field attached to a model, to reset when the settings change
+color_fields: WeakSet["ColorModelField"] = WeakSet()
 
 
 def combine_choices(
@@ -32,6 +63,124 @@ def combine_choices(
     return combined_choices
 
 
+def merge_choices(
+    default_choices: list,
+    queryset_choices: list,
+    sort_by: str,
+    ignore_case: bool = True,
+) -> list:
+    """
+    Merge two sorted lists of choices into one sorted list in linear time.
+
+    Both lists should be sorted with the same sort options. Choices with
+    equal sort keys keep the default choices first, the same order a stable
+    sort of the combined list gives. Model options sorted by the database
+    keep their database order, and each default choice comes before the
+    first option that sorts after it in python.
+
+    :argument default_choices: Sorted list of default color choices
+    :argument queryset_choices: Sorted list of model color options
+    :argument sort_by: Sort key ("value" or "label")
+    :argument ignore_case: Whether to ignore case when sorting
+    :returns: Merged list of choices
+    """
+    return list(
+        heapq.merge(
+            default_choices,
+            queryset_choices,
+            key=choice_sort_key(sort_by, ignore_case),
+        )
+    )
+
+
+def get_search_filter(
+    color_type: FieldType,
+    query: str,
+    prefix: bool = False,
+    ignore_case: bool = True,
+) -> Q:
+    """
+    Get the queryset filter matching a search query on a choice model.
+
+    :argument color_type: The color type of the field
+    :argument query: The text to search for
+    :argument prefix: Whether to match the start of the text only
+    :argument ignore_case: Whether to ignore case
+    :returns: Q object matching the css column or the name
+    """
+    lookup = "startswith" if prefix else "contains"
+    if ignore_case:
+        lookup = f"i{lookup}"
+    return Q(**{f"{color_type.value}__{lookup}": query}) | Q(
+        **{f"name__{lookup}": query}
+    )
+
+
+def get_custom_options(
+    choice_model: type[Model], lookups: dict[str, set[str]]
+) -> dict[tuple[str, str], ColorOption]:
+    """
+    Get the ColorOptions of custom colors with a single query.
+
+    :argument choice_model: The model providing the custom colors
+    :argument lookups: The values to look up, keyed by css column
+    :returns: Dict mapping (css column, value) to the ColorOption of the
+        first matching row
+    """
+    query = Q()
+    for column, values in lookups.items():
+        query |= Q(**{f"{column}__in": sorted(values)})
+    options = {}
+    for row in (
+        choice_model.objects.filter(query)
+        .order_by("pk")
+        .values("name", *FIELD_TYPE_COLUMNS)
+    ):
+        for column, values in lookups.items():
+            value = row[column]
+            if value in values:
+                options.setdefault(
+                    (column, value),
+                    ColorOption(
+                        value=value,
+                        label=row["name"],
+                        background_css=row["background_css"],
+                        text_css=row["text_css"],
+                    ),
+                )
+    return options
+
+
+def get_field_option(
+    instance: Model, field: "ColorModelField"
+) -> ColorOption | None:
+    """
+    Get the ColorOption of a color field, bound as get_<field>_option().
+
+    :argument instance: The model instance
+    :argument field: The color field
+    :returns: The ColorOption or None if the value is not a known color
+    """
+    return field.get_option(instance)
+
+
+def get_sort_expression(
+    color_type: FieldType, sort_by: str, ignore_case: bool = True
+) -> OrderBy:
+    """
+    Get the database ordering matching sort_choices for a choice model.
+
+    :argument color_type: The field type used for the choice values
+    :argument sort_by: Sort key ("value" or "label")
+    :argument ignore_case: Whether to ignore case when sorting
+    :returns: The ordering expression for QuerySet.order_by()
+    """
+    column = color_type.value if sort_by == "value" else "name"
+    if ignore_case:
+        return Lower(column).asc()
+    return F(column).asc()
+
+
 def sort_choices(
     choices: list,
     sort_by: str | None = None,
@@ -43,24 +192,27 @@ def sort_choices(
     :argument choices: List of color choices
     :returns: Sorted list of choices
     """
-    if ignore_case:
-        if sort_by == "value":
-            # sort by the value (first item in tuple)
-            choices.sort(key=lambda x: x[0].casefold())
-        if sort_by == "label":
-            # sort by the label (second item in tuple)
-            choices.sort(key=lambda x: x[1].casefold())
-    else:
-        if sort_by == "value":
-            # sort by the value (first item in tuple)
-            choices.sort(key=lambda x: x[0])
-        if sort_by == "label":
-            # sort by the label (second item in tuple)
-            choices.sort(key=lambda x: x[1])
-
+    if sort_by in SORT_BY_INDEX:
+        # sort by the value or the label (first or second item in tuple)
+        choices.sort(key=choice_sort_key(sort_by, ignore_case))
     return choices
 
 
+def reset_field_configs() -> None:
+    """
+    Drop the resolved configuration of every color field.
+
+    The choices cached in this process and the search indexes were built
+    with the old configurations, so they are dropped too.
+
+    :returns: None
+    """
+    for color_field in list(color_fields):
+        color_field.field_config = None
+    local_choices_cache.clear()
+    search_indexes.clear()
+
+
 class ColorModelField(CharField):
     """
     Custom field for selecting colors.
@@ -76,6 +228,7 @@ class ColorModelField(CharField):
     only_use_custom_colors: bool | None
     ordering: tuple | None
     layout: str | None
+    validate_choices: bool | None
     description = _("String for use with css (up to %(max_length)s)")
 
     def __init__(
@@ -87,6 +240,7 @@ class ColorModelField(CharField):
         only_use_custom_colors: bool | None = None,
         ordering: tuple | None = None,
         layout: str | None = None,
+        validate_choices: bool | None = None,
         *args: tuple,
         **kwargs: dict,
     ) -> None:
@@ -101,6 +255,8 @@ class ColorModelField(CharField):
         :argument ordering: Database ordering for custom model choices
         :argument layout: Default choices placement
             ('start', 'end')
+        :argument validate_choices: Whether model validation checks that the
+            value is one of the field's choices
         :returns: None
         :raises Exception: If only_use_custom_colors is True but no model or
             queryset is provided
@@ -112,6 +268,7 @@ class ColorModelField(CharField):
         self.only_use_custom_colors = only_use_custom_colors
         self.ordering = ordering
         self.layout = layout
+        self.validate_choices = validate_choices
 
         # Note: We can't validate the model reference here if it's a string
         # because apps might not be loaded yet. The validation will happen
@@ -141,9 +298,8 @@ class ColorModelField(CharField):
 
         :returns: Dictionary containing the field configuration
         """
-        return color_settings.get_config().get(
-            self.app_name, color_settings.get_config().get(_("default"))
-        )
+        config = color_settings.get_config()
+        return config.get(self.app_name, config.get(_("default")))
 
     def contribute_to_class(
         self, cls: type[Model], name: str, private_only: bool = False
@@ -153,6 +309,12 @@ class ColorModelField(CharField):
 
         We add model_name and app_name to the field instance for later use.
 
+        The field configuration is resolved on first access to
+        field_config rather than here, so importing models and building the
+        historical models of migrations never resolves it. Historical
+        models (from the "__fake__" module) have no custom methods, so they
+        don't get the get_<name>_option method either.
+
         :argument cls: The model class the field is being added to
         :argument name: The name of the field
         :argument private_only: Whether the field is private
@@ -160,8 +322,48 @@ class ColorModelField(CharField):
         """
         self.model_name = cls.__name__
         self.app_name = cls._meta.app_label
-        self.field_config = color_settings.FieldConfig(cls, self, name)
-        return super().contribute_to_class(cls, name, private_only)
+        self._field_config = None
+        super().contribute_to_class(cls, name, private_only)
+        if cls.__module__ == "__fake__":
+            return
+        color_fields.add(self)
+        if f"get_{self.name}_option" not in cls.__dict__:
+            setattr(
+                cls,
+                f"get_{self.name}_option",
+                partialmethod(get_field_option, field=self),
+            )
+
+    @property
+    def field_config(self) -> color_settings.FieldConfig:
+        """
+        Get the configuration of the field, resolving it on first access.
+
+        :returns: The resolved field configuration
+        :raises AttributeError: If the field is not attached to a model
+        """
+        field_config = self.__dict__.get("_field_config")
+        if field_config is None:
+            if not hasattr(self, "model"):
+                raise AttributeError(
+                    "The configuration of a color field is only available "
+                    "once the field is attached to a model."
+                )
+            field_config = color_settings.FieldConfig(
+                self.model, self, self.name
+            )
+            self._field_config = field_config
+        return field_config
+
+    @field_config.setter
+    def field_config(self, value: color_settings.FieldConfig) -> None:
+        """
+        Set the configuration of the field.
+
+        :argument value: The field configuration
+        :returns: None
+        """
+        self._field_config = value
 
     @property
     def non_db_attrs(self) -> tuple[str, ...]:
@@ -178,6 +380,7 @@ class ColorModelField(CharField):
             "only_use_custom_colors",
             "ordering",
             "layout",
+            "validate_choices",
         )
 
     def deconstruct(self) -> tuple[str, str, list[object], dict[str, Any]]:
@@ -197,15 +400,107 @@ class ColorModelField(CharField):
             kwargs["only_use_custom_colors"] = self.only_use_custom_colors
         return name, path, args, kwargs
 
-    def formfield(self, **kwargs: dict) -> ChoiceField:
+    def validate(self, value: str, model_instance: Model | None) -> None:
         """
-        Create a forms.ChoiceField with a custom widget and choices.
+        Validate the value and, if enabled, check it is a valid choice.
+
+        :argument value: The value to validate
+        :argument model_instance: The model instance being validated
+        :returns: None
+        :raises ValidationError: If the value is not one of the choices
+        """
+        super().validate(value, model_instance)
+        if (
+            self.choices is None
+            and self.field_config.get("validate_choices")
+            and value not in self.empty_values
+            and self.get_invalid_values({value})
+        ):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+    def validate_many(self, values: Iterable[str]) -> list[tuple[int, str]]:
+        """
+        Check a batch of values against the field's choices.
+
+        The default colors are checked with set lookups and the remaining
+        distinct values with a single query against the choice model, so a
+        large import can be validated without building the choices.
+
+        :argument values: The values to check
+        :returns: List of (position, value) tuples for the invalid values
+        """
+        values = list(values)
+        candidates = {
+            value
+            for value in values
+            if not (self.blank and value in self.empty_values)
+        }
+        invalid_values = self.get_invalid_values(candidates)
+        return [
+            (position, value)
+            for position, value in enumerate(values)
+            if value in invalid_values
+        ]
+
+    def get_invalid_values(self, values: set[str]) -> set[str]:
+        """
+        Get the values that are not one of the field's choices.
+
+        Uses the field's configured filters, like get_choices with its
+        default arguments.
+
+        :argument values: The distinct values to check
+        :returns: Set of the invalid values
+        """
+        color_type = self.field_config.get("color_type")
+        if self.field_config.get("only_use_custom_colors"):
+            invalid_values = set(values)
+        else:
+            palette = self.field_config.default_color_choices.for_field_type(
+                color_type
+            )
+            invalid_values = set(values) - palette.choice_values
+        choice_model = self.field_config.choice_model
+        if invalid_values and choice_model:
+            filters = self.field_config.get("choice_filters") or {}
+            invalid_values.difference_update(
+                choice_model.objects.filter(
+                    **filters,
+                    **{f"{color_type.value}__in": sorted(invalid_values)},
+                ).values_list(color_type.value, flat=True)
+            )
+        return invalid_values
+
+    def formfield(self, **kwargs: dict) -> ColorChoiceField:
+        """
+        Create a ColorChoiceField with a custom widget and choices.
+
+        The choices are built once per form and validated with a set lookup.
+        When a ColorAutocompleteWidget is requested (for example in the
+        widgets of a ModelForm), a ColorAutocompleteField is returned
+        instead, which never builds the choices.
 
         :argument kwargs: Additional arguments for the form field
-        :returns: ChoiceField instance with appropriate widget and choices
+        :returns: ColorChoiceField instance with appropriate widget and
+            choices
         """
+        widget = kwargs.get("widget")
+        if self.choices is None and (
+            isinstance(widget, ColorAutocompleteWidget)
+            or (
+                isinstance(widget, type)
+                and issubclass(widget, ColorAutocompleteWidget)
+            )
+        ):
+            return ColorAutocompleteField(
+                model_field=self, choices=self.get_choices, **kwargs
+            )
         kwargs["widget"] = ColorChoiceWidget
-        return ChoiceField(choices=self.get_choices, **kwargs)
+        return ColorChoiceField(choices=self.get_choices, **kwargs)
 
     def get_choices(
         self,
@@ -249,62 +544,666 @@ class ColorModelField(CharField):
         default_color_choices = self.field_config.default_color_choices
         color_type = self.field_config.get("color_type")
 
-        # default choices
-        default_choices = list(default_color_choices(color_type).choices)
-
         # Use the resolved choice_model
         resolved_choice_model = self.field_config.choice_model
-        if not resolved_choice_model or only_use_default_colors:
-            # return the default choices if no model is set
-            if sort_by:
-                final_choices = sort_choices(
-                    default_choices, sort_by, ignore_case
-                )
-            else:
-                final_choices = default_choices
-        else:
-            # get the queryset, filter/sort/etc.
-            # get the filters (most narrow scope to least narrow scope)
+        if only_use_default_colors:
+            resolved_choice_model = None
+
+        # get the filters (most narrow scope to least narrow scope)
+        filters = additional_filters or self.field_config.get("choice_filters")
+        # check for model form priority and return all options if set
+        if model_priority:
+            filters = {}
+
+        request_choices = get_request_choices()
+        choices_cache = self.get_choices_cache()
+        cache_key = None
+        if request_choices is not None or choices_cache is not None:
+            cache_key = make_key(
+                resolved_choice_model,
+                default_color_choices,
+                color_type,
+                self.field_config.get("only_use_custom_colors"),
+                self.field_config.get("sort_in_database"),
+                filters,
+                ordering,
+                layout,
+                sort_by,
+                ignore_case,
+                include_blank,
+                blank_choice,
+            )
+        if cache_key is None:
+            # nothing can be cached, build the choices every time
+            request_choices = choices_cache = None
+        cached_choices, version = self._get_cached_choices(
+            request_choices, choices_cache, resolved_choice_model, cache_key
+        )
+        if cached_choices is not None:
+            return list(cached_choices)
+
+        final_choices = self._build_choices(
+            default_color_choices,
+            color_type,
+            resolved_choice_model,
+            filters,
+            ignore_case,
+            ordering,
+            layout,
+            sort_by,
+        )
+        if include_blank:
+            final_choices.insert(0, ("", blank_choice))
+        self._set_cached_choices(
+            request_choices,
+            choices_cache,
+            resolved_choice_model,
+            cache_key,
+            final_choices,
+            version,
+        )
+        return final_choices
+
+    def iter_choices(
+        self,
+        additional_filters: dict | None = None,
+        model_priority: bool = False,
+        only_use_default_colors: bool = False,
+        ignore_case: bool = True,
+        include_blank: bool = False,
+        blank_choice: str = BLANK_CHOICE_DASH,
+        ordering: tuple | None = None,
+        layout: str | None = None,
+        sort_by: str | None = "label",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Lazily iterate over the choices for the field.
+
+        Yields the same (value, label) pairs in the same layout order as
+        get_choices, but the custom choices are streamed from the database
+        with QuerySet.iterator(), so only one chunk of rows is held in
+        memory at a time. The custom choices are sorted in the database, so
+        their order follows the database collation, like get_choices with
+        sort_in_database. The mixed layout merges the streamed rows with the
+        presorted default choices as they arrive. The choices are never
+        cached.
+
+        :argument additional_filters: Additional filters for model queryset
+        :argument model_priority: Prioritize model choices (ignores filters)
+        :argument only_use_default_colors: Whether to use only default colors
+        :argument ignore_case: Whether to ignore case when sorting
+        :argument include_blank: Whether to include a blank choice option
+        :argument blank_choice: Blank choice label
+        :argument ordering: Database ordering for custom model choices
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument chunk_size: Number of rows fetched from the database at a
+            time
+        :returns: Iterator of (value, label) tuples
+        :raises ValueError: If the layout, sort_by or chunk_size is invalid
+        """
+        ordering, layout = self._resolve_choice_parameters(ordering, layout)
+        self._validate_parameters(layout, sort_by)
+        if chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be a positive integer, got {chunk_size}"
+            )
+
+        if self.choices is not None:
+            return iter(
+                self._handle_predefined_choices(include_blank, blank_choice)
+            )
+
+        color_type = self.field_config.get("color_type")
+        choice_model = self.field_config.choice_model
+        if only_use_default_colors:
+            choice_model = None
+        queryset = None
+        if choice_model:
             filters = additional_filters or self.field_config.get(
                 "choice_filters"
             )
-
-            # check for model form priority and return all options if set
             if model_priority:
                 filters = {}
+            queryset = self.get_choice_queryset(
+                choice_model,
+                color_type,
+                filters,
+                ordering,
+                sort_by,
+                ignore_case,
+            )
+        return self._iter_choices(
+            self._get_default_choices(color_type, sort_by, ignore_case),
+            queryset,
+            ignore_case,
+            include_blank,
+            blank_choice,
+            layout,
+            sort_by,
+            chunk_size,
+        )
+
+    def search_choices(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        prefix: bool = False,
+        ignore_case: bool = True,
+        ordering: tuple | None = None,
+        layout: str | None = None,
+        sort_by: str | None = "label",
+        fuzzy: bool = False,
+    ) -> list[tuple[str, str]]:
+        """
+        Search the choices of the field by value or label.
 
+        The default choices are matched in Python and the custom choices
+        with a filtered query, using the field's configured filters. The
+        matches keep the layout order of get_choices, and only the requested
+        page of matches is fetched.
+
+        With search_index enabled in the configuration, the field's
+        in-memory search index is searched instead of the database (see
+        get_search_index). Fuzzy searches need the index, so without it
+        they fall back to matching substrings, unless the field has
+        predefined choices.
+
+        :argument query: The text to search for, empty to match everything
+        :argument limit: Maximum number of matches to return
+        :argument offset: Number of matches to skip
+        :argument prefix: Whether to match the start of the value or label
+            instead of any substring
+        :argument ignore_case: Whether to ignore case when matching and
+            sorting
+        :argument ordering: Database ordering for custom model choices
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument fuzzy: Whether to add choices similar to the query after
+            the matches, the most similar first, when an index is used
+        :returns: List of the matching (value, label) tuples
+        :raises ValueError: If the layout, sort_by, limit or offset is
+            invalid
+        """
+        ordering, layout = self._resolve_choice_parameters(ordering, layout)
+        self._validate_parameters(layout, sort_by)
+        if limit < 1 or offset < 0:
+            raise ValueError(
+                "limit must be positive and offset must not be negative, "
+                f"got {limit} and {offset}"
+            )
+
+        if self.choices is not None:
+            use_index = fuzzy
+        else:
+            # building an index is only worth it when it is kept
+            use_index = bool(self.field_config.get("search_index"))
+        if use_index:
+            if self.choices is not None:
+                index = ChoiceSearchIndex.from_choices(
+                    self.flatchoices, sort_by=None
+                )
+            else:
+                index = self.get_search_index(layout, sort_by, ignore_case)
+            choices = index.search(query, prefix, ignore_case, fuzzy)
+            return choices[offset : offset + limit]
+
+        def matches(choice: tuple[str, str]) -> bool:
+            return any(
+                search_match(str(text), query, prefix, ignore_case)
+                for text in choice
+            )
+
+        if self.choices is not None:
+            choices = filter(matches, self.flatchoices)
+        else:
+            color_type = self.field_config.get("color_type")
+            choice_model = self.field_config.choice_model
+            queryset = None
+            if choice_model:
+                queryset = self.get_choice_queryset(
+                    choice_model,
+                    color_type,
+                    self.field_config.get("choice_filters") or {},
+                    ordering,
+                    sort_by,
+                    ignore_case,
+                ).filter(
+                    get_search_filter(color_type, query, prefix, ignore_case)
+                )
+            choices = self._iter_choices(
+                filter(
+                    matches,
+                    self._get_default_choices(
+                        color_type, sort_by, ignore_case
+                    ),
+                ),
+                queryset,
+                ignore_case,
+                False,
+                BLANK_CHOICE_DASH,
+                layout,
+                sort_by,
+                min(offset + limit, DEFAULT_CHUNK_SIZE),
+            )
+        return list(itertools.islice(choices, offset, offset + limit))
+
+    def get_search_index(
+        self,
+        layout: str | None = None,
+        sort_by: str | None = "label",
+        ignore_case: bool = True,
+    ) -> ChoiceSearchIndex:
+        """
+        Get the in-memory search index of the field's choices.
+
+        The index is built on first use from the palette and the rows of the
+        choice model matching the configured filters, and kept up to date
+        as rows are saved and deleted in this process. Other processes
+        update their own indexes through their own signals only, so rows
+        changed elsewhere (or with bulk updates) are seen after a restart or
+        search_indexes.clear().
+
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: The search index
+        """
+        _, layout = self._resolve_choice_parameters(None, layout)
+        self._validate_parameters(layout, sort_by)
+        return search_indexes.get_index(self, layout, sort_by, ignore_case)
+
+    def get_choice_labels(self, values: Iterable[str]) -> dict[str, str]:
+        """
+        Get the labels of the given choice values.
+
+        The default colors are looked up in the palette and the remaining
+        values with a single query against the choice model.
+
+        :argument values: The choice values to look up
+        :returns: Dict mapping each known value to its label
+        """
+        values = set(values)
+        if self.choices is not None:
+            return {
+                value: label
+                for value, label in self.flatchoices
+                if value in values
+            }
+        color_type = self.field_config.get("color_type")
+        labels = {}
+        if not self.field_config.get("only_use_custom_colors"):
+            palette = self.field_config.default_color_choices.for_field_type(
+                color_type
+            )
+            labels = {
+                value: label
+                for value, label in palette.frozen_choices
+                if value in values
+            }
+        missing = values.difference(labels)
+        choice_model = self.field_config.choice_model
+        if missing and choice_model:
+            filters = self.field_config.get("choice_filters") or {}
+            labels.update(
+                choice_model.objects.filter(
+                    **filters,
+                    **{f"{color_type.value}__in": sorted(missing)},
+                ).values_list(color_type.value, "name")
+            )
+        return labels
+
+    def get_option(self, instance: Model) -> ColorOption | None:
+        """
+        Get the ColorOption of the value stored on a model instance.
+
+        The option is cached on the instance with the value it belongs to,
+        so it is looked up again once the attribute is reassigned, and
+        options attached by ColorQuerySet.with_color_options() are used as
+        they are. Default
+        colors are found in the compiled palette map, so only custom colors
+        ever query the database, once per instance.
+
+        :argument instance: The model instance
+        :returns: The ColorOption or None if the value is not a known color
+        """
+        value = getattr(instance, self.attname)
+        cached = instance.__dict__.get(OPTION_CACHE_ATTR, {}).get(self.attname)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        option = None
+        if value not in self.empty_values:
+            option = self.get_color_options({value}).get(value)
+        self.cache_option(instance, option)
+        return option
+
+    def cache_option(
+        self, instance: Model, option: ColorOption | None
+    ) -> None:
+        """
+        Attach the resolved ColorOption of the current value to an instance.
+
+        :argument instance: The model instance
+        :argument option: The resolved option, None for unknown values
+        :returns: None
+        """
+        instance.__dict__.setdefault(OPTION_CACHE_ATTR, {})[self.attname] = (
+            getattr(instance, self.attname),
+            option,
+        )
+
+    def get_color_options(
+        self, values: Iterable[str]
+    ) -> dict[str, ColorOption]:
+        """
+        Get the ColorOptions of stored values.
+
+        Default colors are looked up in the palette and the remaining values
+        with a single query against the choice model. Custom colors are
+        resolved from any row of the choice model, so values stored before
+        the choice filters changed still get their label.
+
+        :argument values: The stored values
+        :returns: Dict mapping each known value to its ColorOption
+        """
+        values = set(values)
+        color_type = self.field_config.get("color_type")
+        if self.choices is not None:
+            return {
+                value: ColorOption(
+                    value=value, label=str(label), **{color_type.value: value}
+                )
+                for value, label in self.flatchoices
+                if value in values
+            }
+        palette_options = self.get_palette_options()
+        options = {
+            value: palette_options[value]
+            for value in values
+            if value in palette_options
+        }
+        missing = values.difference(options)
+        choice_model = self.field_config.choice_model
+        if missing and choice_model:
+            custom_options = get_custom_options(
+                choice_model, {color_type.value: missing}
+            )
+            options.update(
+                (value, custom_options[color_type.value, value])
+                for value in missing
+                if (color_type.value, value) in custom_options
+            )
+        return options
+
+    def get_palette_options(self) -> Mapping[str, ColorOption]:
+        """
+        Get the palette options keyed by the value stored for the field.
+
+        The mapping is compiled once per palette and field type.
+
+        :returns: Mapping of stored values to default ColorOptions
+        """
+        if self.field_config.get("only_use_custom_colors"):
+            return {}
+        color_type = self.field_config.get("color_type")
+        palette = self.field_config.default_color_choices.for_field_type(
+            color_type
+        )
+        return palette.choice_options
+
+    def _get_default_choices(
+        self, color_type: FieldType, sort_by: str | None, ignore_case: bool
+    ) -> tuple[tuple[str, str], ...]:
+        """
+        Get the default choices from the shared palette instance.
+
+        :argument color_type: The color type of the field
+        :argument sort_by: Sort key ("value" or "label")
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: Tuple of (value, label) tuples
+        """
+        palette = self.field_config.default_color_choices.for_field_type(
+            color_type
+        )
+        if sort_by:
+            return palette.sorted_choices(sort_by, ignore_case)
+        return palette.frozen_choices
+
+    def _iter_choices(
+        self,
+        default_choices: Iterable[tuple[str, str]],
+        queryset: QuerySet | None,
+        ignore_case: bool,
+        include_blank: bool,
+        blank_choice: str,
+        layout: str,
+        sort_by: str | None,
+        chunk_size: int,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Yield the choices in layout order.
+
+        Nothing is queried until the first custom choice is requested.
+
+        :argument default_choices: The default choices, in sort order
+        :argument queryset: The custom choices queryset or None
+        :argument ignore_case: Whether to ignore case when sorting
+        :argument include_blank: Whether to include a blank choice option
+        :argument blank_choice: Blank choice label
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument chunk_size: Number of rows fetched at a time
+        :returns: Iterator of (value, label) tuples
+        """
+        if include_blank:
+            yield ("", blank_choice)
+
+        if queryset is None:
+            yield from default_choices
+            return
+
+        queryset_choices = queryset.iterator(chunk_size=chunk_size)
+        if self.field_config.get("only_use_custom_colors"):
+            yield from queryset_choices
+        elif sort_by and layout == "mixed":
+            # the rows keep the database order, each default choice comes
+            # before the first row that sorts after it in python
+            yield from heapq.merge(
+                default_choices,
+                queryset_choices,
+                key=choice_sort_key(sort_by, ignore_case),
+            )
+        elif layout == "custom_first":
+            yield from queryset_choices
+            yield from default_choices
+        else:
+            yield from default_choices
+            yield from queryset_choices
+
+    def get_choice_queryset(
+        self,
+        choice_model: type[Model],
+        color_type: FieldType,
+        filters: dict,
+        ordering: tuple,
+        sort_by: str | None = None,
+        ignore_case: bool = True,
+    ) -> QuerySet:
+        """
+        Get the queryset of custom choices from the choice model.
+
+        :argument choice_model: The model providing the custom choices
+        :argument color_type: The color type of the field
+        :argument filters: Filters for the choice model queryset
+        :argument ordering: Database ordering for the custom choices
+        :argument sort_by: Sort key ("value" or "label") to sort by in the
+            database, the ordering then only breaks ties
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: Queryset of (value, label) tuples
+        """
+        if sort_by:
+            ordering = (
+                get_sort_expression(color_type, sort_by, ignore_case),
+                *ordering,
+            )
+        return (
+            choice_model.objects.filter(**filters)
+            .distinct()
+            .order_by(*ordering)
+            .values_list(color_type.value, "name")
+        )
+
+    def get_choices_cache(self) -> ChoicesCache | SharedChoicesCache | None:
+        """
+        Get the cache used for this field's choices.
+
+        A shared cache configured with cache_alias takes precedence over the
+        process-local cache enabled with cache_choices.
+
+        :returns: The choices cache or None if caching is disabled
+        """
+        cache_alias = self.field_config.get("cache_alias")
+        if cache_alias:
+            return SharedChoicesCache(
+                cache_alias, self.field_config.get("cache_timeout")
+            )
+        if self.field_config.get("cache_choices"):
+            return local_choices_cache
+        return None
+
+    def _get_cached_choices(
+        self,
+        request_choices: dict[tuple, tuple] | None,
+        choices_cache: ChoicesCache | SharedChoicesCache | None,
+        choice_model: type[Model] | None,
+        cache_key: tuple | None,
+    ) -> tuple[tuple | None, int | None]:
+        """
+        Look up the choices in the request scope and the choices cache.
+
+        Choices found in the choices cache are also memoized in the request
+        scope.
+
+        :argument request_choices: The choices memoized for the request
+        :argument choices_cache: The configured choices cache
+        :argument choice_model: The resolved choice model or None
+        :argument cache_key: The cache key built from the call parameters
+        :returns: Tuple of (cached choices or None, cache version or None)
+        """
+        if request_choices is not None and cache_key in request_choices:
+            return request_choices[cache_key], None
+        if choices_cache is None:
+            return None, None
+        version = choices_cache.version(choice_model)
+        cached_choices = choices_cache.get(choice_model, cache_key, version)
+        if cached_choices is not None and request_choices is not None:
+            request_choices[cache_key] = cached_choices
+        return cached_choices, version
+
+    def _set_cached_choices(
+        self,
+        request_choices: dict[tuple, tuple] | None,
+        choices_cache: ChoicesCache | SharedChoicesCache | None,
+        choice_model: type[Model] | None,
+        cache_key: tuple | None,
+        choices: list[tuple[str, str]],
+        version: int | None,
+    ) -> None:
+        """
+        Store built choices in the request scope and the choices cache.
+
+        :argument request_choices: The choices memoized for the request
+        :argument choices_cache: The configured choices cache
+        :argument choice_model: The resolved choice model or None
+        :argument cache_key: The cache key built from the call parameters
+        :argument choices: The built choices
+        :argument version: The cache version read before building
+        :returns: None
+        """
+        frozen = tuple(choices)
+        if choices_cache is not None:
+            choices_cache.set(choice_model, cache_key, frozen, version)
+        if request_choices is not None:
+            request_choices[cache_key] = frozen
+
+    def _build_choices(
+        self,
+        default_color_choices: type[ColorChoices],
+        color_type: FieldType,
+        choice_model: type[Model] | None,
+        filters: dict,
+        ignore_case: bool,
+        ordering: tuple,
+        layout: str,
+        sort_by: str | None,
+    ) -> list[tuple[str, str]]:
+        """
+        Build the list of choices from the palette and the choice model.
+
+        :argument default_color_choices: The resolved default choices class
+        :argument color_type: The field type to use for value selection
+        :argument choice_model: The resolved choice model or None
+        :argument filters: Filters for the choice model queryset
+        :argument ignore_case: Whether to ignore case when sorting
+        :argument ordering: Database ordering for custom model choices
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :returns: List of (value, label) tuples
+        """
+        # default choices, presorted by the shared palette instance
+        palette = default_color_choices.for_field_type(color_type)
+        if sort_by:
+            default_choices = list(
+                palette.sorted_choices(sort_by, ignore_case)
+            )
+        else:
+            default_choices = palette.choices
+
+        if not choice_model:
+            # return the default choices if no model is set
+            final_choices = default_choices
+        else:
+            only_use_custom_colors = self.field_config.get(
+                "only_use_custom_colors"
+            )
+            sort_in_database = bool(
+                sort_by and self.field_config.get("sort_in_database")
+            )
             # get the queryset options using the resolved model
             queryset_choices = list(
-                resolved_choice_model.objects.filter(**filters)
-                .distinct()
-                .order_by(*ordering)
-                .values_list(color_type.value, "name")
+                self.get_choice_queryset(
+                    choice_model,
+                    color_type,
+                    filters,
+                    ordering,
+                    sort_by if sort_in_database else None,
+                    ignore_case,
+                )
             )
-            if sort_by and layout != "mixed":
-                # Sort the two lists we have
+            if sort_by and not sort_in_database:
+                # Sort the queryset choices (the defaults are presorted)
                 # We sort these here in case they want things sorted, but
                 # seperated so the combine_choices will keep the options
                 # in their places, but sorted as expected.
-                default_choices = sort_choices(
-                    default_choices, sort_by, ignore_case
-                )
                 queryset_choices = sort_choices(
                     queryset_choices, sort_by, ignore_case
                 )
 
-            if self.field_config.get("only_use_custom_colors"):
+            if only_use_custom_colors:
                 final_choices = queryset_choices
+            elif sort_by and layout == "mixed":
+                # Mixed list of choices, merge the two sorted lists
+                final_choices = merge_choices(
+                    default_choices, queryset_choices, sort_by, ignore_case
+                )
             else:
                 final_choices = combine_choices(
                     layout,
                     default_choices,
                     queryset_choices,
                 )
-        if sort_by and layout == "mixed":
-            # Mixed list of choices, sort the entire list
-            final_choices = sort_choices(final_choices, sort_by, ignore_case)
-        if include_blank:
-            final_choices.insert(0, ("", blank_choice))
         return final_choices
 
     def _resolve_choice_parameters(
@@ -0,0 +1,167 @@
+"""Form fields for color selection."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable, Iterable, Iterator
+
+from django.db.models import Field
+from django.forms import ChoiceField
+from django.utils.choices import BaseChoiceIterator, normalize_choices
+
+from django_colors.widgets import ColorAutocompleteWidget, ColorChoiceWidget
+
+
+class ColorFieldChoiceIterator(BaseChoiceIterator):
+    """
+    Lazy iterator over the choices of a ColorChoiceField.
+
+    Used as the widget choices, so the widget renders the same evaluated
+    choices that the field validates against.
+    """
+
+    def __init__(self, field: ColorChoiceField) -> None:
+        """
+        Initialize the iterator for a field.
+
+        :argument field: The field providing the choices
+        :returns: None
+        """
+        self.field = field
+
+    def __iter__(self) -> Iterator:
+        """
+        Iterate over the evaluated choices of the field.
+
+        :returns: Iterator over the (value, label) choices
+        """
+        return iter(self.field.choices)
+
+
+class ColorChoiceField(ChoiceField):
+    """
+    Choice field for color selection.
+
+    Callable choices (such as ColorModelField.get_choices) are evaluated at
+    most once per field instance, and every form gets its own copy of the
+    field, so the choices are built once per form. Submitted values are
+    validated against a set of the choice values instead of scanning the
+    choices, including the values nested in optgroups.
+    """
+
+    widget = ColorChoiceWidget
+
+    def __deepcopy__(self, memo: dict) -> ColorChoiceField:
+        """
+        Copy the field, keeping the unevaluated choices.
+
+        :argument memo: The deepcopy memo dictionary
+        :returns: The copied field
+        """
+        result = super(ChoiceField, self).__deepcopy__(memo)
+        source_choices = self._source_choices
+        if not callable(source_choices):
+            source_choices = copy.deepcopy(source_choices, memo)
+        result.choices = source_choices
+        return result
+
+    @property
+    def choices(self) -> list:
+        """
+        Get the evaluated choices.
+
+        :returns: List of (value, label) choices, with optgroups nested
+        """
+        if self._choices is None:
+            choices = self._source_choices
+            if callable(choices):
+                choices = choices()
+            choices = normalize_choices(choices)
+            if not isinstance(choices, list):
+                choices = list(choices)
+            self._choices = choices
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: Iterable | Callable[[], Iterable] | None) -> None:
+        """
+        Set the choices without evaluating them.
+
+        :argument value: Iterable of choices or a callable returning them
+        :returns: None
+        """
+        self._source_choices = value if value is not None else ()
+        self._choices = None
+        self._valid_values = None
+        self.widget.choices = ColorFieldChoiceIterator(self)
+
+    @property
+    def valid_values(self) -> frozenset[str]:
+        """
+        Get the set of valid choice values.
+
+        :returns: Frozenset of every choice value as a string
+        """
+        if self._valid_values is None:
+            valid_values = set()
+            for key, label in self.choices:
+                if isinstance(label, (list, tuple)):
+                    # This is an optgroup, so add the options of the group
+                    valid_values.update(str(value) for value, _ in label)
+                else:
+                    valid_values.add(str(key))
+            self._valid_values = frozenset(valid_values)
+        return self._valid_values
+
+    def valid_value(self, value: str) -> bool:
+        """
+        Check to see if the provided value is a valid choice.
+
+        :argument value: The submitted value
+        :returns: True if the value is one of the choices
+        """
+        return str(value) in self.valid_values
+
+
+class ColorAutocompleteField(ColorChoiceField):
+    """
+    Choice field for color selection with ColorAutocompleteWidget.
+
+    The choices are never built: the widget renders only the selected
+    option and submitted values are checked against the model field with
+    set lookups and at most one query.
+    """
+
+    widget = ColorAutocompleteWidget
+
+    def __init__(self, *, model_field: Field, **kwargs: dict) -> None:
+        """
+        Initialize the field and bind the widget to the model field.
+
+        :argument model_field: The ColorModelField providing the choices
+        :argument kwargs: Additional arguments for the form field
+        :returns: None
+        """
+        self.model_field = model_field
+        super().__init__(**kwargs)
+        self.widget.model_field = model_field
+
+    def __deepcopy__(self, memo: dict) -> ColorAutocompleteField:
+        """
+        Copy the field, keeping the widget bound to the model field.
+
+        :argument memo: The deepcopy memo dictionary
+        :returns: The copied field
+        """
+        result = super().__deepcopy__(memo)
+        result.widget.model_field = self.model_field
+        return result
+
+    def valid_value(self, value: str) -> bool:
+        """
+        Check to see if the provided value is a valid choice.
+
+        :argument value: The submitted value
+        :returns: True if the value is one of the choices
+        """
+        return not self.model_field.get_invalid_values({str(value)})
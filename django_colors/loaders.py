@@ -0,0 +1,233 @@
+"""Load palettes from JSON, TOML and CSS files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import tempfile
+import threading
+import tomllib
+from functools import partial
+from pathlib import Path
+
+from django_colors.color_definitions import COLUMNS, CompactColorChoices
+from django_colors.stylesheets import scan_stylesheet
+
+CACHE_DIR_NAME = "__palettecache__"
+# bump when the layout of the cache files changes
+CACHE_FORMAT = 1
+# size of the text chunks stylesheets are scanned in
+CHUNK_SIZE = 64 * 1024
+
+_loaded: dict[tuple, type[CompactColorChoices]] = {}
+_lock = threading.Lock()
+
+
+def parse_palette(content: bytes, suffix: str) -> tuple[str | None, list]:
+    """
+    Parse the content of a palette file.
+
+    Palettes are a list of colors, or a table with an optional "name" and
+    a "colors" list. Each color is a table with value, label,
+    background_css and text_css keys.
+
+    :argument content: The content of the file
+    :argument suffix: The file suffix, ".json" or ".toml"
+    :returns: Tuple of (palette name or None, list of color rows)
+    :raises ValueError: If the format is unknown or the content is invalid
+    """
+    if suffix == ".json":
+        data = json.loads(content)
+    elif suffix == ".toml":
+        data = tomllib.loads(content.decode())
+    else:
+        raise ValueError(f"Unsupported palette format '{suffix}'.")
+    name = None
+    if isinstance(data, dict):
+        name = data.get("name")
+        data = data.get("colors", [])
+    rows = []
+    for color in data:
+        try:
+            rows.append(tuple(str(color[column]) for column in COLUMNS))
+        except (KeyError, TypeError) as error:
+            raise ValueError(
+                f"Invalid color {color!r}. Colors need the keys "
+                f"{', '.join(COLUMNS)}."
+            ) from error
+    return name, rows
+
+
+def read_palette_file(path: Path) -> tuple[str | None, list]:
+    """
+    Read the colors of a palette file.
+
+    Stylesheets are scanned in chunks for their color classes, so they are
+    never loaded into memory as a whole.
+
+    :argument path: The palette file
+    :returns: Tuple of (palette name or None, list of color rows)
+    :raises ValueError: If the format is unknown or the content is invalid
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".css":
+        with path.open(encoding="utf-8") as stylesheet:
+            return None, scan_stylesheet(
+                iter(partial(stylesheet.read, CHUNK_SIZE), "")
+            )
+    return parse_palette(path.read_bytes(), suffix)
+
+
+def get_cache_path(path: Path, cache_dir: Path | None = None) -> Path:
+    """
+    Get the path of the compiled cache file of a palette file.
+
+    :argument path: The palette file
+    :argument cache_dir: The cache directory, defaults to a
+        __palettecache__ directory next to the palette file
+    :returns: The cache file path
+    """
+    if cache_dir is None:
+        cache_dir = path.parent / CACHE_DIR_NAME
+    return cache_dir / f"{path.name}.marshal"
+
+
+def is_cache_entry(entry: object) -> bool:
+    """
+    Check that a loaded cache entry has the expected layout.
+
+    :argument entry: The loaded entry
+    :returns: True if the entry can be used
+    """
+    if not (
+        isinstance(entry, tuple)
+        and len(entry) == 6
+        and entry[0] == CACHE_FORMAT
+        and isinstance(entry[5], list)
+    ):
+        return False
+    return all(
+        isinstance(row, tuple)
+        and len(row) == len(COLUMNS)
+        and all(isinstance(item, str) for item in row)
+        for row in entry[5]
+    )
+
+
+def read_cache(cache_path: Path) -> tuple | None:
+    """
+    Read a compiled cache file through a memory map.
+
+    :argument cache_path: The cache file
+    :returns: The cached (format, mtime_ns, size, digest, name, rows) entry,
+        or None if missing, unreadable or of another format
+    """
+    try:
+        with (
+            cache_path.open("rb") as cache_file,
+            mmap.mmap(
+                cache_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped,
+        ):
+            # marshal only builds plain values here, checked below, and
+            # nothing from the cache is ever executed
+            entry = marshal.loads(mapped)  # noqa: S302
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if not is_cache_entry(entry):
+        return None
+    return entry
+
+
+def write_cache(cache_path: Path, entry: tuple) -> None:
+    """
+    Write a compiled cache file atomically.
+
+    Failing to write (e.g. on a read-only file system) is not an error; the
+    palette is parsed again next time.
+
+    :argument cache_path: The cache file
+    :argument entry: The (format, mtime_ns, size, digest, name, rows) entry
+    :returns: None
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent)
+        with os.fdopen(fd, "wb") as temp_file:
+            marshal.dump(entry, temp_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        return
+
+
+def compile_palette_file(
+    path: Path, cache_dir: Path | None = None
+) -> tuple[str | None, list]:
+    """
+    Get the rows of a palette file, using the compiled cache when valid.
+
+    The cache is used without reading the palette file when the file's
+    mtime and size match. Otherwise the file is hashed, and only read
+    again when its content changed.
+
+    :argument path: The palette file
+    :argument cache_dir: The cache directory
+    :returns: Tuple of (palette name or None, list of color rows)
+    """
+    stat = path.stat()
+    cache_path = get_cache_path(path, cache_dir)
+    entry = read_cache(cache_path)
+    if entry is not None and entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+        return entry[4], entry[5]
+    with path.open("rb") as palette_file:
+        digest = hashlib.file_digest(palette_file, "sha256").hexdigest()
+    if entry is not None and entry[3] == digest:
+        name, rows = entry[4], entry[5]
+    else:
+        name, rows = read_palette_file(path)
+    write_cache(
+        cache_path,
+        (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size, digest, name, rows),
+    )
+    return name, rows
+
+
+def load_palette(
+    path: str | os.PathLike,
+    name: str | None = None,
+    cache_dir: str | os.PathLike | None = None,
+) -> type[CompactColorChoices]:
+    """
+    Load a palette class from a JSON, TOML or CSS file.
+
+    Stylesheets give a palette of the colors that have both a bg-* and a
+    text-* color class. The parsed colors are compiled into a marshal cache
+    file that is memory-mapped on later loads, so workers don't parse large
+    palettes again. Loading the same unchanged file again in a process
+    returns the same palette class.
+
+    :argument path: The palette file
+    :argument name: The class name, defaults to the "name" in the file or
+        the file name
+    :argument cache_dir: The cache directory, defaults to a
+        __palettecache__ directory next to the palette file
+    :returns: The compact palette class
+    :raises ValueError: If the file format or content is invalid
+    """
+    path = Path(path).resolve()
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size, name)
+    try:
+        return _loaded[key]
+    except KeyError:
+        pass
+    file_name, rows = compile_palette_file(path, cache_dir)
+    palette = CompactColorChoices.from_options(
+        name or file_name or path.stem, rows
+    )
+    with _lock:
+        return _loaded.setdefault(key, palette)
@@ -0,0 +1 @@
+"""Management utilities for the django_colors app."""
@@ -0,0 +1 @@
+"""Management commands for the django_colors app."""
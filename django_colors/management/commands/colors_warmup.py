@@ -0,0 +1,46 @@
+"""Management command warming up the color fields."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_colors.warmup import preload
+
+
+class Command(BaseCommand):
+    """
+    Resolve every color field and fill the shared choices caches.
+
+    The command runs in its own short-lived process, so only the shared
+    caches outlive it. To warm the workers of a pre-forking server, call
+    django_colors.preload() in the master process instead.
+    """
+
+    help = (
+        "Check the configuration and palette of every color field and fill "
+        "the shared choices caches."
+    )
+
+    def handle(self, *args: str, **options: dict) -> None:
+        """
+        Warm up the color fields and report the results.
+
+        Nothing is frozen, since the process exits right after.
+
+        :argument args: Positional arguments
+        :argument options: The command options
+        :returns: None
+        :raises CommandError: If any field failed to warm up
+        """
+        report = preload(freeze=False)
+        self.stdout.write(
+            f"Resolved {len(report.fields)} color field(s) using "
+            f"{len(report.palettes)} palette(s), cached the choices of "
+            f"{len(report.choices)} field(s) in {report.duration:.3f}s."
+        )
+        for step, seconds in report.timings.items():
+            self.stdout.write(f"  {step}: {seconds:.3f}s")
+        if report.errors:
+            for label, error in report.errors.items():
+                self.stderr.write(f"{label}: {error}")
+            raise CommandError(
+                f"{len(report.errors)} color field(s) failed to warm up."
+            )
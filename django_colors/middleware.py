@@ -0,0 +1,60 @@
+"""Middleware for the django_colors app."""
+
+from collections.abc import Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from django_colors.cache import choices_scope
+
+
+class ColorChoicesMiddleware:
+    """
+    Memoize color choices for the lifetime of a single request.
+
+    Every form and field rendered while handling the request shares the
+    choices built for the same choice model and parameters, so each
+    distinct set of choices is queried at most once per request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse]
+        | Callable[[HttpRequest], Awaitable[HttpResponse]],
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        :argument get_response: The next middleware or view in the chain
+        :returns: None
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(
+        self, request: HttpRequest
+    ) -> HttpResponse | Awaitable[HttpResponse]:
+        """
+        Handle the request inside a choices scope.
+
+        :argument request: The current request
+        :returns: The response
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with choices_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Handle the async request inside a choices scope.
+
+        :argument request: The current request
+        :returns: The response
+        """
+        with choices_scope():
+            return await self.get_response(request)
@@ -1,6 +1,6 @@
 """Models for custom color definitions."""
 
-from django.db.models import Model
+from django.db.models import Index, Model
 from django.db.models.fields import CharField
 
 
@@ -20,3 +20,24 @@ class ColorModel(Model):
         """Meta options for the ColorModel."""
 
         abstract = True
+
+
+class IndexedColorModel(ColorModel):
+    """
+    Abstract base model for custom color definitions with indexes.
+
+    Adds a covering index over (name, background_css, text_css), which
+    serves choices ordered by name straight from the index, and indexes on
+    each css column for value lookups such as validation. The index names
+    are generated for each concrete subclass.
+    """
+
+    class Meta:
+        """Meta options for the IndexedColorModel."""
+
+        abstract = True
+        indexes = [
+            Index(fields=["name", "background_css", "text_css"]),
+            Index(fields=["background_css"]),
+            Index(fields=["text_css"]),
+        ]
@@ -0,0 +1,113 @@
+"""Process-wide registry of color palettes."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+
+from django.utils.module_loading import import_string
+
+from django_colors.color_definitions import BootstrapColorChoices, ColorChoices
+
+_palettes: dict[str, type[ColorChoices]] = {}
+_lock = threading.Lock()
+
+
+def is_palette(palette: object) -> bool:
+    """
+    Check if an object is a palette class.
+
+    :argument palette: The object to check
+    :returns: True if the object is a ColorChoices subclass
+    """
+    return isinstance(palette, type) and issubclass(palette, ColorChoices)
+
+
+def register_palette(
+    name: str, palette: type[ColorChoices] | None = None
+) -> type[ColorChoices] | Callable[[type], type]:
+    """
+    Register a palette under a short name.
+
+    Can be called directly or used as a class decorator:
+
+        @register_palette("brand")
+        class BrandColorChoices(ColorChoices): ...
+
+    :argument name: The short name of the palette, without dots
+    :argument palette: The palette class, omitted when used as a decorator
+    :returns: The palette class, or the decorator
+    :raises ValueError: If the name contains a dot or is already taken
+    :raises TypeError: If the palette is not a ColorChoices subclass
+    """
+    if palette is None:
+        return lambda palette: register_palette(name, palette)
+    if "." in name:
+        raise ValueError(
+            f"Invalid palette name '{name}'. "
+            f"Names with dots are reserved for import paths."
+        )
+    if not is_palette(palette):
+        raise TypeError(f"{palette!r} is not a ColorChoices subclass.")
+    with _lock:
+        if _palettes.get(name, palette) is not palette:
+            raise ValueError(f"A palette is already registered as '{name}'.")
+        _palettes[name] = palette
+    return palette
+
+
+def unregister_palette(name: str) -> None:
+    """
+    Remove a palette name, including a cached import path.
+
+    :argument name: The palette name or import path
+    :returns: None
+    """
+    with _lock:
+        _palettes.pop(name, None)
+
+
+def get_palette(reference: str | type[ColorChoices]) -> type[ColorChoices]:
+    """
+    Resolve a palette reference to the palette class.
+
+    References are either registered names (e.g. "bootstrap") or dotted
+    import paths. Each import path is imported once and then cached under
+    the path, so every field referencing it shares the same class and its
+    precompiled choices.
+
+    :argument reference: A palette name, import path or palette class
+    :returns: The palette class
+    :raises LookupError: If no palette is registered under the name
+    :raises ImportError: If the import path cannot be imported
+    :raises TypeError: If the reference is not a ColorChoices subclass
+    """
+    if not isinstance(reference, str):
+        if not is_palette(reference):
+            raise TypeError(f"{reference!r} is not a ColorChoices subclass.")
+        return reference
+    try:
+        return _palettes[reference]
+    except KeyError:
+        pass
+    if "." not in reference:
+        raise LookupError(f"No palette is registered as '{reference}'.")
+    palette = import_string(reference)
+    if not is_palette(palette):
+        raise TypeError(f"{reference!r} is not a ColorChoices subclass.")
+    with _lock:
+        return _palettes.setdefault(reference, palette)
+
+
+def get_palettes() -> dict[str, type[ColorChoices]]:
+    """
+    Get the registered palettes by name.
+
+    :returns: Dict mapping names to palette classes, without import paths
+    """
+    return {
+        name: palette for name, palette in _palettes.items() if "." not in name
+    }
+
+
+register_palette("bootstrap", BootstrapColorChoices)
@@ -0,0 +1,188 @@
+"""Querysets resolving the ColorOptions of color fields in bulk."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.db.models import Model, QuerySet
+
+from django_colors.color_definitions import ColorOption
+from django_colors.fields import ColorModelField, get_custom_options
+
+
+def get_color_fields(
+    model: type[Model], field_names: Iterable[str]
+) -> list[ColorModelField]:
+    """
+    Get the color fields of a model by name.
+
+    :argument model: The model class
+    :argument field_names: The names of the color fields
+    :returns: List of the color fields
+    :raises ValueError: If a field is not a ColorModelField
+    """
+    fields = []
+    for name in field_names:
+        field = model._meta.get_field(name)
+        if not isinstance(field, ColorModelField):
+            raise ValueError(
+                f"'{name}' is not a ColorModelField of {model._meta.label}."
+            )
+        fields.append(field)
+    return fields
+
+
+def get_default_options(
+    field: ColorModelField, values: set[str]
+) -> tuple[dict[str, ColorOption], set[str]]:
+    """
+    Get the ColorOptions of values that do not need the choice model.
+
+    :argument field: The color field
+    :argument values: The stored values
+    :returns: Tuple of (options found, values left for the choice model)
+    """
+    if field.choices is not None:
+        return field.get_color_options(values), set()
+    palette_options = field.get_palette_options()
+    options = {
+        value: palette_options[value]
+        for value in values
+        if value in palette_options
+    }
+    return options, values.difference(options)
+
+
+def attach_color_options(
+    instances: Iterable[Model], field_names: Iterable[str]
+) -> None:
+    """
+    Resolve and attach the ColorOptions of color fields to instances.
+
+    Default colors are looked up in each field's palette, and the custom
+    colors of every field sharing a choice model are fetched with a single
+    query, so get_<field>_option() never queries per row afterwards.
+
+    :argument instances: Model instances of a single model
+    :argument field_names: The names of the color fields to resolve
+    :returns: None
+    :raises ValueError: If a field is not a ColorModelField
+    """
+    instances = list(instances)
+    if not instances:
+        return
+    fields = get_color_fields(type(instances[0]), field_names)
+
+    options = {}
+    missing = {}
+    lookups: dict[type[Model], dict[str, set[str]]] = {}
+    for field in fields:
+        values = {
+            value
+            for instance in instances
+            if (value := getattr(instance, field.attname))
+            not in field.empty_values
+        }
+        options[field], missing[field] = get_default_options(field, values)
+        choice_model = field.field_config.choice_model
+        if missing[field] and choice_model:
+            column = field.field_config.get("color_type").value
+            lookups.setdefault(choice_model, {}).setdefault(
+                column, set()
+            ).update(missing[field])
+
+    custom_options = {
+        choice_model: get_custom_options(choice_model, model_lookups)
+        for choice_model, model_lookups in lookups.items()
+    }
+    for field, values in missing.items():
+        found = custom_options.get(field.field_config.choice_model, {})
+        column = field.field_config.get("color_type").value
+        options[field].update(
+            (value, found[column, value])
+            for value in values
+            if (column, value) in found
+        )
+
+    for instance in instances:
+        for field in fields:
+            field.cache_option(
+                instance,
+                options[field].get(getattr(instance, field.attname)),
+            )
+
+
+class ColorQuerySet(QuerySet):
+    """
+    QuerySet that can resolve the ColorOptions of its color fields.
+
+    Use it as the manager of models with color fields:
+
+        objects = ColorQuerySet.as_manager()
+    """
+
+    def __init__(self, *args: tuple, **kwargs: dict) -> None:
+        """
+        Initialize the queryset.
+
+        :argument args: Positional arguments for QuerySet
+        :argument kwargs: Keyword arguments for QuerySet
+        :returns: None
+        """
+        super().__init__(*args, **kwargs)
+        self._color_option_fields: tuple[str, ...] = ()
+        self._color_options_done = False
+
+    def with_color_options(self, *field_names: str) -> ColorQuerySet:
+        """
+        Resolve the ColorOptions of color fields when the rows are fetched.
+
+        Resolving uses at most one extra query per choice model, and the
+        options are attached to each instance for get_<field>_option().
+        Rows fetched with iterator() are not resolved.
+
+        :argument field_names: The names of the color fields, every color
+            field of the model when empty
+        :returns: The new queryset
+        :raises ValueError: If a field is not a ColorModelField
+        """
+        if not field_names:
+            field_names = tuple(
+                field.name
+                for field in self.model._meta.concrete_fields
+                if isinstance(field, ColorModelField)
+            )
+        get_color_fields(self.model, field_names)
+        clone = self._chain()
+        clone._color_option_fields = tuple(
+            dict.fromkeys((*self._color_option_fields, *field_names))
+        )
+        return clone
+
+    def _clone(self) -> ColorQuerySet:
+        """
+        Copy the queryset, keeping the color fields to resolve.
+
+        :returns: The copied queryset
+        """
+        clone = super()._clone()
+        clone._color_option_fields = self._color_option_fields
+        return clone
+
+    def _fetch_all(self) -> None:
+        """
+        Fetch the rows and resolve their ColorOptions once.
+
+        :returns: None
+        """
+        super()._fetch_all()
+        if self._color_option_fields and not self._color_options_done:
+            attach_color_options(
+                [
+                    instance
+                    for instance in self._result_cache
+                    if isinstance(instance, Model)
+                ],
+                self._color_option_fields,
+            )
+            self._color_options_done = True
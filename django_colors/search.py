@@ -0,0 +1,577 @@
+"""In-memory search indexes over the choices of color fields."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Hashable, Iterable
+from typing import TYPE_CHECKING
+
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from django_colors.cache import get_through_models
+from django_colors.color_definitions import choice_sort_key
+
+if TYPE_CHECKING:
+    from django_colors.fields import ColorModelField
+
+FUZZY_THRESHOLD = 0.3
+
+
+def get_trigrams(text: str) -> set[str]:
+    """
+    Get the trigrams of a text, padded like PostgreSQL's pg_trgm.
+
+    :argument text: The casefolded text
+    :returns: Set of the trigrams of the text
+    """
+    padded = f"  {text} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def search_match(
+    text: str, query: str, prefix: bool = False, ignore_case: bool = True
+) -> bool:
+    """
+    Check if a choice value or label matches a search query.
+
+    :argument text: The choice value or label
+    :argument query: The text to search for
+    :argument prefix: Whether to match the start of the text only
+    :argument ignore_case: Whether to ignore case
+    :returns: True if the text matches the query
+    """
+    if ignore_case:
+        text, query = text.casefold(), query.casefold()
+    if prefix:
+        return text.startswith(query)
+    return query in text
+
+
+class TrieNode:
+    """Node of the prefix trie, holding the keys of the texts ending here."""
+
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty node.
+
+        :returns: None
+        """
+        self.children: dict[str, TrieNode] = {}
+        self.keys: set[Hashable] = set()
+
+
+class ChoiceSearchIndex:
+    """
+    In-memory search index over (value, label) choices.
+
+    Values and labels are indexed casefolded in a prefix trie and in a
+    trigram index. Prefix searches walk the trie, substring searches
+    intersect the trigram postings of the query and fuzzy searches rank the
+    entries sharing trigrams with the query by similarity. Entries can be
+    added and removed one at a time.
+
+    Results are returned in the order get_choices would list them for the
+    layout and sort options the index was created with.
+    """
+
+    def __init__(
+        self,
+        layout: str = "defaults_first",
+        sort_by: str | None = "label",
+        ignore_case: bool = True,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: None
+        """
+        self.layout = layout
+        self.sort_by = sort_by
+        self.ignore_case = ignore_case
+        self._sort_key = (
+            choice_sort_key(sort_by, ignore_case) if sort_by else None
+        )
+        self._entries: dict[Hashable, tuple[tuple[str, str], tuple]] = {}
+        self._trie = TrieNode()
+        self._trigrams: dict[str, set[Hashable]] = {}
+        self._ordered: list[Hashable] | None = None
+        self._counter = itertools.count()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed entries.
+
+        :returns: The number of entries
+        """
+        return len(self._entries)
+
+    @classmethod
+    def from_choices(
+        cls, choices: Iterable[tuple[str, str]], **kwargs: dict
+    ) -> ChoiceSearchIndex:
+        """
+        Build an index of default choices.
+
+        :argument choices: The (value, label) choices to index
+        :argument kwargs: Layout and sort options for the index
+        :returns: The built index
+        """
+        index = cls(**kwargs)
+        for choice in choices:
+            index.add(("default", choice[0]), choice[0], choice[1])
+        return index
+
+    def get_order_key(
+        self, value: str, label: str, custom: bool, counter: int
+    ) -> tuple:
+        """
+        Get the key placing an entry in the get_choices order.
+
+        :argument value: The choice value
+        :argument label: The choice label
+        :argument custom: Whether the choice comes from the choice model
+        :argument counter: The insertion counter, breaking ties
+        :returns: The sort key of the entry
+        """
+        group = int(custom)
+        if self.layout == "custom_first":
+            group = 1 - group
+        if self._sort_key is None:
+            return (group, counter)
+        sort_key = self._sort_key((value, label))
+        if self.layout == "mixed":
+            return (sort_key, group, counter)
+        return (group, sort_key, counter)
+
+    def add(
+        self, key: Hashable, value: str, label: str, custom: bool = False
+    ) -> None:
+        """
+        Add or replace an entry.
+
+        :argument key: The key of the entry, such as the row primary key
+        :argument value: The choice value
+        :argument label: The choice label
+        :argument custom: Whether the choice comes from the choice model
+        :returns: None
+        """
+        value, label = str(value), str(label)
+        with self._lock:
+            self.remove(key)
+            order_key = self.get_order_key(
+                value, label, custom, next(self._counter)
+            )
+            self._entries[key] = ((value, label), order_key)
+            for text in {value.casefold(), label.casefold()}:
+                node = self._trie
+                for char in text:
+                    node = node.children.setdefault(char, TrieNode())
+                node.keys.add(key)
+                for trigram in get_trigrams(text):
+                    self._trigrams.setdefault(trigram, set()).add(key)
+            self._ordered = None
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove an entry if it is indexed.
+
+        :argument key: The key of the entry
+        :returns: None
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return
+            (value, label), _ = entry
+            for text in {value.casefold(), label.casefold()}:
+                self._remove_from_trie(text, key)
+                for trigram in get_trigrams(text):
+                    postings = self._trigrams.get(trigram)
+                    if postings is not None:
+                        postings.discard(key)
+                        if not postings:
+                            del self._trigrams[trigram]
+            self._ordered = None
+
+    def _remove_from_trie(self, text: str, key: Hashable) -> None:
+        """
+        Remove a key from the trie, pruning the emptied nodes.
+
+        :argument text: The casefolded text the key was added for
+        :argument key: The key of the entry
+        :returns: None
+        """
+        path = [self._trie]
+        for char in text:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].keys.discard(key)
+        for char, parent, node in zip(
+            reversed(text),
+            reversed(path[:-1]),
+            reversed(path[1:]),
+            strict=True,
+        ):
+            if node.keys or node.children:
+                break
+            del parent.children[char]
+
+    def search(
+        self,
+        query: str,
+        prefix: bool = False,
+        ignore_case: bool = True,
+        fuzzy: bool = False,
+        threshold: float = FUZZY_THRESHOLD,
+    ) -> list[tuple[str, str]]:
+        """
+        Search the indexed choices.
+
+        Exact matches come first, in get_choices order. With fuzzy set,
+        entries sharing enough trigrams with the query follow, the most
+        similar first.
+
+        :argument query: The text to search for, empty to match everything
+        :argument prefix: Whether to match the start of the value or label
+            instead of any substring
+        :argument ignore_case: Whether to ignore case when matching
+        :argument fuzzy: Whether to add similar entries after the matches
+        :argument threshold: Minimum trigram similarity of fuzzy entries
+        :returns: List of the matching (value, label) tuples
+        """
+        with self._lock:
+            if not query:
+                return [self._entries[key][0] for key in self._get_ordered()]
+            folded = query.casefold()
+            if prefix:
+                candidates = self._get_prefix_keys(folded)
+            else:
+                candidates = self._get_substring_keys(folded)
+            matches = [
+                key
+                for key in candidates
+                if self._matches(key, query, prefix, ignore_case)
+            ]
+            matches.sort(key=lambda key: self._entries[key][1])
+            if fuzzy:
+                matches.extend(
+                    self._get_fuzzy_keys(folded, set(matches), threshold)
+                )
+            return self._unique_choices(matches)
+
+    def _get_ordered(self) -> list[Hashable]:
+        """
+        Get every key in get_choices order, sorted once per change.
+
+        :returns: List of the entry keys
+        """
+        if self._ordered is None:
+            self._ordered = sorted(
+                self._entries, key=lambda key: self._entries[key][1]
+            )
+        return self._ordered
+
+    def _get_prefix_keys(self, folded: str) -> set[Hashable]:
+        """
+        Get the keys of the texts starting with the query.
+
+        :argument folded: The casefolded query
+        :returns: Set of the matching keys
+        """
+        node = self._trie
+        for char in folded:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        keys = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            keys.update(node.keys)
+            stack.extend(node.children.values())
+        return keys
+
+    def _get_substring_keys(self, folded: str) -> Iterable[Hashable]:
+        """
+        Get the candidate keys of the texts containing the query.
+
+        :argument folded: The casefolded query
+        :returns: Iterable of the candidate keys
+        """
+        trigrams = [
+            folded[index : index + 3] for index in range(len(folded) - 2)
+        ]
+        if not trigrams:
+            # too short for trigrams, check every entry
+            return list(self._entries)
+        postings = sorted(
+            (self._trigrams.get(trigram, set()) for trigram in trigrams),
+            key=len,
+        )
+        return set(postings[0]).intersection(*postings[1:])
+
+    def _matches(
+        self, key: Hashable, query: str, prefix: bool, ignore_case: bool
+    ) -> bool:
+        """
+        Check if an entry matches the query exactly.
+
+        :argument key: The key of the entry
+        :argument query: The query text
+        :argument prefix: Whether to match the start of the texts only
+        :argument ignore_case: Whether to ignore case
+        :returns: True if the value or label matches
+        """
+        return any(
+            search_match(text, query, prefix, ignore_case)
+            for text in self._entries[key][0]
+        )
+
+    def _get_fuzzy_keys(
+        self, folded: str, exclude: set[Hashable], threshold: float
+    ) -> list[Hashable]:
+        """
+        Get the keys of the entries similar to the query.
+
+        :argument folded: The casefolded query
+        :argument exclude: Keys already matched exactly
+        :argument threshold: Minimum trigram similarity
+        :returns: List of keys, the most similar first
+        """
+        query_trigrams = get_trigrams(folded)
+        candidates = set()
+        for trigram in query_trigrams:
+            candidates.update(self._trigrams.get(trigram, ()))
+        scored = []
+        for key in candidates - exclude:
+            similarity = max(
+                len(query_trigrams & trigrams) / len(query_trigrams | trigrams)
+                for trigrams in (
+                    get_trigrams(text.casefold())
+                    for text in self._entries[key][0]
+                )
+            )
+            if similarity >= threshold:
+                scored.append((-similarity, self._entries[key][1], key))
+        scored.sort()
+        return [key for _, _, key in scored]
+
+    def _unique_choices(
+        self, keys: Iterable[Hashable]
+    ) -> list[tuple[str, str]]:
+        """
+        Get the choices of the keys, dropping duplicate choices.
+
+        :argument keys: The entry keys in result order
+        :returns: List of (value, label) tuples
+        """
+        seen = set()
+        choices = []
+        for key in keys:
+            choice = self._entries[key][0]
+            if choice not in seen:
+                seen.add(choice)
+                choices.append(choice)
+        return choices
+
+
+class SearchIndexRegistry:
+    """
+    Process-local registry of the search indexes of color fields.
+
+    Indexes are built on first use. Saved and deleted rows of a choice
+    model are updated in its indexes one at a time, while many-to-many
+    changes (which may change what the filters match) drop the indexes to
+    be rebuilt on next use.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty registry.
+
+        :returns: None
+        """
+        self._indexes: dict[tuple, ChoiceSearchIndex] = {}
+        self._watched: set[type[Model]] = set()
+        self._lock = threading.RLock()
+
+    def get_index(
+        self,
+        field: ColorModelField,
+        layout: str,
+        sort_by: str | None,
+        ignore_case: bool,
+    ) -> ChoiceSearchIndex:
+        """
+        Get the search index of a field, building it if needed.
+
+        :argument field: The color field
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: The search index
+        """
+        key = (field, layout, sort_by, ignore_case)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self.build_index(field, layout, sort_by, ignore_case)
+                self._indexes[key] = index
+            return index
+
+    def build_index(
+        self,
+        field: ColorModelField,
+        layout: str,
+        sort_by: str | None,
+        ignore_case: bool,
+    ) -> ChoiceSearchIndex:
+        """
+        Build the search index of a field from its palette and choice model.
+
+        :argument field: The color field
+        :argument layout: How to arrange default vs custom choices
+        :argument sort_by: Sort key ("value" or "label")
+        :argument ignore_case: Whether to ignore case when sorting
+        :returns: The built index
+        """
+        index = ChoiceSearchIndex(layout, sort_by, ignore_case)
+        config = field.field_config
+        color_type = config.get("color_type")
+        if not config.get("only_use_custom_colors"):
+            palette = config.default_color_choices.for_field_type(color_type)
+            for value, label in palette.frozen_choices:
+                index.add(("default", value), value, label)
+        choice_model = config.choice_model
+        if choice_model:
+            self.watch(choice_model)
+            rows = (
+                choice_model.objects.filter(
+                    **(config.get("choice_filters") or {})
+                )
+                .order_by(*field.ordering or ())
+                .values_list("pk", color_type.value, "name")
+            )
+            for pk, value, label in rows.iterator():
+                index.add(pk, value, label, custom=True)
+        return index
+
+    def clear(self) -> None:
+        """
+        Drop every index.
+
+        :returns: None
+        """
+        with self._lock:
+            self._indexes.clear()
+
+    def watch(self, choice_model: type[Model]) -> None:
+        """
+        Connect the update signals for a choice model.
+
+        :argument choice_model: The choice model to watch
+        :returns: None
+        """
+        with self._lock:
+            if choice_model in self._watched:
+                return
+            self._watched.add(choice_model)
+            post_save.connect(self._saved, sender=choice_model, weak=False)
+            post_delete.connect(self._deleted, sender=choice_model, weak=False)
+            for through in get_through_models(choice_model):
+                m2m_changed.connect(
+                    self._relations_changed, sender=through, weak=False
+                )
+
+    def _get_keys(self, choice_model: type[Model]) -> list[tuple]:
+        """
+        Get the registry keys of the indexes built from a choice model.
+
+        :argument choice_model: The choice model
+        :returns: List of registry keys
+        """
+        return [
+            key
+            for key in self._indexes
+            if key[0].field_config.choice_model is choice_model
+        ]
+
+    def _saved(
+        self, sender: type[Model], instance: Model, **kwargs: dict
+    ) -> None:
+        """
+        Update a saved row in the indexes of its choice model.
+
+        :argument sender: The choice model
+        :argument instance: The saved row
+        :argument kwargs: The signal arguments
+        :returns: None
+        """
+        with self._lock:
+            for key in self._get_keys(sender):
+                config = key[0].field_config
+                filters = config.get("choice_filters") or {}
+                color_type = config.get("color_type")
+                index = self._indexes[key]
+                if filters:
+                    # the filters may span relations, let the database decide
+                    row = (
+                        sender.objects.filter(pk=instance.pk, **filters)
+                        .values_list(color_type.value, "name")
+                        .first()
+                    )
+                else:
+                    row = (getattr(instance, color_type.value), instance.name)
+                if row is None:
+                    index.remove(instance.pk)
+                else:
+                    index.add(instance.pk, *row, custom=True)
+
+    def _deleted(
+        self, sender: type[Model], instance: Model, **kwargs: dict
+    ) -> None:
+        """
+        Remove a deleted row from the indexes of its choice model.
+
+        :argument sender: The choice model
+        :argument instance: The deleted row
+        :argument kwargs: The signal arguments
+        :returns: None
+        """
+        with self._lock:
+            for key in self._get_keys(sender):
+                self._indexes[key].remove(instance.pk)
+
+    def _relations_changed(self, sender: type[Model], **kwargs: dict) -> None:
+        """
+        Drop the indexes whose filters may match other rows now.
+
+        :argument sender: The through model
+        :argument kwargs: The signal arguments
+        :returns: None
+        """
+        if not kwargs.get("action", "").startswith("post_"):
+            return
+        through_models = {
+            choice_model: get_through_models(choice_model)
+            for choice_model in self._watched
+        }
+        with self._lock:
+            for choice_model, throughs in through_models.items():
+                if sender not in throughs:
+                    continue
+                for key in self._get_keys(choice_model):
+                    del self._indexes[key]
+
+
+search_indexes = SearchIndexRegistry()
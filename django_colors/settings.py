@@ -1,5 +1,10 @@
 """Configuration management for the django_colors app."""
 
+from __future__ import annotations
+
+from collections import ChainMap
+from collections.abc import Mapping, MutableMapping
+from types import MappingProxyType
 from typing import Any
 
 from django.apps import apps
@@ -9,6 +14,7 @@ from django.utils.functional import cached_property
 
 from django_colors.color_definitions import BootstrapColorChoices, ColorChoices
 from django_colors.field_type import FieldType
+from django_colors.palettes import get_palette
 
 CONFIG_DEFAULTS: dict[str, dict[str, Any]] = {
     "default": {
@@ -19,6 +25,13 @@ CONFIG_DEFAULTS: dict[str, dict[str, Any]] = {
         "only_use_custom_colors": False,
         "ordering": (),
         "layout": "defaults_first",
+        "cache_choices": False,
+        "cache_alias": None,
+        "cache_timeout": 300,
+        "validate_choices": False,
+        "sort_in_database": False,
+        "search_index": False,
+        "autocomplete": False,
     }
 }
 
@@ -37,16 +50,188 @@ def get_config() -> dict[str, Any]:
     return config
 
 
+def merge_settings_config(
+    django_app_settings: dict[str, Any],
+    app_label: str | None = None,
+    model_name: str | None = None,
+    field_name: str | None = None,
+) -> dict[str, Any]:
+    """
+    Merge the settings levels that apply to a field into a new dict.
+
+    Apply configuration inheritance hierarchy from
+    default > app > model > field. The settings are never modified.
+
+    :argument django_app_settings: The COLORS_APP_CONFIG setting
+    :argument app_label: The app label of the model
+    :argument model_name: The name of the model class
+    :argument field_name: The name of the field
+    :returns: Dictionary containing the merged settings configuration
+    """
+    keys = ["default"]
+    if app_label:
+        keys.append(app_label)
+        if model_name:
+            keys.append(f"{app_label}.{model_name}")
+            if field_name:
+                keys.append(f"{app_label}.{model_name}.{field_name}")
+    config = {}
+    for key in keys:
+        config.update(django_app_settings.get(key, {}))
+    return config
+
+
+class ConfigTable:
+    """
+    Immutable lookup table of the resolved settings configurations.
+
+    Every level of COLORS_APP_CONFIG is merged with the levels above it and
+    the defaults once, when the table is compiled. Looking up the
+    configuration of a field is at most four dict lookups and returns a
+    read-only mapping shared by every field using the same level.
+    """
+
+    __slots__ = ("cache_aliases", "default", "levels")
+
+    def __init__(self, django_app_settings: dict[str, Any]) -> None:
+        """
+        Compile the table from the COLORS_APP_CONFIG setting.
+
+        :argument django_app_settings: The COLORS_APP_CONFIG setting
+        :returns: None
+        """
+        self.default = self.compile_level(django_app_settings)
+        levels = {}
+        for key in django_app_settings:
+            parts = tuple(key.split("."))
+            if key == "default" or len(parts) > 3:
+                continue
+            parts += (None,) * (3 - len(parts))
+            levels[parts] = self.compile_level(django_app_settings, *parts)
+        self.levels: Mapping[tuple, Mapping[str, Any]] = MappingProxyType(
+            levels
+        )
+        self.cache_aliases: frozenset[str] = frozenset(
+            level_config["cache_alias"]
+            for level_config in (self.default, *levels.values())
+            if level_config.get("cache_alias")
+        )
+
+    @staticmethod
+    def compile_level(
+        django_app_settings: dict[str, Any], *parts: str | None
+    ) -> Mapping[str, Any]:
+        """
+        Compile the configuration of one settings level.
+
+        :argument django_app_settings: The COLORS_APP_CONFIG setting
+        :argument parts: The app label, model name and field name
+        :returns: Read-only mapping of the resolved configuration
+        """
+        config = dict(CONFIG_DEFAULTS["default"])
+        config.update(merge_settings_config(django_app_settings, *parts))
+        color_type = config.get("color_type")
+        if isinstance(color_type, str):
+            # invalid names are left for FieldConfig to report
+            config["color_type"] = FieldType.__members__.get(
+                color_type, color_type
+            )
+        return MappingProxyType(config)
+
+    def lookup(
+        self,
+        app_label: str | None,
+        model_name: str | None,
+        field_name: str | None,
+    ) -> Mapping[str, Any]:
+        """
+        Get the settings configuration of a field.
+
+        :argument app_label: The app label of the model
+        :argument model_name: The name of the model class
+        :argument field_name: The name of the field
+        :returns: Read-only mapping of the resolved configuration
+        """
+        levels = self.levels
+        return (
+            levels.get((app_label, model_name, field_name))
+            or levels.get((app_label, model_name, None))
+            or levels.get((app_label, None, None))
+            or self.default
+        )
+
+
+_config_table: ConfigTable | None = None
+
+
+def compile_config_table() -> ConfigTable:
+    """
+    Compile the configuration table from the current settings.
+
+    Called when the app is ready and whenever COLORS_APP_CONFIG changes.
+
+    :returns: The compiled table
+    """
+    global _config_table
+    _config_table = ConfigTable(getattr(settings, "COLORS_APP_CONFIG", {}))
+    return _config_table
+
+
+def get_config_table() -> ConfigTable:
+    """
+    Get the compiled configuration table, compiling it if needed.
+
+    Fields of models imported before the app is ready compile the table
+    early; it is compiled again when the app is ready.
+
+    :returns: The compiled table
+    """
+    if _config_table is None:
+        return compile_config_table()
+    return _config_table
+
+
+def settings_changed(setting: str, **kwargs: dict) -> None:
+    """
+    Recompile the configuration table when COLORS_APP_CONFIG changes.
+
+    Connected to the setting_changed signal when the app is ready. Fields
+    resolve their configuration again on their next use.
+
+    :argument setting: The name of the changed setting
+    :argument kwargs: The signal arguments
+    :returns: None
+    """
+    if setting == "COLORS_APP_CONFIG":
+        # imported here since the fields module imports this one
+        from django_colors.fields import reset_field_configs
+
+        compile_config_table()
+        reset_field_configs()
+
+
+def get_cache_aliases() -> frozenset[str]:
+    """
+    Get every cache alias used for shared choices in the configuration.
+
+    :returns: Set of cache aliases from all configuration levels
+    """
+    return get_config_table().cache_aliases
+
+
 class FieldConfig:
     """
     Configuration for a color field instance.
 
     Resolve configuration based on hierarchy:
     field > app settings > defaults
+
+    The settings layer is the shared read-only mapping from the compiled
+    ConfigTable. Only the values set on the field itself are stored per
+    field, in front of it.
     """
 
-    _defaults: dict[str, dict[str, Any]] = CONFIG_DEFAULTS.copy()
-    config: dict[str, Any]
+    config: MutableMapping[str, Any]
 
     def __init__(
         self,
@@ -62,21 +247,19 @@ class FieldConfig:
         :argument field_name: The name of the field
         :returns: None
         """
-        self.config = {}
         # hierarchy: field > settings > defaults
-
-        self.config.update(self._defaults["default"])
-
-        # app config
-        django_app_settings = getattr(settings, "COLORS_APP_CONFIG", {})
-        app_config = self.get_settings_config(
-            django_app_settings, model_class, field_name
-        )
-        self.config.update(app_config)
+        if model_class is None:
+            app_config = get_config_table().default
+        else:
+            app_config = get_config_table().lookup(
+                model_class._meta.app_label,
+                model_class._meta.object_name,
+                field_name,
+            )
 
         # field config
         field_config = self.get_field_config(field_class)
-        self.config.update(field_config)
+        self.config = ChainMap(field_config, app_config)
 
         # Handle setting default_color_choices if only_use_custom_colors
         self.set_color_choices()
@@ -106,32 +289,25 @@ class FieldConfig:
     @cached_property
     def default_color_choices(self) -> type:
         """
-        Lazily resolve the default_color_choices string to class.
+        Lazily resolve the default_color_choices reference to a palette.
+
+        Strings are palette names registered with register_palette() or
+        import paths, resolved once per process by the palette registry.
 
         :returns: The resolved color choices class
         """
         default_color_choices = self.config.get("default_color_choices")
         if default_color_choices and isinstance(default_color_choices, str):
             try:
-                return self._import_from_string(default_color_choices)
-            except (ImportError, AttributeError) as e:
+                return get_palette(default_color_choices)
+            except (ImportError, LookupError, TypeError) as e:
                 raise ValueError(
                     f"Invalid colors reference '{default_color_choices}'. "
-                    f"Expected format: 'module.path.ClassName'"
+                    f"Expected a registered palette name or "
+                    f"'module.path.ClassName'"
                 ) from e
         return default_color_choices
 
-    def _import_from_string(self, import_string: str) -> type:
-        """
-        Import a class from a string path.
-
-        :argument import_string: String like 'module.path.ClassName'
-        :returns: The imported class
-        """
-        module_path, class_name = import_string.rsplit(".", 1)
-        module = __import__(module_path, fromlist=[class_name])
-        return getattr(module, class_name)
-
     def has_choice_model(self) -> bool:
         """
         Check if a choice model is configured without triggering resolution.
@@ -171,25 +347,12 @@ class FieldConfig:
         :argument field_name: The name of the field
         :returns: Dictionary containing the resolved settings configuration
         """
-        app_label = model_class._meta.app_label
-        model_name = model_class.__class__.__name__
-        # get the hierarchy from django_app_settings
-        hierarchy_settings_config = django_app_settings.get("default", {})
-        # update the dict with values from app specific settings
-        hierarchy_settings_config.update(
-            django_app_settings.get(app_label, {})
-        )
-        # update with model config
-        hierarchy_settings_config.update(
-            django_app_settings.get(f"{app_label}.{model_name}", {})
-        )
-        # update with field config
-        hierarchy_settings_config.update(
-            django_app_settings.get(
-                f"{app_label}.{model_name}.{field_name}", {}
-            )
+        return merge_settings_config(
+            django_app_settings,
+            model_class._meta.app_label,
+            model_class._meta.object_name,
+            field_name,
         )
-        return hierarchy_settings_config
 
     def get_field_config(self, field_class: Field) -> dict[str, Any]:
         """
@@ -204,6 +367,7 @@ class FieldConfig:
             "choice_model",
             "choice_filters",
             "only_use_custom_colors",
+            "validate_choices",
         ]
         return {
             key: getattr(field_class, key)
@@ -0,0 +1,90 @@
+/* Search the choices of ColorAutocompleteWidget with the autocomplete view. */
+(function () {
+  "use strict";
+
+  function search(select, query, page) {
+    const url = new URL(select.dataset.autocompleteUrl, window.location.href);
+    url.searchParams.set("q", query);
+    url.searchParams.set("page", page);
+    return fetch(url, { headers: { Accept: "application/json" } }).then(
+      function (response) {
+        return response.json();
+      },
+    );
+  }
+
+  function render(select, data, page) {
+    const keep = Array.from(select.options).filter(function (option) {
+      return option.selected || (option.value === "" && !option.dataset.more);
+    });
+    if (page === 1) {
+      select.replaceChildren.apply(select, keep);
+    } else if (
+      select.lastElementChild &&
+      select.lastElementChild.dataset.more
+    ) {
+      select.removeChild(select.lastElementChild);
+    }
+    const kept = new Set(
+      keep.map(function (option) {
+        return option.value;
+      }),
+    );
+    data.results.forEach(function (result) {
+      if (!kept.has(result.id)) {
+        select.appendChild(new Option(result.text, result.id));
+      }
+    });
+    if (data.pagination.more) {
+      const more = new Option("…", "");
+      more.disabled = true;
+      more.dataset.more = "true";
+      select.appendChild(more);
+    }
+  }
+
+  function bind(select) {
+    const input = select.parentNode.querySelector(".color-autocomplete-search");
+    let timer = null;
+    let page = 1;
+    let pending = false;
+    const load = function (nextPage) {
+      pending = true;
+      search(select, input ? input.value : "", nextPage)
+        .then(function (data) {
+          page = nextPage;
+          render(select, data, nextPage);
+        })
+        .finally(function () {
+          pending = false;
+        });
+    };
+    if (input) {
+      input.addEventListener("input", function () {
+        window.clearTimeout(timer);
+        timer = window.setTimeout(function () {
+          load(1);
+        }, 250);
+      });
+    }
+    select.addEventListener("focus", function () {
+      if (page === 1 && select.options.length <= 1) {
+        load(1);
+      }
+    });
+    select.addEventListener("scroll", function () {
+      const last = select.lastElementChild;
+      const atEnd =
+        select.scrollTop + select.clientHeight >= select.scrollHeight - 4;
+      if (atEnd && last && last.dataset.more && !pending) {
+        load(page + 1);
+      }
+    });
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document
+      .querySelectorAll("select[data-color-autocomplete]")
+      .forEach(bind);
+  });
+})();
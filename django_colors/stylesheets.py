@@ -0,0 +1,129 @@
+"""Derive palettes from the color classes of compiled stylesheets."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+# innermost rules only, so the rules nested in at-rules are found too
+RULE_RE = re.compile(r"([^{}]*)\{([^{}]*)\}")
+COLOR_CLASS_RE = re.compile(r"\.(bg|text)-([A-Za-z0-9][A-Za-z0-9-]*)")
+COLOR_PROPERTIES = {
+    "bg": {"background-color", "background"},
+    "text": {"color"},
+}
+
+
+def get_properties(declarations: str) -> set[str]:
+    """
+    Get the property names set by a declaration block.
+
+    :argument declarations: The text between the braces of a rule
+    :returns: Set of lowercased property names
+    """
+    return {
+        declaration.split(":", 1)[0].strip().lower()
+        for declaration in declarations.split(";")
+        if ":" in declaration
+    }
+
+
+class ColorClassScanner:
+    """
+    Incremental scanner collecting bg-* and text-* color classes.
+
+    Feed the stylesheet in chunks of any size; only the unfinished rule
+    (or comment) at the end of a chunk is kept between chunks. A class is
+    collected when a rule selects it on its own (".bg-primary", not
+    ".btn .bg-primary" or ".bg-primary:hover") and sets a background color
+    for bg-* or a color for text-*, which leaves out utilities like
+    text-center or bg-gradient.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty scanner.
+
+        :returns: None
+        """
+        self._carry = ""
+        self.colors: dict[str, dict[str, None]] = {"bg": {}, "text": {}}
+
+    def feed(self, chunk: str) -> None:
+        """
+        Scan the next chunk of the stylesheet.
+
+        :argument chunk: The next part of the stylesheet text
+        :returns: None
+        """
+        text = self._carry + chunk
+        tail = ""
+        comment_start = text.rfind("/*")
+        if comment_start != -1 and "*/" not in text[comment_start + 2 :]:
+            text, tail = text[:comment_start], text[comment_start:]
+        text = COMMENT_RE.sub("", text)
+        end = 0
+        for match in RULE_RE.finditer(text):
+            self.add_rule(match.group(1), match.group(2))
+            end = match.end()
+        self._carry = text[end:] + tail
+
+    def add_rule(self, selectors: str, declarations: str) -> None:
+        """
+        Collect the color classes selected by a rule.
+
+        :argument selectors: The selector list of the rule
+        :argument declarations: The declaration block of the rule
+        :returns: None
+        """
+        if "bg-" not in selectors and "text-" not in selectors:
+            return
+        properties = None
+        for selector in selectors.split(","):
+            match = COLOR_CLASS_RE.fullmatch(selector.strip())
+            if match is None:
+                continue
+            if properties is None:
+                properties = get_properties(declarations)
+            prefix, name = match.groups()
+            if properties & COLOR_PROPERTIES[prefix]:
+                self.colors[prefix].setdefault(name)
+
+    def close(self) -> list[tuple[str, str, str, str]]:
+        """
+        Finish scanning and pair the collected classes.
+
+        :returns: List of (value, label, background_css, text_css) rows for
+            the colors with both a bg-* and a text-* class, in the order
+            their bg-* class appears
+        """
+        self._carry = ""
+        return [
+            (name, get_label(name), f"bg-{name}", f"text-{name}")
+            for name in self.colors["bg"]
+            if name in self.colors["text"]
+        ]
+
+
+def get_label(name: str) -> str:
+    """
+    Get a label for a color class name.
+
+    :argument name: The color name, such as "red-500"
+    :returns: The label, such as "Red 500"
+    """
+    return name.replace("-", " ").title()
+
+
+def scan_stylesheet(chunks: Iterable[str]) -> list[tuple[str, str, str, str]]:
+    """
+    Scan a stylesheet for color classes.
+
+    :argument chunks: The stylesheet text in chunks of any size
+    :returns: List of (value, label, background_css, text_css) rows
+    """
+    scanner = ColorClassScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.close()
@@ -0,0 +1,46 @@
+"""Models shared by the tests that need database tables."""
+
+from django.db import models
+
+from django_colors.field_type import FieldType
+from django_colors.fields import ColorModelField
+from django_colors.models import ColorModel
+from django_colors.query import ColorQuerySet
+
+
+class Palette(ColorModel):
+    """Choice model of the shared test models."""
+
+    class Meta:
+        """Meta class for testing."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """Return string representation of the model."""
+        return self.name
+
+
+class Thing(models.Model):
+    """Model with color fields using the shared palette."""
+
+    background = ColorModelField(model=Palette, blank=True, null=True)
+    text = ColorModelField(
+        model=Palette, color_type=FieldType.TEXT, blank=True
+    )
+    plain = ColorModelField(blank=True)
+    title = models.CharField(max_length=20, blank=True)
+    parent = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.CASCADE
+    )
+
+    objects = ColorQuerySet.as_manager()
+
+    class Meta:
+        """Meta class for testing."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """Return string representation of the model."""
+        return self.title
@@ -0,0 +1,193 @@
+"""Tests for the admin module."""
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from django_colors.admin import REQUEST_COUNTS_ATTR, ColorListFilter
+from django_colors.tests.models import Thing
+
+
+class ThingAdmin(admin.ModelAdmin):
+    """Model admin filtering by the color field."""
+
+    list_filter = ["background"]
+
+
+@pytest.fixture
+def tables(palette_tables: pytest.fixture) -> None:
+    """
+    Create the tables of the shared test models with some rows.
+
+    :param palette_tables: The shared test tables fixture
+    :return: None
+    """
+    palette_tables(("Brand", "bg-brand", "text-brand"))
+    for color in ["bg-brand", "bg-brand", "bg-primary", "bg-gone", "", None]:
+        Thing.objects.create(background=color)
+
+
+@pytest.fixture
+def model_admin() -> ThingAdmin:
+    """
+    Create the model admin for the test model.
+
+    :return: ThingAdmin instance
+    """
+    return ThingAdmin(Thing, admin.AdminSite())
+
+
+def get_changelist(
+    model_admin: admin.ModelAdmin, query: dict | None = None
+) -> admin.views.main.ChangeList:
+    """
+    Build a changelist for a GET request.
+
+    :param model_admin: The model admin
+    :param query: The query parameters of the request
+    :return: The changelist
+    """
+    request = RequestFactory().get("/", query or {})
+    request.user = User(is_superuser=True, is_staff=True, is_active=True)
+    return model_admin.get_changelist_instance(request)
+
+
+def get_displays(changelist: admin.views.main.ChangeList) -> dict:
+    """
+    Get the choices of the color filter keyed by their display.
+
+    :param changelist: The changelist
+    :return: Dict mapping displays to choice dicts
+    """
+    (list_filter,) = changelist.filter_specs
+    return {
+        str(choice["display"]): choice
+        for choice in list_filter.choices(changelist)
+    }
+
+
+class TestColorListFilter:
+    """Tests for ColorListFilter."""
+
+    def test_registered_for_color_fields(
+        self, tables: None, model_admin: ThingAdmin
+    ) -> None:
+        """
+        Test that color fields use ColorListFilter by default.
+
+        :param tables: The test tables fixture
+        :param model_admin: The model admin fixture
+        :return: None
+        """
+        changelist = get_changelist(model_admin)
+        (list_filter,) = changelist.filter_specs
+        assert isinstance(list_filter, ColorListFilter)
+
+    def test_choices_with_counts(
+        self, tables: None, model_admin: ThingAdmin
+    ) -> None:
+        """
+        Test that every color is listed with its row count.
+
+        :param tables: The test tables fixture
+        :param model_admin: The model admin fixture
+        :return: None
+        """
+        displays = get_displays(get_changelist(model_admin))
+        assert displays["All"]["selected"]
+        assert "Brand (2)" in displays
+        assert "Blue (1)" in displays
+        assert "Gray (0)" in displays
+        assert "bg-gone (1)" in displays
+        assert "- (1)" in displays
+
+    def test_empty_and_null_entries(
+        self, tables: None, model_admin: ThingAdmin
+    ) -> None:
+        """
+        Test that empty strings and NULL get separate entries.
+
+        :param tables: The test tables fixture
+        :param model_admin: The model admin fixture
+        :return: None
+        """
+        changelist = get_changelist(model_admin)
+        (list_filter,) = changelist.filter_specs
+        choices = list(list_filter.choices(changelist))
+        assert "background__exact=" in choices[-2]["query_string"]
+        assert "background__isnull=True" in choices[-1]["query_string"]
+
+    def test_selected_choice_filters_rows(
+        self, tables: None, model_admin: ThingAdmin
+    ) -> None:
+        """
+        Test that selecting a color filters the changelist.
+
+        :param tables: The test tables fixture
+        :param model_admin: The model admin fixture
+        :return: None
+        """
+        changelist = get_changelist(
+            model_admin, {"background__exact": "bg-brand"}
+        )
+        displays = get_displays(changelist)
+        assert displays["Brand (2)"]["selected"]
+        assert not displays["All"]["selected"]
+        assert changelist.queryset.count() == 2
+
+    def test_null_choice_selected(
+        self, tables: None, model_admin: ThingAdmin
+    ) -> None:
+        """
+        Test that the NULL entry is selected when filtering on NULL.
+
+        :param tables: The test tables fixture
+        :param model_admin: The model admin fixture
+        :return: None
+        """
+        changelist = get_changelist(
+            model_admin, {"background__isnull": "True"}
+        )
+        (list_filter,) = changelist.filter_specs
+        choices = list(list_filter.choices(changelist))
+        assert choices[-1]["selected"]
+        assert changelist.queryset.count() == 1
+
+    def test_counts_from_one_query_per_request(
+        self, tables: None, model_admin: ThingAdmin
+    ) -> None:
+        """
+        Test that the counts are computed once per request.
+
+        :param tables: The test tables fixture
+        :param model_admin: The model admin fixture
+        :return: None
+        """
+        changelist = get_changelist(model_admin)
+        (list_filter,) = changelist.filter_specs
+        with CaptureQueriesContext(connection) as queries:
+            counts = list_filter.get_counts()
+        group_queries = [
+            query for query in queries if "GROUP BY" in query["sql"]
+        ]
+        assert len(group_queries) == 1
+        assert counts["bg-brand"] == 2
+        assert counts[None] == 1
+        with CaptureQueriesContext(connection) as queries:
+            assert list_filter.get_counts() is counts
+            assert (
+                ColorListFilter(
+                    Thing._meta.get_field("background"),
+                    list_filter.request,
+                    {},
+                    Thing,
+                    model_admin,
+                    "background",
+                ).get_counts()
+                is counts
+            )
+        assert len(queries) == 0
+        assert REQUEST_COUNTS_ATTR in list_filter.request.__dict__
@@ -0,0 +1,925 @@
+"""Tests for the cache module."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from django.apps import apps
+from django.contrib.auth.models import Group
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+
+from django_colors.cache import (
+    ChoicesCache,
+    SharedChoicesCache,
+    choices_cache,
+    choices_scope,
+    freeze,
+    get_changed_models,
+    get_request_choices,
+    make_key,
+    make_shared_key,
+    serialize,
+)
+from django_colors.color_definitions import (
+    BootstrapColorChoices,
+    CompactColorChoices,
+)
+from django_colors.field_type import FieldType
+from django_colors.fields import ColorModelField
+
+
+class TestFreeze:
+    """Test the freeze and make_key functions."""
+
+    def test_freeze_dict_is_order_independent(self) -> None:
+        """
+        Test that dicts with the same items freeze to the same value.
+
+        :return: None
+        """
+        assert freeze({"a": 1, "b": [1, 2]}) == freeze({"b": [1, 2], "a": 1})
+
+    def test_freeze_nested_values(self) -> None:
+        """
+        Test that nested values are frozen recursively.
+
+        :return: None
+        """
+        frozen = freeze({"a": {"b": [1, {2}]}})
+        assert frozen == (("a", (("b", (1, frozenset({2}))),)),)
+        hash(frozen)
+
+    def test_make_key_unhashable(self) -> None:
+        """
+        Test that make_key returns None for unhashable parts.
+
+        :return: None
+        """
+
+        class Unhashable:
+            __hash__ = None
+
+        assert make_key({"a": Unhashable()}) is None
+
+    def test_make_key_hashable(self) -> None:
+        """
+        Test that make_key returns a tuple for hashable parts.
+
+        :return: None
+        """
+        assert make_key("a", {"b": 1}, ("c",)) == ("a", (("b", 1),), ("c",))
+
+
+class TestSharedKeys:
+    """Test the serialize and make_shared_key functions."""
+
+    def test_model_instances_keyed_by_pk(self) -> None:
+        """
+        Test that instances with the same str() get different keys.
+
+        :return: None
+        """
+        first = make_key({"group": Group(pk=1, name="acme")})
+        second = make_key({"group": Group(pk=2, name="acme")})
+
+        assert make_shared_key(first) != make_shared_key(second)
+        assert make_shared_key(first) == make_shared_key(
+            make_key({"group": Group(pk=1, name="renamed")})
+        )
+        assert "instance:auth.group:1" in make_shared_key(first)
+
+    def test_sets_are_sorted(self) -> None:
+        """
+        Test that set items are serialized in a stable order.
+
+        :return: None
+        """
+        assert serialize(frozenset({"b", "a", "c"})) == "{'a','b','c'}"
+
+    def test_classes_enums_and_expressions(self) -> None:
+        """
+        Test the serialization of classes, enums and expressions.
+
+        :return: None
+        """
+        assert serialize(Group) == "model:auth.group"
+        assert serialize(BootstrapColorChoices) == (
+            "class:django_colors.color_definitions.BootstrapColorChoices"
+        )
+        assert serialize(FieldType.TEXT) == "FieldType.TEXT"
+        assert serialize(F("name")) == serialize(F("name"))
+        assert serialize(F("name")) != serialize(F("label"))
+
+    def test_unstable_values_not_shared(self) -> None:
+        """
+        Test that values without a stable serialization are not shared.
+
+        :return: None
+        """
+
+        class Opaque:
+            pass
+
+        assert make_shared_key(make_key({"a": Opaque()})) is None
+        assert make_shared_key((Group(name="unsaved"),)) is None
+        assert make_shared_key((Opaque,)) is None
+
+    def test_generated_palettes_keyed_by_content(self) -> None:
+        """
+        Test that generated palettes with the same name are told apart.
+
+        :return: None
+        """
+        first = CompactColorChoices.from_options(
+            "colors", [("a", "A", "bg-a", "text-a")]
+        )
+        edited = CompactColorChoices.from_options(
+            "colors", [("a", "B", "bg-a", "text-a")]
+        )
+        same = CompactColorChoices.from_options(
+            "other", [("a", "A", "bg-a", "text-a")]
+        )
+
+        assert make_shared_key((first,)) != make_shared_key((edited,))
+        assert make_shared_key((first,)) == make_shared_key((same,))
+
+
+class TestChoicesCache:
+    """Test the ChoicesCache class."""
+
+    def test_set_and_get(self, color_model: pytest.fixture) -> None:
+        """
+        Test that stored choices are returned as a tuple.
+
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = ChoicesCache()
+        stored = cache.set(color_model, ("key",), [("bg-red", "Red")])
+
+        assert stored == (("bg-red", "Red"),)
+        assert cache.get(color_model, ("key",)) == (("bg-red", "Red"),)
+        assert cache.get(color_model, ("other",)) is None
+        assert cache.get(None, ("key",)) is None
+
+    def test_set_with_stale_generation(
+        self, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that choices built before an invalidation are not stored.
+
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = ChoicesCache()
+        version = cache.version(color_model)
+        cache.invalidate(color_model)
+        cache.set(color_model, ("key",), [("bg-red", "Red")], version)
+
+        assert cache.get(color_model, ("key",)) is None
+
+    def test_invalidate_only_affects_model(
+        self, color_model: pytest.fixture, mock_model_class: pytest.fixture
+    ) -> None:
+        """
+        Test that invalidating one model keeps other entries.
+
+        :param color_model: The color model fixture
+        :param mock_model_class: The mock model class fixture
+        :return: None
+        """
+        cache = ChoicesCache()
+        cache.set(color_model, ("key",), [("bg-red", "Red")])
+        cache.set(mock_model_class, ("key",), [("bg-blue", "Blue")])
+
+        cache.invalidate(color_model)
+
+        assert cache.get(color_model, ("key",)) is None
+        assert cache.get(mock_model_class, ("key",)) == (("bg-blue", "Blue"),)
+
+    def test_clear(self, color_model: pytest.fixture) -> None:
+        """
+        Test that clear drops every entry.
+
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = ChoicesCache()
+        cache.set(color_model, ("key",), [("bg-red", "Red")])
+        cache.set(None, ("key",), [("bg-blue", "Blue")])
+
+        cache.clear()
+
+        assert cache.get(color_model, ("key",)) is None
+        assert cache.get(None, ("key",)) is None
+
+    @pytest.mark.parametrize("signal", [post_save, post_delete])
+    def test_signals_invalidate_model(
+        self, color_model: pytest.fixture, signal: pytest.fixture
+    ) -> None:
+        """
+        Test that model signals invalidate the cached entries.
+
+        :param color_model: The color model fixture
+        :param signal: The signal to send
+        :return: None
+        """
+        cache = ChoicesCache()
+        cache.set(color_model, ("key",), [("bg-red", "Red")])
+
+        signal.send(sender=color_model, instance=color_model())
+
+        assert cache.get(color_model, ("key",)) is None
+
+    def test_signals_ignore_other_models(
+        self, color_model: pytest.fixture, mock_model_class: pytest.fixture
+    ) -> None:
+        """
+        Test that signals from unrelated models keep the cached entries.
+
+        :param color_model: The color model fixture
+        :param mock_model_class: The mock model class fixture
+        :return: None
+        """
+        cache = ChoicesCache()
+        cache.set(color_model, ("key",), [("bg-red", "Red")])
+
+        post_save.send(sender=mock_model_class, instance=mock_model_class())
+
+        assert cache.get(color_model, ("key",)) == (("bg-red", "Red"),)
+
+
+class TestChoicesCacheTransactions:
+    """Test the ChoicesCache invalidation around transactions."""
+
+    def test_invalidated_again_on_commit(
+        self, color_model_table: pytest.fixture
+    ) -> None:
+        """
+        Test that choices cached before the commit are dropped after it.
+
+        :param color_model_table: The color model table fixture
+        :return: None
+        """
+        cache = ChoicesCache()
+        cache.watch(color_model_table)
+
+        with transaction.atomic():
+            color_model_table.objects.create(
+                name="Brand", background_css="bg-brand", text_css="text-brand"
+            )
+            # another reader caches the rows it saw before the commit
+            cache.set(
+                color_model_table,
+                ("key",),
+                [],
+                cache.version(color_model_table),
+            )
+            assert cache.get(color_model_table, ("key",)) == ()
+
+        assert cache.get(color_model_table, ("key",)) is None
+
+
+@pytest.mark.django_db
+class TestColorModelFieldChoicesCache:
+    """Test the choices cache integration with ColorModelField."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        """
+        Clear the shared choices cache around each test.
+
+        :return: None
+        """
+        choices_cache.clear()
+        yield
+        choices_cache.clear()
+
+    def get_field(
+        self,
+        mock_field_config: pytest.fixture,
+        color_model: pytest.fixture,
+        cache_choices: bool = True,
+    ) -> ColorModelField:
+        """
+        Create a field using the mocked field config.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model to use for choices
+        :param cache_choices: Whether the choices cache is enabled
+        :return: The configured field
+        """
+        field = ColorModelField()
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": {},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": False,
+            "cache_choices": cache_choices,
+            "cache_alias": None,
+            "sort_in_database": False,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=color_model
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+        return field
+
+    def get_manager(self) -> MagicMock:
+        """
+        Create a mocked objects manager returning custom choices.
+
+        :return: The mocked manager
+        """
+        mock_manager = MagicMock()
+        # fmt: off
+        mock_manager.\
+        filter.\
+        return_value.\
+        distinct.\
+        return_value.\
+        order_by.\
+        return_value.\
+        values_list.\
+        return_value = [("bg-zebra", "Zebra"), ("bg-apple", "Apple")]
+        # fmt: on
+        return mock_manager
+
+    def test_get_choices_uses_cache(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that repeated calls only query the choice model once.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = self.get_manager()
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            first = field.get_choices()
+            second = field.get_choices()
+
+        assert first == second
+        assert isinstance(second, list)
+        mock_manager.filter.assert_called_once_with()
+
+    def test_get_choices_cache_disabled(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that the choice model is queried every call when disabled.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = self.get_manager()
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(
+                mock_field_config, color_model, cache_choices=False
+            )
+
+            field.get_choices()
+            field.get_choices()
+
+        assert mock_manager.filter.call_count == 2
+
+    def test_get_choices_keyed_by_parameters(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that different parameters are cached separately.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = self.get_manager()
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            by_label = field.get_choices(sort_by="label")
+            by_value = field.get_choices(sort_by="value")
+            with_blank = field.get_choices(sort_by="label", include_blank=True)
+
+        assert by_label != by_value
+        assert with_blank[1:] == by_label
+        assert mock_manager.filter.call_count == 3
+
+    def test_mutating_result_does_not_change_cache(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that sorting a returned list never changes the cached choices.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = self.get_manager()
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            first = field.get_choices(sort_by="label")
+            expected = list(first)
+            first.sort(key=lambda choice: choice[0], reverse=True)
+            first.insert(0, ("", "---------"))
+
+            assert field.get_choices(sort_by="label") == expected
+
+    def test_save_invalidates_cache(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that saving a choice model row rebuilds the choices.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = self.get_manager()
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            field.get_choices()
+            post_save.send(sender=color_model, instance=color_model())
+            field.get_choices()
+
+        assert mock_manager.filter.call_count == 2
+
+
+@pytest.fixture
+def locmem_caches(settings: pytest.fixture) -> None:
+    """
+    Configure a local memory cache for the shared choices cache.
+
+    :param settings: The pytest-django settings fixture
+    :return: None
+    """
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "colors": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "colors",
+        },
+    }
+    settings.COLORS_APP_CONFIG = {"default": {"cache_alias": "colors"}}
+    caches["colors"].clear()
+
+
+class TestSharedChoicesCache:
+    """Test the SharedChoicesCache class."""
+
+    def test_set_and_get(
+        self, locmem_caches: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that stored choices are returned for the same version.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+        version = cache.version(color_model)
+        cache.set(color_model, ("key",), [("bg-red", "Red")], version)
+
+        assert cache.get(color_model, ("key",), version) == (
+            ("bg-red", "Red"),
+        )
+        assert cache.get(color_model, ("other",), version) is None
+
+    def test_unstable_key_not_shared(
+        self, locmem_caches: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that keys without a stable serialization are never stored.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+
+        class Opaque:
+            pass
+
+        cache = SharedChoicesCache("colors")
+        version = cache.version(color_model)
+        key = make_key({"owner": Opaque()})
+
+        stored = cache.set(color_model, key, [("bg-red", "Red")], version)
+
+        assert stored == (("bg-red", "Red"),)
+        assert cache.get(color_model, key, version) is None
+        assert cache.get_entry_key(color_model, key, version) is None
+
+    def test_version_is_stable(
+        self, locmem_caches: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that the version is only initialized once.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+
+        assert cache.version(color_model) == cache.version(color_model)
+        assert SharedChoicesCache("colors").version(
+            color_model
+        ) == cache.version(color_model)
+
+    def test_bump_expires_entries(
+        self, locmem_caches: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that bumping the version hides the old entries.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+        version = cache.version(color_model)
+        cache.set(color_model, ("key",), [("bg-red", "Red")], version)
+
+        cache.bump(color_model)
+        new_version = cache.version(color_model)
+
+        assert new_version != version
+        assert cache.get(color_model, ("key",), new_version) is None
+
+    def test_bump_missing_version(
+        self, locmem_caches: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that bumping a missing version initializes it.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+        cache.bump(color_model)
+
+        assert caches["colors"].get(cache.get_version_key(color_model))
+
+    def test_filebased_backend(
+        self,
+        settings: pytest.fixture,
+        tmp_path: pytest.fixture,
+        color_model: pytest.fixture,
+    ) -> None:
+        """
+        Test the shared cache with the file based cache backend.
+
+        :param settings: The pytest-django settings fixture
+        :param tmp_path: The temporary directory fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+            "files": {
+                "BACKEND": (
+                    "django.core.cache.backends.filebased.FileBasedCache"
+                ),
+                "LOCATION": str(tmp_path),
+            },
+        }
+        cache = SharedChoicesCache("files")
+        version = cache.version(color_model)
+        cache.set(color_model, ("key",), [("bg-red", "Red")], version)
+
+        assert cache.get(color_model, ("key",), version) == (
+            ("bg-red", "Red"),
+        )
+        cache.bump(color_model)
+        assert cache.version(color_model) == version + 1
+
+    def test_signal_bumps_color_model_version(
+        self, locmem_caches: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that saving a ColorModel subclass bumps its version.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+        version = cache.version(color_model)
+
+        post_save.send(sender=color_model, instance=color_model())
+
+        assert cache.version(color_model) == version + 1
+
+    def test_version_bumped_again_on_commit(
+        self,
+        locmem_caches: pytest.fixture,
+        color_model_table: pytest.fixture,
+    ) -> None:
+        """
+        Test that entries cached before the commit expire after it.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model_table: The color model table fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+
+        with transaction.atomic():
+            color_model_table.objects.create(
+                name="Brand", background_css="bg-brand", text_css="text-brand"
+            )
+            # another worker caches the rows it saw before the commit
+            version = cache.version(color_model_table)
+            cache.set(color_model_table, ("key",), [], version)
+
+        assert cache.version(color_model_table) == version + 1
+        assert cache.get(color_model_table, ("key",), version + 1) is None
+
+    def test_signal_ignores_other_models(
+        self,
+        locmem_caches: pytest.fixture,
+        color_model: pytest.fixture,
+        mock_model_class: pytest.fixture,
+    ) -> None:
+        """
+        Test that saving an unrelated model keeps the versions.
+
+        :param locmem_caches: The locmem caches fixture
+        :param color_model: The color model fixture
+        :param mock_model_class: The mock model class fixture
+        :return: None
+        """
+        cache = SharedChoicesCache("colors")
+        version = cache.version(color_model)
+        other_version = cache.version(mock_model_class)
+
+        post_save.send(sender=mock_model_class, instance=mock_model_class())
+
+        assert cache.version(color_model) == version
+        assert cache.version(mock_model_class) == other_version
+
+    def test_signal_bumps_tracked_models(
+        self,
+        locmem_caches: pytest.fixture,
+        mock_model_class: pytest.fixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that choice models used with the cache are tracked.
+
+        :param locmem_caches: The locmem caches fixture
+        :param mock_model_class: The mock model class fixture
+        :param monkeypatch: The pytest monkeypatch fixture
+        :return: None
+        """
+        monkeypatch.setattr("django_colors.cache.tracked_models", set())
+        cache = SharedChoicesCache("colors")
+        version = cache.version(mock_model_class)
+        cache.set(mock_model_class, ("key",), [], version)
+
+        post_delete.send(sender=mock_model_class, instance=mock_model_class())
+
+        assert cache.version(mock_model_class) == version + 1
+
+    def test_choice_models_tracked_when_ready(
+        self,
+        locmem_caches: pytest.fixture,
+        mock_model_class: pytest.fixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that choice models of fields are tracked without caching.
+
+        :param locmem_caches: The locmem caches fixture
+        :param mock_model_class: The mock model class fixture
+        :param monkeypatch: The pytest monkeypatch fixture
+        :return: None
+        """
+        monkeypatch.setattr("django_colors.cache.tracked_models", set())
+        color_field = MagicMock()
+        color_field.field_config.choice_model = mock_model_class
+        broken_field = MagicMock()
+        type(broken_field).field_config = PropertyMock(
+            side_effect=KeyError("PURPLE")
+        )
+        with patch(
+            "django_colors.checks.get_color_fields",
+            return_value=[broken_field, color_field],
+        ):
+            apps.get_app_config("django_colors").ready()
+        cache = SharedChoicesCache("colors")
+        version = cache.version(mock_model_class)
+
+        post_save.send(sender=mock_model_class, instance=mock_model_class())
+
+        assert cache.version(mock_model_class) == version + 1
+
+    def test_get_changed_models_m2m(
+        self, color_model: pytest.fixture, mock_model_class: pytest.fixture
+    ) -> None:
+        """
+        Test that m2m_changed affects the instance and related model.
+
+        :param color_model: The color model fixture
+        :param mock_model_class: The mock model class fixture
+        :return: None
+        """
+        changed = get_changed_models(
+            mock_model_class,
+            instance=mock_model_class(),
+            model=color_model,
+            pk_set={1},
+        )
+
+        assert changed == {color_model}
+
+
+@pytest.mark.django_db
+class TestColorModelFieldSharedCache:
+    """Test the shared cache integration with ColorModelField."""
+
+    def test_get_choices_uses_shared_cache(
+        self,
+        locmem_caches: pytest.fixture,
+        mock_field_config: pytest.fixture,
+        color_model: pytest.fixture,
+    ) -> None:
+        """
+        Test that the shared cache is used and expired by signals.
+
+        :param locmem_caches: The locmem caches fixture
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        # fmt: off
+        mock_manager.\
+        filter.\
+        return_value.\
+        distinct.\
+        return_value.\
+        order_by.\
+        return_value.\
+        values_list.\
+        return_value = [("bg-zebra", "Zebra")]
+        # fmt: on
+        with patch.object(color_model, "objects", mock_manager):
+            field = ColorModelField()
+            mock_field_config.get.side_effect = lambda key: {
+                "choice_filters": {},
+                "color_type": FieldType.BACKGROUND,
+                "only_use_custom_colors": False,
+                "cache_alias": "colors",
+                "cache_timeout": 60,
+                "sort_in_database": False,
+            }[key]
+            type(mock_field_config).choice_model = PropertyMock(
+                return_value=color_model
+            )
+            type(mock_field_config).default_color_choices = PropertyMock(
+                return_value=BootstrapColorChoices
+            )
+            field.field_config = mock_field_config
+
+            assert isinstance(field.get_choices_cache(), SharedChoicesCache)
+            first = field.get_choices()
+            assert field.get_choices() == first
+            assert mock_manager.filter.call_count == 1
+
+            post_save.send(sender=color_model, instance=color_model())
+            field.get_choices()
+            assert mock_manager.filter.call_count == 2
+
+
+class TestChoicesScope:
+    """Test the choices_scope context manager."""
+
+    def test_no_scope(self) -> None:
+        """
+        Test that nothing is memoized outside a scope.
+
+        :return: None
+        """
+        assert get_request_choices() is None
+
+    def test_scope_is_reset(self) -> None:
+        """
+        Test that the memo is only available inside the scope.
+
+        :return: None
+        """
+        with choices_scope() as request_choices:
+            assert get_request_choices() is request_choices
+            with choices_scope() as nested_choices:
+                assert get_request_choices() is nested_choices
+            assert get_request_choices() is request_choices
+        assert get_request_choices() is None
+
+    @pytest.mark.django_db
+    def test_get_choices_memoized_in_scope(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that get_choices only queries once per scope.
+
+        :param mock_field_config: The mocked field config
+        :param color_model: The color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        # fmt: off
+        mock_manager.\
+        filter.\
+        return_value.\
+        distinct.\
+        return_value.\
+        order_by.\
+        return_value.\
+        values_list.\
+        return_value = [("bg-zebra", "Zebra")]
+        # fmt: on
+        with patch.object(color_model, "objects", mock_manager):
+            field = ColorModelField()
+            mock_field_config.get.side_effect = lambda key: {
+                "choice_filters": {},
+                "color_type": FieldType.BACKGROUND,
+                "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
+            }[key]
+            type(mock_field_config).choice_model = PropertyMock(
+                return_value=color_model
+            )
+            type(mock_field_config).default_color_choices = PropertyMock(
+                return_value=BootstrapColorChoices
+            )
+            field.field_config = mock_field_config
+
+            with choices_scope():
+                first = field.get_choices()
+                first.append(("bg-extra", "Extra"))
+                second = field.get_choices()
+                field.get_choices(additional_filters={"name": "Zebra"})
+            assert mock_manager.filter.call_count == 2
+
+            with choices_scope():
+                field.get_choices()
+            assert mock_manager.filter.call_count == 3
+
+        assert ("bg-extra", "Extra") not in second
+
+    def test_memo_dropped_on_save(
+        self,
+        mock_field_config: pytest.fixture,
+        color_model_table: pytest.fixture,
+    ) -> None:
+        """
+        Test that saving a choice model row drops its memoized choices.
+
+        :param mock_field_config: The mocked field config
+        :param color_model_table: The color model table fixture
+        :return: None
+        """
+        field = ColorModelField()
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": {},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": True,
+            "cache_alias": None,
+            "cache_choices": False,
+            "sort_in_database": False,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=color_model_table
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+
+        with choices_scope() as request_choices:
+            assert field.get_choices() == []
+            assert request_choices
+            color_model_table.objects.create(
+                name="Brand", background_css="bg-brand", text_css="text-brand"
+            )
+            assert not request_choices
+            assert field.get_choices() == [("bg-brand", "Brand")]
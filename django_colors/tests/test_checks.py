@@ -0,0 +1,335 @@
+"""Tests for the checks module."""
+
+from unittest.mock import Mock, PropertyMock
+
+import pytest
+from django.core import checks
+from django.db import models
+from django.test import override_settings
+
+from django_colors.checks import (
+    check_choice_model_indexes,
+    check_field_config,
+    check_field_configs,
+    check_field_indexes,
+    get_indexed_fields,
+    get_lookup_fields,
+)
+from django_colors.fields import ColorModelField
+from django_colors.models import ColorModel, IndexedColorModel
+
+
+class IndexedPalette(IndexedColorModel):
+    """Choice model with the shipped indexes."""
+
+    active = models.BooleanField(default=True)
+    group = models.CharField(max_length=20, db_index=True)
+    owner = models.ForeignKey("auth.User", null=True, on_delete=models.CASCADE)
+
+    class Meta(IndexedColorModel.Meta):
+        """Meta class for testing."""
+
+        app_label = "test_app"
+        unique_together = [("group", "active")]
+
+
+class PlainPalette(ColorModel):
+    """Choice model without indexes."""
+
+    active = models.BooleanField(default=True)
+
+    class Meta:
+        """Meta class for testing."""
+
+        app_label = "test_app"
+
+
+class PaletteUser(models.Model):
+    """Model using a color field with filters and ordering."""
+
+    color = ColorModelField(
+        model=PlainPalette,
+        model_filters={"active": True, "name__startswith": "b"},
+        ordering=("-name",),
+    )
+
+    class Meta:
+        """Meta class for testing."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """Return string representation of the model."""
+        return self.color
+
+
+BAD_TYPE_CONFIG = {
+    "test_app.MisconfiguredThing.bad_type": {"color_type": "PURPLE"},
+}
+
+
+class MisconfiguredThing(models.Model):
+    """Model with valid and invalid color field configurations."""
+
+    valid = ColorModelField(model=PlainPalette)
+    bad_model = ColorModelField(model="test_app.MissingPalette")
+    bad_palette = ColorModelField(default_color_choices="missing")
+    bad_both = ColorModelField(
+        model="missing", default_color_choices="missing.Palette"
+    )
+    bad_type = ColorModelField()
+
+    class Meta:
+        """Meta class for testing."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """Return string representation of the model."""
+        return self.valid
+
+
+class TestIndexedColorModel:
+    """Test the IndexedColorModel class."""
+
+    def test_is_abstract_color_model(self) -> None:
+        """
+        Test that IndexedColorModel is an abstract ColorModel.
+
+        :return: None
+        """
+        assert issubclass(IndexedColorModel, ColorModel)
+        assert IndexedColorModel._meta.abstract is True
+
+    def test_indexes_are_named_per_model(self) -> None:
+        """
+        Test that subclasses get their own named indexes.
+
+        :return: None
+        """
+        assert [index.fields for index in IndexedPalette._meta.indexes] == [
+            ["name", "background_css", "text_css"],
+            ["background_css"],
+            ["text_css"],
+        ]
+        names = {index.name for index in IndexedPalette._meta.indexes}
+        assert len(names) == 3
+        assert all(name.startswith("test_app_") for name in names)
+        assert IndexedPalette.check() == []
+
+
+class TestIndexChecks:
+    """Test the index checks."""
+
+    def test_get_indexed_fields(self) -> None:
+        """
+        Test that leading index columns are found.
+
+        :return: None
+        """
+        assert get_indexed_fields(IndexedPalette) == {
+            "id",
+            "name",
+            "background_css",
+            "text_css",
+            "group",
+            "owner",
+        }
+        assert get_indexed_fields(PlainPalette) == {"id"}
+
+    def test_get_lookup_fields(self) -> None:
+        """
+        Test that relations, unknown fields and duplicates are skipped.
+
+        :return: None
+        """
+        assert get_lookup_fields(
+            IndexedPalette,
+            [
+                "active",
+                "owner__username",
+                "pk",
+                "missing",
+                "-name",
+                "name__lower",
+                "?",
+            ],
+        ) == ["active", "name"]
+
+    def test_warns_for_unindexed_columns(self) -> None:
+        """
+        Test the warnings for a field on an unindexed choice model.
+
+        :return: None
+        """
+        field = PaletteUser._meta.get_field("color")
+
+        messages = check_field_indexes(field)
+
+        assert [message.id for message in messages] == [
+            "django_colors.W001",
+            "django_colors.W001",
+        ]
+        assert "'active'" in messages[0].msg
+        assert "'name'" in messages[1].msg
+        assert messages[0].obj is field
+        assert all(isinstance(message, checks.Warning) for message in messages)
+
+    def test_no_warnings_for_indexed_columns(
+        self, mock_field_config: pytest.fixture
+    ) -> None:
+        """
+        Test that indexed columns do not warn.
+
+        :param mock_field_config: Mock field config fixture
+        :return: None
+        """
+        field = ColorModelField(ordering=("name", "-id"))
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": {"group": "brand", "owner__is_staff": True},
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=IndexedPalette
+        )
+        field.field_config = mock_field_config
+
+        assert check_field_indexes(field) == []
+
+    def test_invalid_choice_model_is_skipped(
+        self, mock_field_config: pytest.fixture
+    ) -> None:
+        """
+        Test that unresolvable choice models are left to other checks.
+
+        :param mock_field_config: Mock field config fixture
+        :return: None
+        """
+        field = ColorModelField()
+        type(mock_field_config).choice_model = PropertyMock(
+            side_effect=ValueError("Invalid model reference")
+        )
+        field.field_config = mock_field_config
+
+        assert check_field_indexes(field) == []
+
+    def test_check_app_configs(self) -> None:
+        """
+        Test that the registered check inspects the given apps.
+
+        :return: None
+        """
+        app_config = Mock()
+        app_config.get_models.return_value = [PlainPalette, PaletteUser]
+
+        messages = check_choice_model_indexes([app_config])
+
+        assert len(messages) == 2
+        assert check_choice_model_indexes([]) == []
+
+    def test_check_is_registered(self) -> None:
+        """
+        Test that the check runs with the model checks.
+
+        :return: None
+        """
+        assert (
+            check_choice_model_indexes in checks.registry.registry.get_checks()
+        )
+
+
+class TestConfigChecks:
+    """Test the configuration checks."""
+
+    def get_ids(self, name: str) -> list[str]:
+        """
+        Get the ids of the messages for a field of MisconfiguredThing.
+
+        :param name: The name of the field
+        :return: List of message ids
+        """
+        field = MisconfiguredThing._meta.get_field(name)
+        field.field_config = None
+        return [message.id for message in check_field_config(field)]
+
+    def test_valid_config(self) -> None:
+        """
+        Test that a valid configuration is resolved and kept.
+
+        :return: None
+        """
+        field = MisconfiguredThing._meta.get_field("valid")
+
+        assert self.get_ids("valid") == []
+        assert field.field_config.choice_model is PlainPalette
+        assert "choice_model" in vars(field.field_config)
+
+    def test_invalid_choice_model(self) -> None:
+        """
+        Test that an invalid choice model reference is an error.
+
+        :return: None
+        """
+        assert self.get_ids("bad_model") == ["django_colors.E002"]
+
+    def test_invalid_palette(self) -> None:
+        """
+        Test that an invalid palette reference is an error.
+
+        :return: None
+        """
+        assert self.get_ids("bad_palette") == ["django_colors.E003"]
+
+    def test_all_errors_reported(self) -> None:
+        """
+        Test that every error of a field is reported together.
+
+        :return: None
+        """
+        assert self.get_ids("bad_both") == [
+            "django_colors.E002",
+            "django_colors.E003",
+        ]
+
+    def test_invalid_config(self) -> None:
+        """
+        Test that configurations that can't be built are an error.
+
+        :return: None
+        """
+        field = MisconfiguredThing._meta.get_field("bad_type")
+
+        with override_settings(COLORS_APP_CONFIG=BAD_TYPE_CONFIG):
+            (message,) = check_field_config(field)
+            assert check_field_indexes(field) == []
+
+        assert message.id == "django_colors.E001"
+        assert "PURPLE" in message.msg
+
+    def test_check_app_configs(self) -> None:
+        """
+        Test that the registered check reports every field in one pass.
+
+        :return: None
+        """
+        app_config = Mock()
+        app_config.get_models.return_value = [PlainPalette, MisconfiguredThing]
+
+        with override_settings(COLORS_APP_CONFIG=BAD_TYPE_CONFIG):
+            messages = check_field_configs([app_config])
+
+        assert sorted(message.id for message in messages) == [
+            "django_colors.E001",
+            "django_colors.E002",
+            "django_colors.E002",
+            "django_colors.E003",
+            "django_colors.E003",
+        ]
+        assert check_field_configs([]) == []
+
+    def test_check_is_registered(self) -> None:
+        """
+        Test that the check runs with the model checks.
+
+        :return: None
+        """
+        assert check_field_configs in checks.registry.registry.get_checks()
@@ -1,12 +1,20 @@
 """Tests for the color_definitions module."""
 
+import sys
 from collections.abc import Iterator
+from dataclasses import dataclass
 
 import pytest
+from django.utils.functional import lazy
+from django.utils.translation import get_language, override
 
 from django_colors.color_definitions import (
+    BootstrapColorChoices,
     ColorChoices,
     ColorOption,
+    CompactColorChoices,
+    CompactOptions,
+    choice_sort_key,
 )
 from django_colors.field_type import FieldType
 
@@ -387,3 +395,369 @@ class TestBootstrapColorChoices:
         """
         # Check if the instance has __slots__ attribute (indicates slots=True)
         assert hasattr(color_option, "__slots__")
+
+
+class TestCompiledPalette:
+    """Test the palettes compiled when ColorChoices subclasses are defined."""
+
+    def test_for_field_type_is_interned(self) -> None:
+        """
+        Test that for_field_type returns one shared instance per field type.
+
+        :return: None
+        """
+        background = BootstrapColorChoices.for_field_type(FieldType.BACKGROUND)
+        text = BootstrapColorChoices.for_field_type(FieldType.TEXT)
+
+        assert background is BootstrapColorChoices.for_field_type()
+        assert text is BootstrapColorChoices.for_field_type(FieldType.TEXT)
+        assert background is not text
+        assert background.field_type == FieldType.BACKGROUND
+        assert text.field_type == FieldType.TEXT
+
+    def test_interned_per_class(self) -> None:
+        """
+        Test that subclasses do not share interned instances.
+
+        :return: None
+        """
+        assert isinstance(
+            BootstrapColorChoices.for_field_type(), BootstrapColorChoices
+        )
+        assert type(ColorChoices.for_field_type()) is ColorChoices
+
+    def test_instances_share_value_map(self) -> None:
+        """
+        Test that instances using the class options share the value map.
+
+        :return: None
+        """
+        first = BootstrapColorChoices()
+        second = BootstrapColorChoices(field_type=FieldType.TEXT)
+
+        assert first.get_options_dict is second.get_options_dict
+        with pytest.raises(TypeError):
+            first.get_options_dict["new"] = first.BLUE
+
+    def test_frozen_choices_are_shared(self) -> None:
+        """
+        Test that frozen_choices returns the compiled tuple.
+
+        :return: None
+        """
+        palette = BootstrapColorChoices.for_field_type(FieldType.TEXT)
+
+        assert palette.frozen_choices is palette.frozen_choices
+        assert palette.frozen_choices[0] == ("text-primary", "Blue")
+        assert palette.choices == list(palette.frozen_choices)
+        assert palette.choices is not palette.choices
+
+    def test_overridden_option(self) -> None:
+        """
+        Test that overriding an option builds a map for the instance.
+
+        :return: None
+        """
+        blue = ColorOption("navy", "Navy", "bg-navy", "text-navy")
+        palette = BootstrapColorChoices(BLUE=blue)
+
+        assert palette.get_by_value("navy") is blue
+        assert palette.get_by_value("blue") is None
+        assert palette.choices[0] == ("bg-navy", "Navy")
+        assert BootstrapColorChoices.for_field_type().get_by_value("blue")
+
+    def test_choice_options(self) -> None:
+        """
+        Test looking options up by their choice value.
+
+        :return: None
+        """
+        background = BootstrapColorChoices.for_field_type()
+        text = BootstrapColorChoices.for_field_type(FieldType.TEXT)
+
+        assert background.choice_options is background.choice_options
+        assert background.get_by_choice_value("bg-primary").label == "Blue"
+        assert text.get_by_choice_value("text-primary").label == "Blue"
+        assert text.get_by_choice_value("bg-primary") is None
+        with pytest.raises(TypeError):
+            background.choice_options["bg-new"] = background.BLUE
+
+    def test_overridden_choice_options(self) -> None:
+        """
+        Test the choice options of an instance with overridden options.
+
+        :return: None
+        """
+        blue = ColorOption("navy", "Navy", "bg-navy", "text-navy")
+        palette = BootstrapColorChoices(BLUE=blue)
+
+        assert palette.get_by_choice_value("bg-navy") is blue
+        assert palette.get_by_choice_value("bg-primary") is None
+
+    def test_plain_subclass_options(self) -> None:
+        """
+        Test that subclasses without the dataclass decorator are compiled.
+
+        :return: None
+        """
+
+        class PlainColors(ColorChoices):
+            RED: ColorOption = ColorOption("red", "Red", "bg-red", "text-red")
+            NOT_COLOR: str = "not a color option"
+
+        palette = PlainColors.for_field_type(FieldType.TEXT)
+
+        assert palette.choices == [("text-red", "Red")]
+        assert list(palette.get_options_dict) == ["red"]
+
+    def test_inherited_options(self) -> None:
+        """
+        Test that options of parent palettes are included in order.
+
+        :return: None
+        """
+
+        @dataclass(frozen=True, slots=True)
+        class ExtendedColors(BootstrapColorChoices):
+            BLACK: ColorOption = ColorOption(
+                "black", "Black", "bg-black", "text-black"
+            )
+
+        values = [option.value for option in ExtendedColors.for_field_type()]
+
+        assert values[0] == "blue"
+        assert values[-1] == "black"
+        assert len(values) == 12
+
+
+class TestSortedChoices:
+    """Test the presorted choices of ColorChoices."""
+
+    @pytest.mark.parametrize("field_type", list(FieldType))
+    @pytest.mark.parametrize("sort_by", ["value", "label"])
+    @pytest.mark.parametrize("ignore_case", [True, False])
+    def test_matches_sorted_choices(
+        self, field_type: FieldType, sort_by: str, ignore_case: bool
+    ) -> None:
+        """
+        Test that presorted choices match sorting the choices.
+
+        :param field_type: The field type to use
+        :param sort_by: The sort key
+        :param ignore_case: Whether to ignore case
+        :return: None
+        """
+        palette = BootstrapColorChoices.for_field_type(field_type)
+
+        assert list(palette.sorted_choices(sort_by, ignore_case)) == sorted(
+            palette.choices, key=choice_sort_key(sort_by, ignore_case)
+        )
+
+    def test_presorted_when_resolved(self) -> None:
+        """
+        Test that every sort option is stored when a palette is resolved.
+
+        :return: None
+        """
+        palette = BootstrapColorChoices.for_field_type(FieldType.TEXT)
+
+        for sort_by in ("value", "label"):
+            for ignore_case in (True, False):
+                assert (
+                    FieldType.TEXT,
+                    sort_by,
+                    ignore_case,
+                    get_language() if sort_by == "label" else None,
+                ) in BootstrapColorChoices._sorted_choices
+                assert palette.sorted_choices(
+                    sort_by, ignore_case
+                ) is palette.sorted_choices(sort_by, ignore_case)
+
+    def test_lazy_labels_sorted_per_language(self) -> None:
+        """
+        Test that lazy labels are sorted in the active language.
+
+        :return: None
+        """
+
+        def translate(english: str, german: str) -> str:
+            return german if get_language() == "de" else english
+
+        lazy_label = lazy(translate, str)
+
+        class LazyColorChoices(ColorChoices):
+            APPLE = ColorOption(
+                "apple", lazy_label("Apple", "Zapfen"), "bg-a", "text-a"
+            )
+            PINE = ColorOption(
+                "pine", lazy_label("Pine", "Apfel"), "bg-p", "text-p"
+            )
+
+        palette = LazyColorChoices.for_field_type()
+
+        with override("en"):
+            labels = [
+                str(label) for _, label in palette.sorted_choices("label")
+            ]
+            assert labels == ["Apple", "Pine"]
+        with override("de"):
+            labels = [
+                str(label) for _, label in palette.sorted_choices("label")
+            ]
+            assert labels == ["Apfel", "Zapfen"]
+
+    def test_no_sort_by(self) -> None:
+        """
+        Test that no sort key keeps the definition order.
+
+        :return: None
+        """
+        palette = BootstrapColorChoices.for_field_type()
+
+        assert palette.sorted_choices(None) is palette.frozen_choices
+
+    def test_overridden_option_is_sorted(self) -> None:
+        """
+        Test that instances with overridden options are sorted on demand.
+
+        :return: None
+        """
+        blue = ColorOption("blue", "azure", "bg-azure", "text-azure")
+        palette = BootstrapColorChoices(BLUE=blue)
+
+        assert palette.sorted_choices("label")[0] == ("bg-azure", "azure")
+        assert palette.sorted_choices("label", ignore_case=False)[-1] == (
+            "bg-azure",
+            "azure",
+        )
+
+
+GeneratedColorChoices = CompactColorChoices.from_options(
+    "GeneratedColorChoices",
+    [
+        ColorOption("slate-50", "Slate 50", "bg-slate-50", "text-slate-50"),
+        ("amber-500", "Amber 500", "bg-amber-500", "text-amber-500"),
+        ("blue-900", "Blue 900", "bg-blue-900", "text-blue-900"),
+        ("amber-500", "Amber", "bg-amber", "text-amber"),
+    ],
+)
+
+
+class TestCompactColorChoices:
+    """Test the CompactColorChoices class."""
+
+    def test_is_palette_class(self) -> None:
+        """
+        Test that compact palettes are ColorChoices subclasses.
+
+        :return: None
+        """
+        assert issubclass(GeneratedColorChoices, ColorChoices)
+        assert GeneratedColorChoices.__name__ == "GeneratedColorChoices"
+        assert not hasattr(GeneratedColorChoices(), "__dict__")
+
+    def test_columns_are_interned(self) -> None:
+        """
+        Test that the columns hold interned strings.
+
+        :return: None
+        """
+        values, labels, backgrounds, texts = GeneratedColorChoices._columns
+
+        assert values == ("slate-50", "amber-500", "blue-900")
+        assert backgrounds[0] is sys.intern("".join(["bg-", "slate-50"]))
+        assert labels[1] == "Amber"
+        assert texts[1] == "text-amber"
+
+    def test_get_by_value(self) -> None:
+        """
+        Test that options are created on access.
+
+        :return: None
+        """
+        palette = GeneratedColorChoices()
+
+        option = palette.get_by_value("amber-500")
+
+        assert option == ColorOption(
+            "amber-500", "Amber", "bg-amber", "text-amber"
+        )
+        assert palette.get_by_value("missing") is None
+        with pytest.raises(KeyError):
+            palette.get_or_raise("missing")
+
+    def test_choices(self) -> None:
+        """
+        Test the choices of each field type.
+
+        :return: None
+        """
+        background = GeneratedColorChoices.for_field_type(FieldType.BACKGROUND)
+        text = GeneratedColorChoices.for_field_type(FieldType.TEXT)
+
+        assert background.choices == [
+            ("bg-slate-50", "Slate 50"),
+            ("bg-amber", "Amber"),
+            ("bg-blue-900", "Blue 900"),
+        ]
+        assert text.frozen_choices[2] == ("text-blue-900", "Blue 900")
+        assert background.choice_values == {
+            "bg-slate-50",
+            "bg-amber",
+            "bg-blue-900",
+        }
+        assert background.sorted_choices("label")[0] == ("bg-amber", "Amber")
+
+    def test_choice_options(self) -> None:
+        """
+        Test the options keyed by choice value.
+
+        :return: None
+        """
+        palette = GeneratedColorChoices.for_field_type(FieldType.TEXT)
+
+        options = palette.choice_options
+
+        assert isinstance(options, CompactOptions)
+        assert "text-amber" in options
+        assert len(options) == 3
+        assert palette.get_by_choice_value("text-blue-900").value == "blue-900"
+        assert options is palette.choice_options
+
+    def test_iter(self) -> None:
+        """
+        Test iterating over the options in palette order.
+
+        :return: None
+        """
+        assert [option.value for option in GeneratedColorChoices()] == [
+            "slate-50",
+            "amber-500",
+            "blue-900",
+        ]
+
+    def test_field_type_data_is_lazy(self) -> None:
+        """
+        Test that the data of a field type is only built when used.
+
+        :return: None
+        """
+        palette_class = CompactColorChoices.from_options(
+            "LazyColorChoices", [("a", "A", "bg-a", "text-a")]
+        )
+
+        assert FieldType.TEXT not in palette_class._class_choices
+        palette_class.for_field_type(FieldType.BACKGROUND)
+        assert FieldType.BACKGROUND in palette_class._class_choices
+        assert FieldType.TEXT not in palette_class._class_choices
+
+    def test_empty_palette(self) -> None:
+        """
+        Test a compact palette without options.
+
+        :return: None
+        """
+        palette_class = CompactColorChoices.from_options("EmptyChoices", [])
+
+        assert palette_class().choices == []
+        assert list(palette_class()) == []
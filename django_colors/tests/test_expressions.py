@@ -0,0 +1,115 @@
+"""Tests for the expressions module."""
+
+import pytest
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+
+from django_colors.expressions import ColorLabel, get_color_field
+from django_colors.tests.models import Thing
+
+
+@pytest.fixture
+def tables(palette_tables: pytest.fixture) -> None:
+    """
+    Create the tables of the shared test models with some rows.
+
+    :param palette_tables: The shared test tables fixture
+    :return: None
+    """
+    palette_tables(
+        ("Brand", "bg-brand", "text-brand"),
+        ("Brand Copy", "bg-brand", "text-copy"),
+    )
+    parent = Thing.objects.create(
+        background="bg-brand", text="text-copy", plain="bg-primary"
+    )
+    Thing.objects.create(
+        background="bg-danger",
+        text="text-nope",
+        plain="bg-brand",
+        parent=parent,
+    )
+
+
+class TestColorLabel:
+    """Tests for the ColorLabel expression."""
+
+    def test_labels_in_one_query(self, tables: pytest.fixture) -> None:
+        """
+        Test that default and custom labels are computed in one query.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(
+                Thing.objects.order_by("pk").values_list(
+                    ColorLabel("background"),
+                    ColorLabel("text"),
+                    ColorLabel("plain"),
+                )
+            )
+
+        assert rows == [
+            ("Brand", "Brand Copy", "Blue"),
+            ("Red", None, None),
+        ]
+        assert len(queries) == 1
+
+    def test_matches_get_option(self, tables: pytest.fixture) -> None:
+        """
+        Test that the database labels match get_<field>_option().
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        for thing in Thing.objects.annotate(label=ColorLabel("background")):
+            assert thing.label == thing.get_background_option().label
+
+    def test_default_label(self, tables: pytest.fixture) -> None:
+        """
+        Test the label of unknown values.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        labels = Thing.objects.order_by("pk").values_list(
+            ColorLabel("plain", default="Unknown"),
+            ColorLabel("text", default=F("text")),
+        )
+
+        assert list(labels) == [
+            ("Blue", "Brand Copy"),
+            ("Unknown", "text-nope"),
+        ]
+
+    def test_follows_relations(self, tables: pytest.fixture) -> None:
+        """
+        Test labels of a related model's color field.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        labels = Thing.objects.filter(parent__isnull=False).values_list(
+            ColorLabel("parent__background"), flat=True
+        )
+
+        assert list(labels) == ["Brand"]
+
+    def test_not_a_color_field(self) -> None:
+        """
+        Test that other fields are rejected.
+
+        :return: None
+        """
+        with pytest.raises(ValueError, match="not a ColorModelField"):
+            get_color_field(Thing, "parent")
+
+    def test_repr(self) -> None:
+        """
+        Test the representation of the expression.
+
+        :return: None
+        """
+        assert repr(ColorLabel("background")) == "ColorLabel('background')"
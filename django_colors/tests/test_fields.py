@@ -3,8 +3,13 @@
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
-from django.db import models
+from django.apps.registry import Apps
+from django.core.exceptions import ValidationError
+from django.db import connection, models
+from django.db.models import F, OrderBy
+from django.db.models.functions import Lower
 from django.forms import ChoiceField
+from django.test.utils import CaptureQueriesContext
 
 from django_colors.color_definitions import BootstrapColorChoices
 from django_colors.field_type import FieldType
@@ -12,6 +17,8 @@ from django_colors.fields import (
     BLANK_CHOICE_DASH,
     ColorModelField,
     combine_choices,
+    get_sort_expression,
+    merge_choices,
     sort_choices,
 )
 from django_colors.widgets import ColorChoiceWidget
@@ -148,8 +155,7 @@ class TestColorModelField:
         result = field.get_config_dict()
 
         assert result == mock_config
-        # TODO: Investigate why this is called twice
-        assert mock_get_config.call_count == 2
+        assert mock_get_config.call_count == 1
 
     @patch("django_colors.settings.get_config")
     def test_get_config_dict_default(self, mock_get_config: Mock) -> None:
@@ -171,10 +177,7 @@ class TestColorModelField:
         result = field.get_config_dict()
 
         assert result == default_config
-        # TODO: Investigate why this is called twice
-        assert (
-            mock_get_config.call_count == 2
-        )  # Verify it was called exactly once
+        assert mock_get_config.call_count == 1
 
     @pytest.mark.django_db
     def test_contribute_to_class(
@@ -192,10 +195,52 @@ class TestColorModelField:
 
             assert field.model_name == "MockModel"
             assert field.app_name == "test_app"
+            # the configuration is only resolved on first access
+            mock_field_config.assert_not_called()
+            assert field.field_config is mock_field_config.return_value
+            assert field.field_config is mock_field_config.return_value
             mock_field_config.assert_called_once_with(
                 mock_model_class, field, "test_field"
             )
 
+    def test_field_config_requires_model(self) -> None:
+        """
+        Test that field_config is unavailable before contribute_to_class.
+
+        :return: None
+        """
+        field = ColorModelField()
+
+        with pytest.raises(AttributeError, match="attached to a model"):
+            field.field_config  # noqa: B018
+
+    def test_historical_model_skips_config(self) -> None:
+        """
+        Test that historical models never resolve the configuration.
+
+        :return: None
+        """
+
+        class Meta:
+            """Meta class for testing."""
+
+            app_label = "test_app"
+            apps = Apps()
+
+        with patch("django_colors.settings.FieldConfig") as mock_field_config:
+            model = type(
+                "HistoricalColorThing",
+                (models.Model,),
+                {
+                    "__module__": "__fake__",
+                    "color": ColorModelField(),
+                    "Meta": Meta,
+                },
+            )
+
+        mock_field_config.assert_not_called()
+        assert not hasattr(model, "get_color_option")
+
     def test_non_db_attrs(self) -> None:
         """
         Test the non_db_attrs property.
@@ -299,6 +344,8 @@ class TestColorModelField:
             "color_type": FieldType.BACKGROUND,
             "choice_filters": {},
             "only_use_custom_colors": False,
+            "cache_alias": None,
+            "cache_choices": False,
         }[key]
 
         # Mock the choice_model property to return None (using PropertyMock)
@@ -356,6 +403,9 @@ class TestColorModelField:
                 },  # Should be ignored with model_priority=True
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -419,6 +469,9 @@ class TestColorModelField:
                 "choice_filters": {"background_css": "bg-blue"},
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -488,6 +541,9 @@ class TestColorModelField:
                 "choice_filters": {},
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             # Mock the choice_model property to return the color_model
@@ -556,6 +612,9 @@ class TestColorModelField:
                 "choice_filters": {},
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": True,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             # Mock the choice_model property to return the color_model
@@ -912,6 +971,9 @@ class TestCombineChoices:
                 "choice_filters": {},
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -966,6 +1028,8 @@ class TestCombineChoices:
             "color_type": FieldType.BACKGROUND,
             "choice_filters": {},
             "only_use_custom_colors": False,
+            "cache_alias": None,
+            "cache_choices": False,
         }[key]
 
         type(mock_field_config).choice_model = PropertyMock(return_value=None)
@@ -997,6 +1061,8 @@ class TestCombineChoices:
             "color_type": FieldType.BACKGROUND,
             "choice_filters": {},
             "only_use_custom_colors": False,
+            "cache_alias": None,
+            "cache_choices": False,
         }[key]
 
         type(mock_field_config).choice_model = PropertyMock(return_value=None)
@@ -1051,6 +1117,9 @@ class TestCombineChoices:
                 "choice_filters": {},
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -1104,6 +1173,9 @@ class TestCombineChoices:
                 "choice_filters": {},
                 "color_type": FieldType.BACKGROUND,
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -1136,6 +1208,65 @@ class TestCombineChoices:
             )
 
 
+class TestMergeChoices:
+    """Tests for the merge_choices function."""
+
+    def test_merge_choices_by_label(self) -> None:
+        """Test merge_choices with lists sorted by label."""
+        default_list = [("bg-blue", "Blue"), ("bg-red", "red")]
+        queryset_list = [("bg-apple", "Apple"), ("bg-green", "Green")]
+
+        final_list = merge_choices(default_list, queryset_list, "label")
+
+        assert final_list == [
+            ("bg-apple", "Apple"),
+            ("bg-blue", "Blue"),
+            ("bg-green", "Green"),
+            ("bg-red", "red"),
+        ]
+
+    def test_merge_choices_matches_sort(self) -> None:
+        """Test merge_choices gives the same result as a stable sort."""
+        default_list = sort_choices(
+            [("bg-b", "Same"), ("bg-a", "alpha"), ("bg-c", "Zulu")], "label"
+        )
+        queryset_list = sort_choices(
+            [("bg-d", "same"), ("bg-e", "Beta"), ("bg-f", "ALPHA")], "label"
+        )
+
+        final_list = merge_choices(default_list, queryset_list, "label")
+
+        assert final_list == sort_choices(
+            default_list + queryset_list, "label"
+        )
+        assert final_list.index(("bg-b", "Same")) < final_list.index(
+            ("bg-d", "same")
+        )
+
+    def test_merge_choices_case_sensitive(self) -> None:
+        """Test merge_choices by value without ignoring case."""
+        default_list = [("Bg-b", "B"), ("bg-a", "A")]
+        queryset_list = [("Bg-c", "C"), ("bg-d", "D")]
+
+        final_list = merge_choices(
+            default_list, queryset_list, "value", ignore_case=False
+        )
+
+        assert [choice[0] for choice in final_list] == [
+            "Bg-b",
+            "Bg-c",
+            "bg-a",
+            "bg-d",
+        ]
+
+    def test_merge_choices_empty(self) -> None:
+        """Test merge_choices with an empty list."""
+        default_list = [("bg-blue", "Blue")]
+
+        assert merge_choices(default_list, [], "label") == default_list
+        assert merge_choices([], default_list, "label") == default_list
+
+
 class TestSortedChoices:
     """Tests for the sorted_choices function."""
 
@@ -1269,6 +1400,8 @@ class TestSortedChoices:
                 "color_type": FieldType.BACKGROUND,
                 "choice_filters": {},
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
             }[key]
 
             # Set up the choice_model (this should be ignored)
@@ -1283,7 +1416,12 @@ class TestSortedChoices:
                 ("bg-primary", "Primary"),
                 ("bg-secondary", "Secondary"),
             ]
-            mock_color_choices_class.return_value = mock_color_choices_instance
+            mock_color_choices_instance.sorted_choices.return_value = (
+                mock_color_choices_instance.choices
+            )
+            mock_color_choices_class.for_field_type.return_value = (
+                mock_color_choices_instance
+            )
 
             type(mock_field_config).default_color_choices = PropertyMock(
                 return_value=mock_color_choices_class
@@ -1347,6 +1485,9 @@ class TestSortedChoices:
                 "color_type": FieldType.BACKGROUND,
                 "choice_filters": {},
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
+                "sort_in_database": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -1360,7 +1501,12 @@ class TestSortedChoices:
                 ("bg-primary", "Primary"),
                 ("bg-secondary", "Secondary"),
             ]
-            mock_color_choices_class.return_value = mock_color_choices_instance
+            mock_color_choices_instance.sorted_choices.return_value = (
+                mock_color_choices_instance.choices
+            )
+            mock_color_choices_class.for_field_type.return_value = (
+                mock_color_choices_instance
+            )
 
             type(mock_field_config).default_color_choices = PropertyMock(
                 return_value=mock_color_choices_class
@@ -1414,6 +1560,8 @@ class TestSortedChoices:
                 "color_type": FieldType.BACKGROUND,
                 "choice_filters": {},
                 "only_use_custom_colors": False,
+                "cache_alias": None,
+                "cache_choices": False,
             }[key]
 
             type(mock_field_config).choice_model = PropertyMock(
@@ -1441,3 +1589,722 @@ class TestSortedChoices:
 
             # Verify custom choices are NOT included
             assert ("bg-custom", "Custom Color") not in choices
+
+
+@pytest.mark.django_db
+class TestColorModelFieldValidation:
+    """Tests for the choice validation of ColorModelField."""
+
+    def get_field(
+        self,
+        mock_field_config: pytest.fixture,
+        choice_model: type | None,
+        validate_choices: bool = True,
+        only_use_custom_colors: bool = False,
+        **kwargs: dict,
+    ) -> ColorModelField:
+        """
+        Create a field using the mocked field config.
+
+        :param mock_field_config: Mock field config fixture
+        :param choice_model: The choice model to use or None
+        :param validate_choices: Whether choice validation is enabled
+        :param only_use_custom_colors: Whether only custom colors are used
+        :param kwargs: Additional arguments for the field
+        :return: The configured field
+        """
+        field = ColorModelField(**kwargs)
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": {"active": True},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": only_use_custom_colors,
+            "validate_choices": validate_choices,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=choice_model
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+        return field
+
+    def test_validate_default_color(
+        self, mock_field_config: pytest.fixture
+    ) -> None:
+        """
+        Test that default colors are valid without a choice model.
+
+        :param mock_field_config: Mock field config fixture
+        :return: None
+        """
+        field = self.get_field(mock_field_config, None)
+
+        field.validate("bg-primary", None)
+        with pytest.raises(ValidationError) as error:
+            field.validate("bg-unknown", None)
+
+        assert error.value.code == "invalid_choice"
+
+    def test_validate_disabled(
+        self, mock_field_config: pytest.fixture
+    ) -> None:
+        """
+        Test that values are not checked when validation is disabled.
+
+        :param mock_field_config: Mock field config fixture
+        :return: None
+        """
+        field = self.get_field(mock_field_config, None, validate_choices=False)
+
+        field.validate("bg-unknown", None)
+
+    def test_validate_custom_color(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that custom colors are checked against the choice model.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model: Mock color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        mock_manager.filter.return_value.values_list.return_value = [
+            "bg-brand"
+        ]
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            field.validate("bg-brand", None)
+            field.validate("bg-primary", None)
+
+        mock_manager.filter.assert_called_once_with(
+            active=True, background_css__in=["bg-brand"]
+        )
+
+    def test_validate_many(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that validate_many uses one query and reports positions.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model: Mock color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        mock_manager.filter.return_value.values_list.return_value = [
+            "bg-brand"
+        ]
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model, blank=True)
+
+            invalid = field.validate_many(
+                [
+                    "bg-primary",
+                    "bg-brand",
+                    "bg-unknown",
+                    "",
+                    "bg-brand",
+                    "bg-unknown",
+                ]
+            )
+
+        assert invalid == [(2, "bg-unknown"), (5, "bg-unknown")]
+        mock_manager.filter.assert_called_once_with(
+            active=True,
+            background_css__in=["bg-brand", "bg-unknown"],
+        )
+
+    def test_validate_many_only_custom_colors(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that default colors are invalid with only custom colors.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model: Mock color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        mock_manager.filter.return_value.values_list.return_value = []
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(
+                mock_field_config, color_model, only_use_custom_colors=True
+            )
+
+            invalid = field.validate_many(["bg-primary", ""])
+
+        assert invalid == [(0, "bg-primary"), (1, "")]
+
+    def test_validate_many_defaults_only_no_query(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that no query runs when every value is a default color.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model: Mock color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            assert field.validate_many(["bg-primary", "bg-danger"]) == []
+
+        mock_manager.filter.assert_not_called()
+
+
+class TestDatabaseSorting:
+    """Tests for sorting custom choices in the database."""
+
+    def get_field(
+        self,
+        mock_field_config: pytest.fixture,
+        choice_model: type,
+        sort_in_database: bool = True,
+        only_use_custom_colors: bool = True,
+    ) -> ColorModelField:
+        """
+        Create a field using the mocked field config.
+
+        :param mock_field_config: Mock field config fixture
+        :param choice_model: The choice model to use
+        :param sort_in_database: Whether to sort in the database
+        :param only_use_custom_colors: Whether to only use custom colors
+        :return: The configured field
+        """
+        field = ColorModelField()
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": {},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": only_use_custom_colors,
+            "sort_in_database": sort_in_database,
+            "cache_alias": None,
+            "cache_choices": False,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=choice_model
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+        return field
+
+    @pytest.mark.parametrize(
+        ("sort_by", "ignore_case", "expected"),
+        [
+            ("label", True, Lower("name").asc()),
+            ("label", False, F("name").asc()),
+            ("value", True, Lower("background_css").asc()),
+            ("value", False, F("background_css").asc()),
+        ],
+    )
+    def test_get_sort_expression(
+        self, sort_by: str, ignore_case: bool, expected: OrderBy
+    ) -> None:
+        """
+        Test the ordering expression for each sort option.
+
+        :param sort_by: The sort key
+        :param ignore_case: Whether to ignore case
+        :param expected: The expected ordering expression
+        :return: None
+        """
+        assert (
+            get_sort_expression(FieldType.BACKGROUND, sort_by, ignore_case)
+            == expected
+        )
+
+    def test_ordering_breaks_ties(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that the sort expression comes before the field ordering.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model: Mock color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        # fmt: off
+        mock_manager.\
+        filter.\
+        return_value.\
+        distinct.\
+        return_value.\
+        order_by.\
+        return_value.\
+        values_list.\
+        return_value = [("bg-b", "b"), ("bg-a", "A")]
+        # fmt: on
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model)
+
+            choices = field.get_choices(ordering=("-id",))
+
+        mock_manager.filter.return_value.distinct.return_value.order_by.assert_called_once_with(  # noqa: E501
+            Lower("name").asc(), "-id"
+        )
+        # the database order is kept, no python sort
+        assert choices == [("bg-b", "b"), ("bg-a", "A")]
+
+    @pytest.mark.parametrize("sort_in_database", [True, False])
+    def test_database_order_matches_python(
+        self,
+        mock_field_config: pytest.fixture,
+        color_model_table: pytest.fixture,
+        sort_in_database: bool,
+    ) -> None:
+        """
+        Test that sorting in the database gives the python sort order.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model_table: The concrete color model with a table
+        :param sort_in_database: Whether to sort in the database
+        :return: None
+        """
+        for name in ("banana", "Apple", "cherry", "apricot"):
+            color_model_table.objects.create(
+                name=name, background_css=f"bg-{name}", text_css=name
+            )
+        field = self.get_field(
+            mock_field_config, color_model_table, sort_in_database
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            choices = field.get_choices(sort_by="label")
+
+        assert [label for _, label in choices] == [
+            "Apple",
+            "apricot",
+            "banana",
+            "cherry",
+        ]
+        assert ("LOWER" in queries[0]["sql"]) is sort_in_database
+
+    def test_mixed_layout_merges_database_order(
+        self,
+        mock_field_config: pytest.fixture,
+        color_model_table: pytest.fixture,
+    ) -> None:
+        """
+        Test that the mixed layout merges the rows in database order.
+
+        SQLite only lowercases ASCII letters, so it sorts "Äpfel" before
+        "ändern" while the python sort key does the opposite.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model_table: The concrete color model with a table
+        :return: None
+        """
+        for name in ("Äpfel", "ändern"):
+            color_model_table.objects.create(
+                name=name, background_css=f"bg-{name}", text_css=name
+            )
+        field = self.get_field(
+            mock_field_config, color_model_table, True, False
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            choices = field.get_choices(layout="mixed", sort_by="label")
+
+        assert "LOWER" in queries[0]["sql"]
+        assert choices == list(
+            field.iter_choices(layout="mixed", sort_by="label")
+        )
+        labels = [label for _, label in choices]
+        assert labels.index("Äpfel") < labels.index("ändern")
+
+
+class TestIterChoices:
+    """Tests for the lazy choices iterator."""
+
+    def get_field(
+        self,
+        mock_field_config: pytest.fixture,
+        choice_model: type | None,
+        only_use_custom_colors: bool = False,
+    ) -> ColorModelField:
+        """
+        Create a field using the mocked field config.
+
+        :param mock_field_config: Mock field config fixture
+        :param choice_model: The choice model to use
+        :param only_use_custom_colors: Whether to only use custom colors
+        :return: The configured field
+        """
+        field = ColorModelField()
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": {},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": only_use_custom_colors,
+            "cache_alias": None,
+            "cache_choices": False,
+            "sort_in_database": False,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=choice_model
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+        return field
+
+    @pytest.fixture
+    def custom_colors(self, color_model_table: pytest.fixture) -> type:
+        """
+        Create a few custom colors in the database.
+
+        :param color_model_table: The concrete color model with a table
+        :return: The concrete color model
+        """
+        for name in ("zebra", "Apple", "mango", "Lime"):
+            color_model_table.objects.create(
+                name=name, background_css=f"bg-{name}", text_css=name
+            )
+        return color_model_table
+
+    @pytest.mark.parametrize(
+        "layout", ["defaults_first", "custom_first", "mixed"]
+    )
+    @pytest.mark.parametrize("sort_by", ["label", "value"])
+    @pytest.mark.parametrize("only_use_custom_colors", [True, False])
+    def test_matches_get_choices(
+        self,
+        mock_field_config: pytest.fixture,
+        custom_colors: pytest.fixture,
+        layout: str,
+        sort_by: str,
+        only_use_custom_colors: bool,
+    ) -> None:
+        """
+        Test that the iterator yields the choices of get_choices in order.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :param layout: The layout to use
+        :param sort_by: The sort key
+        :param only_use_custom_colors: Whether to only use custom colors
+        :return: None
+        """
+        field = self.get_field(
+            mock_field_config, custom_colors, only_use_custom_colors
+        )
+
+        choices = list(
+            field.iter_choices(layout=layout, sort_by=sort_by, chunk_size=2)
+        )
+
+        assert choices == field.get_choices(layout=layout, sort_by=sort_by)
+
+    def test_mixed_layout_streams_database_order(
+        self,
+        mock_field_config: pytest.fixture,
+        color_model_table: pytest.fixture,
+    ) -> None:
+        """
+        Test that the mixed layout merges the rows in database order.
+
+        SQLite only lowercases ASCII letters, so it sorts "Äpfel" before
+        "ändern" while the python sort key does the opposite.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model_table: The concrete color model with a table
+        :return: None
+        """
+        for name in ("Äpfel", "ändern"):
+            color_model_table.objects.create(
+                name=name, background_css=f"bg-{name}", text_css=name
+            )
+        field = self.get_field(mock_field_config, color_model_table)
+
+        with CaptureQueriesContext(connection) as queries:
+            choices = list(field.iter_choices(layout="mixed", chunk_size=1))
+
+        assert "LOWER" in queries[0]["sql"]
+        labels = [label for _, label in choices]
+        assert labels.index("Äpfel") < labels.index("ändern")
+        assert sorted(choices) == sorted(field.get_choices(layout="mixed"))
+
+    def test_is_lazy(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that nothing is queried until the choices are iterated.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors, True)
+
+        with CaptureQueriesContext(connection) as queries:
+            choices = field.iter_choices()
+            assert len(queries) == 0
+            assert next(choices) == ("bg-Apple", "Apple")
+        assert len(queries) == 1
+
+    def test_uses_queryset_iterator(
+        self, mock_field_config: pytest.fixture, color_model: pytest.fixture
+    ) -> None:
+        """
+        Test that the rows are streamed with the given chunk size.
+
+        :param mock_field_config: Mock field config fixture
+        :param color_model: Mock color model fixture
+        :return: None
+        """
+        mock_manager = MagicMock()
+        # fmt: off
+        mock_values_list = mock_manager.\
+            filter.\
+            return_value.\
+            distinct.\
+            return_value.\
+            order_by.\
+            return_value.\
+            values_list
+        # fmt: on
+        mock_values_list.return_value.iterator.return_value = iter(
+            [("bg-a", "a")]
+        )
+        with patch.object(color_model, "objects", mock_manager):
+            field = self.get_field(mock_field_config, color_model, True)
+
+            choices = list(field.iter_choices(chunk_size=500))
+
+        mock_values_list.return_value.iterator.assert_called_once_with(
+            chunk_size=500
+        )
+        assert choices == [("bg-a", "a")]
+
+    def test_include_blank(self, mock_field_config: pytest.fixture) -> None:
+        """
+        Test that the blank choice is yielded first.
+
+        :param mock_field_config: Mock field config fixture
+        :return: None
+        """
+        field = self.get_field(mock_field_config, None)
+
+        choices = list(field.iter_choices(include_blank=True))
+
+        assert choices[0] == ("", BLANK_CHOICE_DASH)
+        assert choices[1:] == field.get_choices()
+
+    def test_predefined_choices(self) -> None:
+        """
+        Test that predefined choices are iterated as they are.
+
+        :return: None
+        """
+        field = ColorModelField(choices=[("bg-a", "A")])
+
+        assert list(field.iter_choices()) == [("bg-a", "A")]
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_invalid_chunk_size(
+        self, mock_field_config: pytest.fixture, chunk_size: int
+    ) -> None:
+        """
+        Test that a chunk size below one is rejected right away.
+
+        :param mock_field_config: Mock field config fixture
+        :param chunk_size: The invalid chunk size
+        :return: None
+        """
+        field = self.get_field(mock_field_config, None)
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            field.iter_choices(chunk_size=chunk_size)
+
+
+class TestSearchChoices:
+    """Tests for searching the choices of a field."""
+
+    def get_field(
+        self,
+        mock_field_config: pytest.fixture,
+        choice_model: type | None,
+        only_use_custom_colors: bool = False,
+        choice_filters: dict | None = None,
+    ) -> ColorModelField:
+        """
+        Create a field using the mocked field config.
+
+        :param mock_field_config: Mock field config fixture
+        :param choice_model: The choice model to use
+        :param only_use_custom_colors: Whether to only use custom colors
+        :param choice_filters: The configured choice filters
+        :return: The configured field
+        """
+        field = ColorModelField()
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": choice_filters or {},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": only_use_custom_colors,
+            "search_index": False,
+            "cache_alias": None,
+            "cache_choices": False,
+            "sort_in_database": False,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=choice_model
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+        return field
+
+    @pytest.fixture
+    def custom_colors(self, color_model_table: pytest.fixture) -> type:
+        """
+        Create a few custom colors in the database.
+
+        :param color_model_table: The concrete color model with a table
+        :return: The concrete color model
+        """
+        for name in ("Brand Blue", "Brand Red", "Sky", "Inactive"):
+            color_model_table.objects.create(
+                name=name,
+                background_css=f"bg-{name.lower().replace(' ', '-')}",
+                text_css="active" if name != "Inactive" else "inactive",
+            )
+        return color_model_table
+
+    @pytest.mark.parametrize(
+        "layout", ["defaults_first", "custom_first", "mixed"]
+    )
+    def test_substring_search(
+        self,
+        mock_field_config: pytest.fixture,
+        custom_colors: pytest.fixture,
+        layout: str,
+    ) -> None:
+        """
+        Test that matches keep the layout order of get_choices.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :param layout: The layout to use
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+
+        choices = field.search_choices("blue", layout=layout)
+
+        assert choices == [
+            choice
+            for choice in field.get_choices(layout=layout)
+            if "blue" in choice[0].lower() or "blue" in choice[1].lower()
+        ]
+        assert ("bg-brand-blue", "Brand Blue") in choices
+        assert ("bg-primary", "Blue") in choices
+
+    def test_prefix_search(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that a prefix search matches the start of values or labels.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+
+        choices = field.search_choices("br", prefix=True)
+
+        assert choices == [
+            ("bg-brand-blue", "Brand Blue"),
+            ("bg-brand-red", "Brand Red"),
+        ]
+
+    def test_pagination(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that limit and offset select a page of the matches.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+        matches = field.search_choices("", limit=100)
+
+        assert field.search_choices("", limit=3, offset=2) == matches[2:5]
+
+    def test_honors_filters_and_custom_only(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that the field's choice filters and custom only setting apply.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(
+            mock_field_config,
+            custom_colors,
+            only_use_custom_colors=True,
+            choice_filters={"text_css": "active"},
+        )
+
+        choices = field.search_choices("", limit=100)
+
+        assert choices == field.get_choices()
+        assert [label for _, label in choices] == [
+            "Brand Blue",
+            "Brand Red",
+            "Sky",
+        ]
+
+    def test_predefined_choices(self) -> None:
+        """
+        Test that predefined choices are searched in python.
+
+        :return: None
+        """
+        field = ColorModelField(choices=[("bg-a", "Apple"), ("bg-b", "Pear")])
+
+        assert field.search_choices("PEA") == [("bg-b", "Pear")]
+
+    def test_invalid_limit(self, mock_field_config: pytest.fixture) -> None:
+        """
+        Test that an invalid limit is rejected.
+
+        :param mock_field_config: Mock field config fixture
+        :return: None
+        """
+        field = self.get_field(mock_field_config, None)
+
+        with pytest.raises(ValueError, match="limit"):
+            field.search_choices("", limit=0)
+
+    def test_get_choice_labels(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that labels come from the palette and one query.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+
+        with CaptureQueriesContext(connection) as queries:
+            labels = field.get_choice_labels(
+                ["bg-primary", "bg-sky", "bg-unknown"]
+            )
+
+        assert labels == {"bg-primary": "Blue", "bg-sky": "Sky"}
+        assert len(queries) == 1
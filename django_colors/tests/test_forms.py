@@ -0,0 +1,238 @@
+"""Tests for the forms module."""
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+from django import forms
+from django.core.exceptions import ValidationError
+
+from django_colors.fields import ColorModelField
+from django_colors.forms import (
+    ColorAutocompleteField,
+    ColorChoiceField,
+    ColorFieldChoiceIterator,
+)
+from django_colors.widgets import ColorAutocompleteWidget, ColorChoiceWidget
+
+
+class TestColorChoiceField:
+    """Test the ColorChoiceField class."""
+
+    def test_inheritance(self) -> None:
+        """
+        Test that ColorChoiceField is a ChoiceField using the color widget.
+
+        :return: None
+        """
+        field = ColorChoiceField(choices=[("bg-red", "Red")])
+
+        assert isinstance(field, forms.ChoiceField)
+        assert isinstance(field.widget, ColorChoiceWidget)
+        assert isinstance(field.widget.choices, ColorFieldChoiceIterator)
+
+    def test_callable_choices_are_lazy(self) -> None:
+        """
+        Test that callable choices are not evaluated on creation.
+
+        :return: None
+        """
+        get_choices = Mock(return_value=[("bg-red", "Red")])
+
+        ColorChoiceField(choices=get_choices)
+
+        get_choices.assert_not_called()
+
+    def test_callable_choices_evaluated_once(self) -> None:
+        """
+        Test that rendering and validating evaluate the choices once.
+
+        :return: None
+        """
+        get_choices = Mock(return_value=[("bg-red", "Red"), ("bg-blue", "B")])
+        field = ColorChoiceField(choices=get_choices)
+
+        html = field.widget.render("color", "bg-red")
+        assert field.clean("bg-blue") == "bg-blue"
+        assert field.clean("bg-red") == "bg-red"
+
+        assert 'value="bg-red"' in html
+        get_choices.assert_called_once_with()
+
+    def test_deepcopy_evaluates_again(self) -> None:
+        """
+        Test that each copy of the field evaluates the choices once.
+
+        :return: None
+        """
+        get_choices = Mock(return_value=[("bg-red", "Red")])
+        field = ColorChoiceField(choices=get_choices)
+        field.clean("bg-red")
+
+        copied = copy.deepcopy(field)
+        copied.clean("bg-red")
+        list(copied.widget.choices)
+
+        assert get_choices.call_count == 2
+        assert copied.widget.choices.field is copied
+
+    def test_deepcopy_static_choices(self) -> None:
+        """
+        Test that static choices are copied.
+
+        :return: None
+        """
+        choices = [("bg-red", "Red")]
+        field = ColorChoiceField(choices=choices)
+
+        copied = copy.deepcopy(field)
+
+        assert copied.choices == choices
+        assert copied.choices is not field.choices
+
+    def test_invalid_value(self) -> None:
+        """
+        Test that values outside the choices raise a ValidationError.
+
+        :return: None
+        """
+        field = ColorChoiceField(choices=[("bg-red", "Red")])
+
+        with pytest.raises(ValidationError, match="Select a valid choice"):
+            field.clean("bg-blue")
+
+    def test_optgroup_values(self) -> None:
+        """
+        Test that values nested in optgroups are valid.
+
+        :return: None
+        """
+        field = ColorChoiceField(
+            choices=[
+                ("", "---------"),
+                ("Defaults", [("bg-red", "Red"), ("bg-blue", "Blue")]),
+                ("Custom", (("bg-brand", "Brand"),)),
+            ],
+            required=False,
+        )
+
+        assert field.valid_values == frozenset(
+            {"", "bg-red", "bg-blue", "bg-brand"}
+        )
+        assert field.clean("bg-brand") == "bg-brand"
+        assert field.clean("") == ""
+        assert not field.valid_value("Defaults")
+
+    def test_set_choices_resets_values(self) -> None:
+        """
+        Test that setting new choices resets the valid values.
+
+        :return: None
+        """
+        field = ColorChoiceField(choices=[("bg-red", "Red")])
+        assert field.valid_value("bg-red")
+
+        field.choices = [("bg-blue", "Blue")]
+
+        assert not field.valid_value("bg-red")
+        assert field.valid_value("bg-blue")
+
+
+class TestColorModelFieldFormfield:
+    """Test the form field created by ColorModelField."""
+
+    def test_formfield_returns_color_choice_field(self) -> None:
+        """
+        Test that formfield returns a ColorChoiceField using get_choices.
+
+        :return: None
+        """
+        field = ColorModelField()
+        field.get_choices = Mock(return_value=[("bg-red", "Red")])
+
+        form_field = field.formfield()
+
+        assert isinstance(form_field, ColorChoiceField)
+        field.get_choices.assert_not_called()
+        assert form_field.clean("bg-red") == "bg-red"
+        field.get_choices.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "widget", [ColorAutocompleteWidget, ColorAutocompleteWidget()]
+    )
+    def test_formfield_with_autocomplete_widget(
+        self, widget: type | ColorAutocompleteWidget
+    ) -> None:
+        """
+        Test that an autocomplete widget gives a ColorAutocompleteField.
+
+        :param widget: The widget class or instance
+        :return: None
+        """
+        field = ColorModelField()
+
+        form_field = field.formfield(widget=widget)
+
+        assert isinstance(form_field, ColorAutocompleteField)
+        assert form_field.model_field is field
+        assert form_field.widget.model_field is field
+
+    def test_formfield_with_predefined_choices(self) -> None:
+        """
+        Test that predefined choices keep the regular choice field.
+
+        :return: None
+        """
+        field = ColorModelField(choices=[("bg-red", "Red")])
+
+        form_field = field.formfield(widget=ColorAutocompleteWidget)
+
+        assert not isinstance(form_field, ColorAutocompleteField)
+
+
+class TestColorAutocompleteField:
+    """Test the ColorAutocompleteField class."""
+
+    def test_choices_are_not_built(self) -> None:
+        """
+        Test that validation checks the model field instead of the choices.
+
+        :return: None
+        """
+        model_field = Mock()
+        model_field.get_invalid_values.return_value = set()
+        get_choices = Mock()
+        field = ColorAutocompleteField(
+            model_field=model_field, choices=get_choices
+        )
+
+        assert field.clean("bg-red") == "bg-red"
+        get_choices.assert_not_called()
+        model_field.get_invalid_values.assert_called_once_with({"bg-red"})
+
+    def test_invalid_value(self) -> None:
+        """
+        Test that values rejected by the model field are invalid.
+
+        :return: None
+        """
+        model_field = Mock()
+        model_field.get_invalid_values.return_value = {"bg-nope"}
+        field = ColorAutocompleteField(model_field=model_field, choices=())
+
+        with pytest.raises(ValidationError):
+            field.clean("bg-nope")
+
+    def test_deepcopy_keeps_model_field(self) -> None:
+        """
+        Test that every form copy keeps the widget bound.
+
+        :return: None
+        """
+        model_field = Mock()
+        field = ColorAutocompleteField(model_field=model_field, choices=())
+
+        copied = copy.deepcopy(field)
+
+        assert copied.widget is not field.widget
+        assert copied.widget.model_field is model_field
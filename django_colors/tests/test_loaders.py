@@ -0,0 +1,312 @@
+"""Tests for the loaders module."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from django_colors.color_definitions import (
+    ColorOption,
+    CompactColorChoices,
+)
+from django_colors.field_type import FieldType
+from django_colors.loaders import (
+    compile_palette_file,
+    get_cache_path,
+    load_palette,
+    parse_palette,
+    read_cache,
+)
+
+COLORS = [
+    {
+        "value": "sky-500",
+        "label": "Sky 500",
+        "background_css": "bg-sky-500",
+        "text_css": "text-sky-500",
+    },
+    {
+        "value": "rose-700",
+        "label": "Rose 700",
+        "background_css": "bg-rose-700",
+        "text_css": "text-rose-700",
+    },
+]
+
+TOML_PALETTE = """
+name = "DesignColorChoices"
+
+[[colors]]
+value = "sky-500"
+label = "Sky 500"
+background_css = "bg-sky-500"
+text_css = "text-sky-500"
+"""
+
+
+@pytest.fixture
+def json_palette(tmp_path: Path) -> Path:
+    """
+    Write a JSON palette file.
+
+    :param tmp_path: The pytest tmp_path fixture
+    :return: The palette file path
+    """
+    path = tmp_path / "design.json"
+    path.write_text(json.dumps(COLORS))
+    return path
+
+
+class TestParsePalette:
+    """Tests for parse_palette()."""
+
+    def test_json_list(self) -> None:
+        """
+        Test parsing a JSON list of colors.
+
+        :return: None
+        """
+        name, rows = parse_palette(json.dumps(COLORS).encode(), ".json")
+
+        assert name is None
+        assert rows == [
+            ("sky-500", "Sky 500", "bg-sky-500", "text-sky-500"),
+            ("rose-700", "Rose 700", "bg-rose-700", "text-rose-700"),
+        ]
+
+    def test_toml_table(self) -> None:
+        """
+        Test parsing a TOML table with a name and colors.
+
+        :return: None
+        """
+        name, rows = parse_palette(TOML_PALETTE.encode(), ".toml")
+
+        assert name == "DesignColorChoices"
+        assert rows == [("sky-500", "Sky 500", "bg-sky-500", "text-sky-500")]
+
+    def test_missing_key(self) -> None:
+        """
+        Test that colors missing a key are rejected.
+
+        :return: None
+        """
+        with pytest.raises(ValueError, match="Invalid color"):
+            parse_palette(b'[{"value": "sky"}]', ".json")
+
+    def test_unsupported_format(self) -> None:
+        """
+        Test that unknown file formats are rejected.
+
+        :return: None
+        """
+        with pytest.raises(ValueError, match="Unsupported palette format"):
+            parse_palette(b"", ".yaml")
+
+
+class TestLoadPalette:
+    """Tests for load_palette()."""
+
+    def test_load(self, json_palette: Path) -> None:
+        """
+        Test loading a palette class from a file.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        palette = load_palette(json_palette)
+
+        assert issubclass(palette, CompactColorChoices)
+        assert palette.__name__ == "design"
+        assert palette().get_by_value("rose-700") == ColorOption(
+            "rose-700", "Rose 700", "bg-rose-700", "text-rose-700"
+        )
+        assert palette.for_field_type(FieldType.TEXT).choices[0] == (
+            "text-sky-500",
+            "Sky 500",
+        )
+
+    def test_load_toml_name(self, tmp_path: Path) -> None:
+        """
+        Test that the name in the file names the palette class.
+
+        :param tmp_path: The pytest tmp_path fixture
+        :return: None
+        """
+        path = tmp_path / "design.toml"
+        path.write_text(TOML_PALETTE)
+
+        assert load_palette(path).__name__ == "DesignColorChoices"
+        assert load_palette(path, name="Other").__name__ == "Other"
+
+    def test_same_file_same_class(self, json_palette: Path) -> None:
+        """
+        Test that an unchanged file loads the same class in a process.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        assert load_palette(json_palette) is load_palette(json_palette)
+
+    def test_writes_cache(self, json_palette: Path) -> None:
+        """
+        Test that loading compiles the cache file.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        load_palette(json_palette)
+
+        entry = read_cache(get_cache_path(json_palette))
+        assert entry[4] is None
+        assert entry[5][1] == (
+            "rose-700",
+            "Rose 700",
+            "bg-rose-700",
+            "text-rose-700",
+        )
+
+    def test_custom_cache_dir(
+        self, json_palette: Path, tmp_path: Path
+    ) -> None:
+        """
+        Test that the cache can be written to another directory.
+
+        :param json_palette: The JSON palette fixture
+        :param tmp_path: The pytest tmp_path fixture
+        :return: None
+        """
+        cache_dir = tmp_path / "cache"
+
+        load_palette(json_palette, cache_dir=cache_dir)
+
+        assert (cache_dir / "design.json.marshal").exists()
+
+
+class TestCompilePaletteFile:
+    """Tests for compile_palette_file()."""
+
+    def test_cache_skips_reading(self, json_palette: Path) -> None:
+        """
+        Test that a valid cache is used without reading the file.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        expected = compile_palette_file(json_palette)
+
+        with patch.object(Path, "read_bytes") as mock_read_bytes:
+            assert compile_palette_file(json_palette) == expected
+
+        mock_read_bytes.assert_not_called()
+
+    def test_touched_file_not_parsed(self, json_palette: Path) -> None:
+        """
+        Test that a file with a new mtime but the same content is not parsed.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        expected = compile_palette_file(json_palette)
+        stat = json_palette.stat()
+        os.utime(json_palette, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        with patch("django_colors.loaders.parse_palette") as mock_parse:
+            assert compile_palette_file(json_palette) == expected
+
+        mock_parse.assert_not_called()
+        entry = read_cache(get_cache_path(json_palette))
+        assert entry[1] == stat.st_mtime_ns + 1000
+
+    def test_changed_file_parsed(self, json_palette: Path) -> None:
+        """
+        Test that a changed file is parsed again.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        compile_palette_file(json_palette)
+        json_palette.write_text(json.dumps(COLORS[:1]))
+
+        _, rows = compile_palette_file(json_palette)
+
+        assert rows == [("sky-500", "Sky 500", "bg-sky-500", "text-sky-500")]
+
+    def test_corrupt_cache_ignored(self, json_palette: Path) -> None:
+        """
+        Test that unreadable cache files are rebuilt.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        cache_path = get_cache_path(json_palette)
+        cache_path.parent.mkdir()
+        cache_path.write_bytes(b"not marshal")
+
+        _, rows = compile_palette_file(json_palette)
+
+        assert len(rows) == 2
+        assert read_cache(cache_path) is not None
+
+    def test_read_only_cache_dir(self, json_palette: Path) -> None:
+        """
+        Test that failing to write the cache is not an error.
+
+        :param json_palette: The JSON palette fixture
+        :return: None
+        """
+        with patch(
+            "django_colors.loaders.tempfile.mkstemp", side_effect=OSError
+        ):
+            _, rows = compile_palette_file(json_palette)
+
+        assert len(rows) == 2
+        assert read_cache(get_cache_path(json_palette)) is None
+
+
+class TestLoadStylesheet:
+    """Tests for loading palettes from stylesheets."""
+
+    def test_load_css(self, tmp_path: Path) -> None:
+        """
+        Test that stylesheets are scanned for color classes.
+
+        :param tmp_path: The pytest tmp_path fixture
+        :return: None
+        """
+        path = tmp_path / "theme.css"
+        path.write_text(
+            ".bg-brand{background-color:#123}.text-brand{color:#123}"
+            ".text-center{text-align:center}"
+        )
+
+        palette = load_palette(path)
+
+        assert palette.__name__ == "theme"
+        assert palette().choices == [("bg-brand", "Brand")]
+
+    def test_css_scanned_in_chunks(self, tmp_path: Path) -> None:
+        """
+        Test that stylesheets are read in chunks and cached.
+
+        :param tmp_path: The pytest tmp_path fixture
+        :return: None
+        """
+        path = tmp_path / "theme.css"
+        path.write_text(
+            "".join(
+                f".bg-c{i}{{background:red}}.text-c{i}{{color:red}}"
+                for i in range(2000)
+            )
+        )
+
+        with patch("django_colors.loaders.CHUNK_SIZE", 1000):
+            _, rows = compile_palette_file(path)
+
+        assert len(rows) == 2000
+        assert rows[1999] == ("c1999", "C1999", "bg-c1999", "text-c1999")
+        with patch("django_colors.loaders.scan_stylesheet") as mock_scan:
+            assert compile_palette_file(path)[1] == rows
+        mock_scan.assert_not_called()
@@ -0,0 +1,61 @@
+"""Tests for the middleware module."""
+
+import asyncio
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from django_colors.cache import get_request_choices
+from django_colors.middleware import ColorChoicesMiddleware
+
+
+class TestColorChoicesMiddleware:
+    """Test the ColorChoicesMiddleware class."""
+
+    def test_sync_request_has_scope(self) -> None:
+        """
+        Test that a sync request is handled inside a choices scope.
+
+        :return: None
+        """
+        scopes = []
+
+        def get_response(request: HttpRequest) -> HttpResponse:
+            scopes.append(get_request_choices())
+            return HttpResponse()
+
+        middleware = ColorChoicesMiddleware(get_response)
+        middleware(RequestFactory().get("/"))
+        middleware(RequestFactory().get("/"))
+
+        assert scopes[0] is not None
+        assert scopes[1] is not None
+        assert scopes[0] is not scopes[1]
+        assert get_request_choices() is None
+
+    def test_async_request_has_scope(self) -> None:
+        """
+        Test that an async request is handled inside a choices scope.
+
+        :return: None
+        """
+        scopes = []
+
+        async def get_response(request: HttpRequest) -> HttpResponse:
+            scopes.append(get_request_choices())
+            return HttpResponse()
+
+        middleware = ColorChoicesMiddleware(get_response)
+
+        async def run() -> None:
+            await asyncio.gather(
+                middleware(RequestFactory().get("/")),
+                middleware(RequestFactory().get("/")),
+            )
+
+        asyncio.run(run())
+
+        assert len(scopes) == 2
+        assert None not in scopes
+        assert scopes[0] is not scopes[1]
+        assert get_request_choices() is None
@@ -0,0 +1,172 @@
+"""Tests for the palettes module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from django_colors.color_definitions import (
+    BootstrapColorChoices,
+    ColorChoices,
+    ColorOption,
+)
+from django_colors.palettes import (
+    get_palette,
+    get_palettes,
+    register_palette,
+    unregister_palette,
+)
+
+
+class RegistryColorChoices(ColorChoices):
+    """Palette for the registry tests."""
+
+    MINT = ColorOption("mint", "Mint", "bg-mint", "text-mint")
+
+
+@pytest.fixture
+def registered() -> None:
+    """
+    Register the test palette and remove it afterwards.
+
+    :return: None
+    """
+    register_palette("registry_test", RegistryColorChoices)
+    yield
+    unregister_palette("registry_test")
+
+
+class TestRegisterPalette:
+    """Tests for register_palette()."""
+
+    def test_register(self, registered: None) -> None:
+        """
+        Test that registered palettes are resolved by name.
+
+        :param registered: The registered palette fixture
+        :return: None
+        """
+        assert get_palette("registry_test") is RegistryColorChoices
+        assert get_palettes()["registry_test"] is RegistryColorChoices
+
+    def test_register_as_decorator(self) -> None:
+        """
+        Test registering a palette with the decorator form.
+
+        :return: None
+        """
+
+        @register_palette("decorated_test")
+        class DecoratedColorChoices(ColorChoices):
+            """Palette registered with the decorator."""
+
+        try:
+            assert get_palette("decorated_test") is DecoratedColorChoices
+        finally:
+            unregister_palette("decorated_test")
+
+    def test_register_same_palette_twice(self, registered: None) -> None:
+        """
+        Test that registering the same palette again is allowed.
+
+        :param registered: The registered palette fixture
+        :return: None
+        """
+        register_palette("registry_test", RegistryColorChoices)
+
+        assert get_palette("registry_test") is RegistryColorChoices
+
+    def test_register_taken_name(self, registered: None) -> None:
+        """
+        Test that a name can't be taken by another palette.
+
+        :param registered: The registered palette fixture
+        :return: None
+        """
+        with pytest.raises(ValueError, match="already registered"):
+            register_palette("registry_test", BootstrapColorChoices)
+
+    def test_register_dotted_name(self) -> None:
+        """
+        Test that names with dots are rejected.
+
+        :return: None
+        """
+        with pytest.raises(ValueError, match="reserved for import paths"):
+            register_palette("my.palette", RegistryColorChoices)
+
+    def test_register_not_a_palette(self) -> None:
+        """
+        Test that only ColorChoices subclasses can be registered.
+
+        :return: None
+        """
+        with pytest.raises(TypeError):
+            register_palette("not_a_palette", dict)
+
+
+class TestGetPalette:
+    """Tests for get_palette()."""
+
+    def test_bootstrap_registered(self) -> None:
+        """
+        Test that the bootstrap palette is registered by default.
+
+        :return: None
+        """
+        assert get_palette("bootstrap") is BootstrapColorChoices
+
+    def test_palette_class(self) -> None:
+        """
+        Test that palette classes are returned as they are.
+
+        :return: None
+        """
+        assert get_palette(RegistryColorChoices) is RegistryColorChoices
+
+    def test_import_path_imported_once(self) -> None:
+        """
+        Test that import paths are imported once and cached.
+
+        :return: None
+        """
+        path = "django_colors.tests.test_palettes.RegistryColorChoices"
+        unregister_palette(path)
+        try:
+            with patch(
+                "django_colors.palettes.import_string",
+                return_value=RegistryColorChoices,
+            ) as mock_import_string:
+                assert get_palette(path) is RegistryColorChoices
+                assert get_palette(path) is RegistryColorChoices
+
+            mock_import_string.assert_called_once_with(path)
+            assert path not in get_palettes()
+        finally:
+            unregister_palette(path)
+
+    def test_unknown_name(self) -> None:
+        """
+        Test that unknown names raise LookupError.
+
+        :return: None
+        """
+        with pytest.raises(LookupError, match="No palette"):
+            get_palette("unknown")
+
+    def test_bad_import_path(self) -> None:
+        """
+        Test that import paths that can't be imported raise ImportError.
+
+        :return: None
+        """
+        with pytest.raises(ImportError):
+            get_palette("nonexistent.module.ClassName")
+
+    def test_import_path_not_a_palette(self) -> None:
+        """
+        Test that import paths must point to a palette class.
+
+        :return: None
+        """
+        with pytest.raises(TypeError):
+            get_palette("django_colors.color_definitions.ColorOption")
@@ -0,0 +1,256 @@
+"""Tests for the query module."""
+
+import pytest
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_colors.color_definitions import ColorOption
+from django_colors.fields import ColorModelField
+from django_colors.query import attach_color_options
+from django_colors.tests.models import Thing
+
+
+@pytest.fixture
+def tables(palette_tables: pytest.fixture) -> None:
+    """
+    Create the tables of the shared test models with some rows.
+
+    :param palette_tables: The shared test tables fixture
+    :return: None
+    """
+    palette_tables(
+        ("Brand", "bg-brand", "text-brand"),
+        ("Brand Copy", "bg-brand", "text-copy"),
+    )
+    Thing.objects.create(
+        background="bg-brand", text="text-brand", plain="bg-primary"
+    )
+    Thing.objects.create(
+        background="bg-primary", text="text-copy", plain="bg-unknown"
+    )
+    Thing.objects.create(background="", text="", plain="")
+
+
+class TestWithColorOptions:
+    """Tests for ColorQuerySet.with_color_options()."""
+
+    def test_one_query_per_choice_model(self, tables: pytest.fixture) -> None:
+        """
+        Test that both fields sharing a choice model use one extra query.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        with CaptureQueriesContext(connection) as queries:
+            things = list(Thing.objects.with_color_options().order_by("pk"))
+            options = [
+                (
+                    thing.get_background_option(),
+                    thing.get_text_option(),
+                    thing.get_plain_option(),
+                )
+                for thing in things
+            ]
+
+        assert len(queries) == 2
+        assert options[0] == (
+            ColorOption("bg-brand", "Brand", "bg-brand", "text-brand"),
+            ColorOption("text-brand", "Brand", "bg-brand", "text-brand"),
+            ColorOption("blue", "Blue", "bg-primary", "text-primary"),
+        )
+        assert options[1][0].label == "Blue"
+        assert options[1][1].label == "Brand Copy"
+        assert options[1][2] is None
+        assert options[2] == (None, None, None)
+
+    def test_selected_fields_only(self, tables: pytest.fixture) -> None:
+        """
+        Test that only the named fields are resolved.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        things = list(Thing.objects.with_color_options("plain"))
+
+        with CaptureQueriesContext(connection) as queries:
+            things[0].get_plain_option()
+        assert len(queries) == 0
+
+        with CaptureQueriesContext(connection) as queries:
+            assert things[0].get_background_option().label == "Brand"
+        assert len(queries) == 1
+
+    def test_kept_through_chaining(self, tables: pytest.fixture) -> None:
+        """
+        Test that the fields to resolve are kept by chained querysets.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        queryset = (
+            Thing.objects.with_color_options("background")
+            .with_color_options("text")
+            .filter(background="bg-brand")
+        )
+
+        assert queryset._color_option_fields == ("background", "text")
+        thing = queryset.get()
+        with CaptureQueriesContext(connection) as queries:
+            assert thing.get_text_option().label == "Brand"
+        assert len(queries) == 0
+
+    def test_reassigned_value_is_looked_up(
+        self, tables: pytest.fixture
+    ) -> None:
+        """
+        Test that an attached option is not used for a new value.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        thing = Thing.objects.with_color_options().get(background="bg-brand")
+
+        thing.background = "bg-danger"
+
+        assert thing.get_background_option().label == "Red"
+
+    def test_values_querysets(self, tables: pytest.fixture) -> None:
+        """
+        Test that values() querysets are left alone.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        rows = list(
+            Thing.objects.with_color_options().values_list(
+                "background", flat=True
+            )
+        )
+
+        assert "bg-brand" in rows
+
+    def test_not_a_color_field(self, tables: pytest.fixture) -> None:
+        """
+        Test that other fields are rejected.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        with pytest.raises(ValueError, match="not a ColorModelField"):
+            Thing.objects.with_color_options("title")
+
+    def test_attach_to_empty_list(self) -> None:
+        """
+        Test that attaching to no instances does nothing.
+
+        :return: None
+        """
+        assert attach_color_options([], ["background"]) is None
+
+
+class TestGetOption:
+    """Tests for looking up the option of a single instance."""
+
+    def test_option_is_cached_per_instance(
+        self, tables: pytest.fixture
+    ) -> None:
+        """
+        Test that a custom color is looked up once per instance.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        thing = Thing.objects.get(background="bg-brand")
+
+        with CaptureQueriesContext(connection) as queries:
+            first = thing.get_background_option()
+            second = thing.get_background_option()
+            assert thing.get_plain_option().label == "Blue"
+
+        assert first is second
+        assert first.label == "Brand"
+        assert len(queries) == 1
+
+    def test_reassignment_ignores_cached_option(
+        self, tables: pytest.fixture
+    ) -> None:
+        """
+        Test that the cached option is only used for the value it belongs to.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        thing = Thing.objects.get(background="bg-brand")
+        thing.get_background_option()
+
+        thing.background = "bg-danger"
+
+        with CaptureQueriesContext(connection) as queries:
+            assert thing.get_background_option().label == "Red"
+        assert len(queries) == 0
+        # plain attribute reads, the descriptor does not intercept writes
+        assert not hasattr(type(Thing.background), "__set__")
+
+    def test_refresh_drops_cached_option(self, tables: pytest.fixture) -> None:
+        """
+        Test that reloading the values drops the cached options.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        thing = Thing.objects.get(background="bg-brand")
+        thing.get_background_option()
+        Thing.objects.filter(pk=thing.pk).update(background="bg-danger")
+
+        thing.refresh_from_db()
+
+        assert thing.get_background_option().label == "Red"
+
+    def test_deferred_field(self, tables: pytest.fixture) -> None:
+        """
+        Test that deferred color fields are still loaded on access.
+
+        :param tables: The test tables fixture
+        :return: None
+        """
+        thing = Thing.objects.defer("background").get(text="text-brand")
+
+        assert thing.get_background_option().label == "Brand"
+
+    def test_predefined_choices(self) -> None:
+        """
+        Test the options of fields with predefined choices.
+
+        :return: None
+        """
+        field = Thing._meta.get_field("plain")
+        field_choices = field.choices
+        field.choices = [("bg-a", "Apple")]
+        try:
+            thing = Thing(plain="bg-a")
+            assert thing.get_plain_option() == ColorOption(
+                value="bg-a", label="Apple", background_css="bg-a"
+            )
+        finally:
+            field.choices = field_choices
+
+    def test_user_defined_method_is_kept(self) -> None:
+        """
+        Test that a get_<field>_option method on the model is not replaced.
+
+        :return: None
+        """
+
+        class CustomThing(models.Model):
+            color = ColorModelField()
+
+            class Meta:
+                app_label = "test_app"
+
+            def __str__(self) -> str:
+                return self.color
+
+            def get_color_option(self) -> str:
+                return "custom"
+
+        assert CustomThing(color="bg-primary").get_color_option() == "custom"
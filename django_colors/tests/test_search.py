@@ -0,0 +1,438 @@
+"""Tests for the search module."""
+
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from django_colors.color_definitions import BootstrapColorChoices
+from django_colors.field_type import FieldType
+from django_colors.fields import ColorModelField
+from django_colors.search import (
+    ChoiceSearchIndex,
+    get_trigrams,
+    search_indexes,
+    search_match,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_search_indexes() -> None:
+    """
+    Drop the search indexes built by a test.
+
+    :return: None
+    """
+    yield
+    search_indexes.clear()
+
+
+class TestHelpers:
+    """Tests for the module helpers."""
+
+    def test_get_trigrams(self) -> None:
+        """
+        Test that trigrams are padded like pg_trgm.
+
+        :return: None
+        """
+        assert get_trigrams("red") == {"  r", " re", "red", "ed "}
+
+    @pytest.mark.parametrize(
+        ("text", "query", "prefix", "ignore_case", "expected"),
+        [
+            ("Brand Blue", "blue", False, True, True),
+            ("Brand Blue", "blue", False, False, False),
+            ("Brand Blue", "blue", True, True, False),
+            ("Brand Blue", "BR", True, True, True),
+        ],
+    )
+    def test_search_match(
+        self,
+        text: str,
+        query: str,
+        prefix: bool,
+        ignore_case: bool,
+        expected: bool,
+    ) -> None:
+        """
+        Test matching a text against a query.
+
+        :param text: The choice text
+        :param query: The query
+        :param prefix: Whether to match the start only
+        :param ignore_case: Whether to ignore case
+        :param expected: The expected result
+        :return: None
+        """
+        assert search_match(text, query, prefix, ignore_case) is expected
+
+
+class TestChoiceSearchIndex:
+    """Tests for the ChoiceSearchIndex class."""
+
+    @pytest.fixture
+    def index(self) -> ChoiceSearchIndex:
+        """
+        Create an index with default and custom choices.
+
+        :return: The search index
+        """
+        index = ChoiceSearchIndex.from_choices(
+            [("bg-primary", "Blue"), ("bg-danger", "Red")]
+        )
+        index.add(1, "bg-brand-blue", "Brand Blue", custom=True)
+        index.add(2, "bg-sky", "Sky", custom=True)
+        return index
+
+    def test_empty_query_lists_everything_in_order(
+        self, index: ChoiceSearchIndex
+    ) -> None:
+        """
+        Test that an empty query returns every choice in layout order.
+
+        :param index: The search index fixture
+        :return: None
+        """
+        assert index.search("") == [
+            ("bg-primary", "Blue"),
+            ("bg-danger", "Red"),
+            ("bg-brand-blue", "Brand Blue"),
+            ("bg-sky", "Sky"),
+        ]
+        assert len(index) == 4
+
+    def test_prefix_search(self, index: ChoiceSearchIndex) -> None:
+        """
+        Test that prefix searches match the start of values or labels.
+
+        :param index: The search index fixture
+        :return: None
+        """
+        assert index.search("B", prefix=True) == [
+            ("bg-primary", "Blue"),
+            ("bg-danger", "Red"),
+            ("bg-brand-blue", "Brand Blue"),
+            ("bg-sky", "Sky"),
+        ]
+        assert index.search("bl", prefix=True) == [("bg-primary", "Blue")]
+        assert index.search("bx", prefix=True) == []
+
+    @pytest.mark.parametrize("query", ["lu", "blue", "BLUE"])
+    def test_substring_search(
+        self, index: ChoiceSearchIndex, query: str
+    ) -> None:
+        """
+        Test substring searches, including queries shorter than a trigram.
+
+        :param index: The search index fixture
+        :param query: The query
+        :return: None
+        """
+        assert index.search(query) == [
+            ("bg-primary", "Blue"),
+            ("bg-brand-blue", "Brand Blue"),
+        ]
+
+    def test_case_sensitive_search(self, index: ChoiceSearchIndex) -> None:
+        """
+        Test that case is checked when ignore_case is off.
+
+        :param index: The search index fixture
+        :return: None
+        """
+        assert index.search("Blue", ignore_case=False) == [
+            ("bg-primary", "Blue"),
+            ("bg-brand-blue", "Brand Blue"),
+        ]
+        assert index.search("BLUE", ignore_case=False) == []
+
+    def test_fuzzy_search(self, index: ChoiceSearchIndex) -> None:
+        """
+        Test that fuzzy searches rank similar choices after the matches.
+
+        :param index: The search index fixture
+        :return: None
+        """
+        assert index.search("blu") == [
+            ("bg-primary", "Blue"),
+            ("bg-brand-blue", "Brand Blue"),
+        ]
+        assert index.search("bluee") == []
+        assert index.search("bluee", fuzzy=True)[0] == ("bg-primary", "Blue")
+
+    def test_add_replaces_and_remove_prunes(
+        self, index: ChoiceSearchIndex
+    ) -> None:
+        """
+        Test that entries are replaced and removed incrementally.
+
+        :param index: The search index fixture
+        :return: None
+        """
+        index.add(2, "bg-teal", "Teal", custom=True)
+
+        assert index.search("sky") == []
+        assert index.search("teal") == [("bg-teal", "Teal")]
+
+        index.remove(2)
+        index.remove(2)
+
+        assert index.search("te", prefix=True) == []
+        assert "t" not in index._trie.children
+        assert "tea" not in index._trigrams
+
+    @pytest.mark.parametrize(
+        ("layout", "expected"),
+        [
+            ("defaults_first", ["Blue", "Red", "Amber", "Sky"]),
+            ("custom_first", ["Amber", "Sky", "Blue", "Red"]),
+            ("mixed", ["Amber", "Blue", "Red", "Sky"]),
+        ],
+    )
+    def test_layout_order(self, layout: str, expected: list[str]) -> None:
+        """
+        Test that results follow the layout and sort options.
+
+        :param layout: The layout of the index
+        :param expected: The expected label order
+        :return: None
+        """
+        index = ChoiceSearchIndex.from_choices(
+            [("bg-danger", "Red"), ("bg-primary", "Blue")], layout=layout
+        )
+        index.add(1, "bg-sky", "Sky", custom=True)
+        index.add(2, "bg-amber", "Amber", custom=True)
+
+        assert [label for _, label in index.search("")] == expected
+
+    def test_duplicate_choices_are_listed_once(self) -> None:
+        """
+        Test that equal choices of different rows are listed once.
+
+        :return: None
+        """
+        index = ChoiceSearchIndex()
+        index.add(1, "bg-sky", "Sky", custom=True)
+        index.add(2, "bg-sky", "Sky", custom=True)
+
+        assert index.search("sky") == [("bg-sky", "Sky")]
+
+
+class TestSearchIndexRegistry:
+    """Tests for the field search indexes."""
+
+    def get_field(
+        self,
+        mock_field_config: pytest.fixture,
+        choice_model: type,
+        choice_filters: dict | None = None,
+        search_index: bool = True,
+    ) -> ColorModelField:
+        """
+        Create a field using the mocked field config.
+
+        :param mock_field_config: Mock field config fixture
+        :param choice_model: The choice model to use
+        :param choice_filters: The configured choice filters
+        :param search_index: Whether the search index is enabled
+        :return: The configured field
+        """
+        field = ColorModelField()
+        mock_field_config.get.side_effect = lambda key: {
+            "choice_filters": choice_filters or {},
+            "color_type": FieldType.BACKGROUND,
+            "only_use_custom_colors": False,
+            "search_index": search_index,
+        }[key]
+        type(mock_field_config).choice_model = PropertyMock(
+            return_value=choice_model
+        )
+        type(mock_field_config).default_color_choices = PropertyMock(
+            return_value=BootstrapColorChoices
+        )
+        field.field_config = mock_field_config
+        return field
+
+    @pytest.fixture
+    def custom_colors(self, color_model_table: pytest.fixture) -> type:
+        """
+        Create a few custom colors in the database.
+
+        :param color_model_table: The concrete color model with a table
+        :return: The concrete color model
+        """
+        for name in ("Brand Blue", "Brand Red", "Sky", "Inactive"):
+            color_model_table.objects.create(
+                name=name,
+                background_css=f"bg-{name.lower().replace(' ', '-')}",
+                text_css="active" if name != "Inactive" else "inactive",
+            )
+        return color_model_table
+
+    @pytest.mark.parametrize(
+        "layout", ["defaults_first", "custom_first", "mixed"]
+    )
+    @pytest.mark.parametrize(
+        ("query", "prefix"), [("", False), ("b", True), ("re", False)]
+    )
+    def test_matches_database_search(
+        self,
+        mock_field_config: pytest.fixture,
+        custom_colors: pytest.fixture,
+        layout: str,
+        query: str,
+        prefix: bool,
+    ) -> None:
+        """
+        Test that the index finds what the database search finds.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :param layout: The layout to use
+        :param query: The query
+        :param prefix: Whether to match the start only
+        :return: None
+        """
+        indexed = self.get_field(mock_field_config, custom_colors)
+        expected = indexed.search_choices(query, limit=100, layout=layout)
+        database = self.get_field(
+            mock_field_config, custom_colors, search_index=False
+        )
+
+        assert expected == database.search_choices(
+            query, limit=100, layout=layout
+        )
+
+    def test_index_is_built_once(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that searches after the first do not query the database.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+        field.search_choices("sky")
+
+        with CaptureQueriesContext(connection) as queries:
+            assert field.search_choices("sky") == [("bg-sky", "Sky")]
+            assert field.search_choices("brand", limit=1, offset=1) == [
+                ("bg-brand-red", "Brand Red")
+            ]
+
+        assert len(queries) == 0
+
+    def test_rows_are_updated_incrementally(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that saved and deleted rows update the index.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+        index = field.get_search_index()
+        sky = custom_colors.objects.get(name="Sky")
+
+        sky.name = "Sky Foam"
+        sky.save()
+        custom_colors.objects.create(
+            name="Foam", background_css="bg-foam", text_css="active"
+        )
+        custom_colors.objects.get(name="Brand Red").delete()
+
+        assert field.get_search_index() is index
+        assert field.search_choices("foam") == [
+            ("bg-foam", "Foam"),
+            ("bg-sky", "Sky Foam"),
+        ]
+        assert field.search_choices("brand") == [
+            ("bg-brand-blue", "Brand Blue")
+        ]
+
+    def test_filtered_rows(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that rows leave and join the index as they match the filters.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(
+            mock_field_config, custom_colors, {"text_css": "active"}
+        )
+        assert field.search_choices("inactive") == []
+
+        inactive = custom_colors.objects.get(name="Inactive")
+        inactive.text_css = "active"
+        inactive.save()
+        sky = custom_colors.objects.get(name="Sky")
+        sky.text_css = "inactive"
+        sky.save()
+
+        assert field.search_choices("inactive") == [
+            ("bg-inactive", "Inactive")
+        ]
+        assert field.search_choices("sky") == []
+
+    def test_relation_changes_drop_the_index(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that many-to-many changes rebuild the index on next use.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(mock_field_config, custom_colors)
+        index = field.get_search_index()
+        through = type("Through", (), {})
+
+        with patch(
+            "django_colors.search.get_through_models", return_value=[through]
+        ):
+            search_indexes._relations_changed(through, action="pre_add")
+            assert field.get_search_index() is index
+            search_indexes._relations_changed(through, action="post_add")
+
+        assert field.get_search_index() is not index
+
+    def test_fuzzy_without_index_setting(
+        self, mock_field_config: pytest.fixture, custom_colors: pytest.fixture
+    ) -> None:
+        """
+        Test that fuzzy searches match substrings without an index.
+
+        :param mock_field_config: Mock field config fixture
+        :param custom_colors: The color model with custom colors
+        :return: None
+        """
+        field = self.get_field(
+            mock_field_config, custom_colors, search_index=False
+        )
+
+        with patch.object(field, "get_search_index") as get_search_index:
+            assert field.search_choices("brand bleu", fuzzy=True) == []
+            assert field.search_choices("brand blu", fuzzy=True) == [
+                ("bg-brand-blue", "Brand Blue")
+            ]
+        get_search_index.assert_not_called()
+
+    def test_predefined_choices_fuzzy(self) -> None:
+        """
+        Test fuzzy searches of predefined choices.
+
+        :return: None
+        """
+        field = ColorModelField(choices=[("bg-a", "Apple"), ("bg-b", "Pear")])
+
+        assert field.search_choices("aple", fuzzy=True) == [("bg-a", "Apple")]
@@ -3,10 +3,20 @@
 from unittest.mock import ANY, Mock, patch
 
 import pytest
+from django.test import override_settings
 
 from django_colors.color_definitions import BootstrapColorChoices, ColorChoices
 from django_colors.field_type import FieldType
-from django_colors.settings import CONFIG_DEFAULTS, FieldConfig, get_config
+from django_colors.settings import (
+    CONFIG_DEFAULTS,
+    ConfigTable,
+    FieldConfig,
+    get_cache_aliases,
+    get_config,
+    get_config_table,
+    merge_settings_config,
+)
+from django_colors.tests.models import Thing
 
 
 class TestConfigDefaults:
@@ -152,27 +162,17 @@ class TestFieldConfig:
         assert field_config.config["choice_filters"] == {}
         assert field_config.config["only_use_custom_colors"] is False
 
-    @patch("django_colors.settings.get_config")
-    def test_init_with_django_settings(self, mock_get_config: Mock) -> None:
+    def test_init_with_django_settings(self) -> None:
         """
         Test initialization with Django settings.
 
-        :param mock_get_config: Mock for the get_config function
         :return: None
         """
         # Create a mock model class with _meta
         model_class = Mock()
         model_class._meta = Mock()
         model_class._meta.app_label = "test_app"
-        model_class.__class__.__name__ = "TestModel"
-
-        # Create mock field class
-        field_class = Mock()
-        field_class.default_color_choices = None
-        field_class.color_type = None
-        field_class.choice_model = None
-        field_class.choice_queryset = None
-        field_class.only_use_custom_colors = None
+        model_class._meta.object_name = "TestModel"
 
         # Setup Django settings
         django_settings = {
@@ -183,25 +183,11 @@ class TestFieldConfig:
             "test_app": {"default_color_choices": ColorChoices},
         }
 
-        # Set up the patched get_config to return our settings
-        mock_get_config.return_value = django_settings
-
-        # Patch the get_settings_config method to return our custom settings
         with (
-            patch.object(
-                FieldConfig, "get_settings_config"
-            ) as mock_get_settings_config,
+            override_settings(COLORS_APP_CONFIG=django_settings),
             patch.object(FieldConfig, "get_field_config", return_value={}),
         ):
-            # Setup the mock to return app-specific settings
-            mock_get_settings_config.return_value = {
-                "default_color_choices": ColorChoices,
-                "color_type": "TEXT",
-                "only_use_custom_colors": False,
-            }
-
-            # Create the field config
-            field_config = FieldConfig(model_class, field_class, "test_field")
+            field_config = FieldConfig(model_class, Mock(), "test_field")
 
         # Should prioritize settings from the Django settings
         assert field_config.config["default_color_choices"] == ColorChoices
@@ -333,7 +319,7 @@ class TestFieldConfig:
         model_class = Mock()
         model_class._meta = Mock()
         model_class._meta.app_label = "test_app"
-        model_class.__class__.__name__ = "TestModel"
+        model_class._meta.object_name = "TestModel"
 
         # Setup Django settings with hierarchy
         django_settings = {
@@ -354,26 +340,6 @@ class TestFieldConfig:
         # Create a field config instance without init
         field_config = FieldConfig.__new__(FieldConfig)
 
-        # Manually implement the method to test it directly
-        hierarchy_settings_config = {}
-
-        # Copy values from default
-        hierarchy_settings_config.update(django_settings.get("default", {}))
-
-        # Update with app-specific settings
-        hierarchy_settings_config.update(django_settings.get("test_app", {}))
-
-        # Update with model-specific settings
-        model_key = (
-            f"{model_class._meta.app_label}.{model_class.__class__.__name__}"
-        )
-        hierarchy_settings_config.update(django_settings.get(model_key, {}))
-
-        # Update with field-specific settings
-        field_key = f"{model_key}.test_field"
-        hierarchy_settings_config.update(django_settings.get(field_key, {}))
-
-        # Now test the actual method
         result = field_config.get_settings_config(
             django_settings, model_class, "test_field"
         )
@@ -385,6 +351,27 @@ class TestFieldConfig:
         )  # From model level
         assert result["only_use_custom_colors"] is True  # From field level
 
+    def test_get_settings_config_does_not_modify_settings(self) -> None:
+        """
+        Test that get_settings_config leaves the settings untouched.
+
+        :return: None
+        """
+        model_class = Mock()
+        model_class._meta.app_label = "test_app"
+        model_class._meta.object_name = "TestModel"
+        django_settings = {
+            "default": {"color_type": "TEXT"},
+            "test_app": {"only_use_custom_colors": True},
+        }
+        field_config = FieldConfig.__new__(FieldConfig)
+
+        field_config.get_settings_config(
+            django_settings, model_class, "test_field"
+        )
+
+        assert django_settings["default"] == {"color_type": "TEXT"}
+
     def test_get_field_config(self) -> None:
         """
         Test the get_field_config method.
@@ -813,3 +800,152 @@ class TestFieldConfigStringResolution:
 
         with pytest.raises(ValueError, match="Invalid colors reference"):
             _ = config_instance.default_color_choices
+
+    def test_default_color_choices_palette_name(self) -> None:
+        """Test that palette names from the settings are resolved."""
+        mock_model_class = Mock()
+        mock_model_class._meta.app_label = "testapp"
+        mock_model_class._meta.object_name = "TestModel"
+        mock_field = Mock(
+            choice_model=None,
+            choice_filters=None,
+            color_type=None,
+            default_color_choices=None,
+            only_use_custom_colors=None,
+            validate_choices=None,
+        )
+
+        with override_settings(
+            COLORS_APP_CONFIG={
+                "testapp": {"default_color_choices": "bootstrap"},
+                "testapp.TestModel": {
+                    "default_color_choices": (
+                        "django_colors.color_definitions.BootstrapColorChoices"
+                    )
+                },
+            }
+        ):
+            by_path = FieldConfig(mock_model_class, mock_field, "test_field")
+            mock_model_class._meta.object_name = "OtherModel"
+            by_name = FieldConfig(mock_model_class, mock_field, "test_field")
+
+        assert by_name.default_color_choices is BootstrapColorChoices
+        assert by_path.default_color_choices is BootstrapColorChoices
+
+
+class TestConfigTable:
+    """Test the ConfigTable class."""
+
+    django_settings = {
+        "default": {"color_type": "TEXT", "cache_alias": "colors"},
+        "test_app": {"color_type": "BACKGROUND"},
+        "test_app.TestModel": {"only_use_custom_colors": True},
+        "test_app.TestModel.test_field": {"cache_alias": "other"},
+    }
+
+    def test_lookup_levels(self) -> None:
+        """
+        Test that each lookup gets the most specific compiled level.
+
+        :return: None
+        """
+        table = ConfigTable(self.django_settings)
+
+        field = table.lookup("test_app", "TestModel", "test_field")
+        model = table.lookup("test_app", "TestModel", "other_field")
+        app = table.lookup("test_app", "OtherModel", "test_field")
+        default = table.lookup("other_app", "TestModel", "test_field")
+
+        assert field["cache_alias"] == "other"
+        assert field["only_use_custom_colors"] is True
+        assert field["color_type"] == FieldType.BACKGROUND
+        assert model["cache_alias"] == "colors"
+        assert model["only_use_custom_colors"] is True
+        assert app["only_use_custom_colors"] is False
+        assert app["color_type"] == FieldType.BACKGROUND
+        assert default["color_type"] == FieldType.TEXT
+        assert default["validate_choices"] is False
+
+    def test_lookup_shares_read_only_levels(self) -> None:
+        """
+        Test that lookups return the same read-only mapping.
+
+        :return: None
+        """
+        table = ConfigTable(self.django_settings)
+
+        config = table.lookup("test_app", "OtherModel", "a")
+
+        assert config is table.lookup("test_app", "AnotherModel", "b")
+        with pytest.raises(TypeError):
+            config["color_type"] = FieldType.TEXT
+
+    def test_compile_does_not_modify_settings(self) -> None:
+        """
+        Test that compiling the table leaves the settings untouched.
+
+        :return: None
+        """
+        ConfigTable(self.django_settings)
+
+        assert self.django_settings["default"] == {
+            "color_type": "TEXT",
+            "cache_alias": "colors",
+        }
+        assert CONFIG_DEFAULTS["default"]["color_type"] == "BACKGROUND"
+
+    def test_cache_aliases(self) -> None:
+        """
+        Test that the cache aliases of every level are collected.
+
+        :return: None
+        """
+        table = ConfigTable(self.django_settings)
+
+        assert table.cache_aliases == {"colors", "other"}
+
+    def test_rebuilt_on_setting_changed(self) -> None:
+        """
+        Test that the table is recompiled when the setting changes.
+
+        :return: None
+        """
+        table = get_config_table()
+
+        with override_settings(COLORS_APP_CONFIG=self.django_settings):
+            assert get_config_table() is not table
+            assert get_cache_aliases() == {"colors", "other"}
+
+        assert get_cache_aliases() == frozenset()
+
+    def test_fields_resolved_again_on_setting_changed(self) -> None:
+        """
+        Test that resolved fields pick up the changed setting.
+
+        :return: None
+        """
+        field = Thing._meta.get_field("plain")
+        assert field.field_config.get("cache_choices") is False
+
+        with override_settings(
+            COLORS_APP_CONFIG={"default": {"cache_choices": True}}
+        ):
+            assert field.field_config.get("cache_choices") is True
+
+        assert field.field_config.get("cache_choices") is False
+
+    def test_merge_settings_config(self) -> None:
+        """
+        Test merging the levels that apply to a field.
+
+        :return: None
+        """
+        config = merge_settings_config(
+            self.django_settings, "test_app", "TestModel"
+        )
+
+        assert config == {
+            "color_type": "BACKGROUND",
+            "cache_alias": "colors",
+            "only_use_custom_colors": True,
+        }
@@ -0,0 +1,126 @@
+"""Tests for the stylesheets module."""
+
+import pytest
+
+from django_colors.stylesheets import (
+    ColorClassScanner,
+    get_label,
+    get_properties,
+    scan_stylesheet,
+)
+
+STYLESHEET = """
+/* Bootstrap-like utilities { bg-commented } */
+.bg-primary{--bs-bg-opacity:1;background-color:rgba(13,110,253,1)!important}
+.text-primary{--bs-text-opacity:1;color:rgba(13,110,253,1)!important}
+.bg-danger, .bg-danger-subtle {background-color: #dc3545}
+.text-danger{color:#dc3545}
+.text-danger-subtle{color:#58151c}
+.text-center{text-align:center!important}
+.bg-gradient{background-image:var(--bs-gradient)!important}
+.text-gradient{color:red}
+.btn .bg-info{background-color:#0dcaf0}
+.text-info{color:#0dcaf0}
+.bg-primary:hover{background-color:#000}
+@media (min-width: 576px) {
+  .bg-teal { background: #20c997 }
+  .text-teal { color: #20c997 }
+  .sm\\:bg-red-500 { background-color: red }
+}
+/* .bg-ghost{background-color:#fff} .text-ghost{color:#fff} */
+"""
+
+EXPECTED = [
+    ("primary", "Primary", "bg-primary", "text-primary"),
+    ("danger", "Danger", "bg-danger", "text-danger"),
+    (
+        "danger-subtle",
+        "Danger Subtle",
+        "bg-danger-subtle",
+        "text-danger-subtle",
+    ),
+    ("teal", "Teal", "bg-teal", "text-teal"),
+]
+
+
+def split(text: str, size: int) -> list[str]:
+    """
+    Split a text into chunks of a fixed size.
+
+    :param text: The text to split
+    :param size: The chunk size
+    :return: List of chunks
+    """
+    return [text[start : start + size] for start in range(0, len(text), size)]
+
+
+class TestScanStylesheet:
+    """Tests for scan_stylesheet()."""
+
+    def test_whole_stylesheet(self) -> None:
+        """
+        Test scanning a stylesheet in one chunk.
+
+        :return: None
+        """
+        assert scan_stylesheet([STYLESHEET]) == EXPECTED
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 61])
+    def test_chunk_boundaries(self, size: int) -> None:
+        """
+        Test that rules and comments split across chunks are found.
+
+        :param size: The chunk size
+        :return: None
+        """
+        assert scan_stylesheet(split(STYLESHEET, size)) == EXPECTED
+
+    def test_carry_is_bounded(self) -> None:
+        """
+        Test that only the unfinished rule is kept between chunks.
+
+        :return: None
+        """
+        scanner = ColorClassScanner()
+        scanner.feed(".bg-a{background:red}" * 1000 + ".text-a{col")
+
+        assert scanner._carry == ".text-a{col"
+        scanner.feed("or:red}")
+        assert scanner._carry == ""
+        assert scanner.close() == [("a", "A", "bg-a", "text-a")]
+
+    def test_unclosed_comment_carried(self) -> None:
+        """
+        Test that a comment left open at the end of a chunk is kept.
+
+        :return: None
+        """
+        scanner = ColorClassScanner()
+        scanner.feed(".bg-a{background:red} /* .text-a{")
+        scanner.feed("color:red} */ .text-b{color:red}")
+
+        assert scanner.colors["text"] == {"b": None}
+
+
+class TestHelpers:
+    """Tests for the helper functions."""
+
+    def test_get_properties(self) -> None:
+        """
+        Test getting the property names of a declaration block.
+
+        :return: None
+        """
+        assert get_properties(" Color : red; --x: 1;background:0 ") == {
+            "color",
+            "--x",
+            "background",
+        }
+
+    def test_get_label(self) -> None:
+        """
+        Test building labels from color names.
+
+        :return: None
+        """
+        assert get_label("red-500") == "Red 500"
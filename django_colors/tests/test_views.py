@@ -0,0 +1,268 @@
+"""Tests for the views module."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.http import Http404
+from django.test import RequestFactory
+
+from django_colors.fields import ColorModelField
+from django_colors.views import (
+    MAX_LIMIT,
+    ColorAutocompleteView,
+    color_autocomplete,
+    get_color_field,
+    get_positive_int,
+)
+
+
+class TestGetColorField:
+    """Test resolving color fields from their path."""
+
+    def test_resolves_color_field(self) -> None:
+        """
+        Test that a color field is returned for its path.
+
+        :return: None
+        """
+        field = ColorModelField()
+        model = Mock()
+        model._meta.get_field.return_value = field
+        with patch(
+            "django_colors.views.apps.get_model", return_value=model
+        ) as get_model:
+            assert get_color_field("app.Palette.color") is field
+
+        get_model.assert_called_once_with("app.Palette")
+        model._meta.get_field.assert_called_once_with("color")
+
+    @pytest.mark.parametrize(
+        "error", [LookupError, ValueError, FieldDoesNotExist]
+    )
+    def test_unknown_field(self, error: type[Exception]) -> None:
+        """
+        Test that unknown models and fields raise Http404.
+
+        :param error: The error raised while resolving the field
+        :return: None
+        """
+        with (
+            patch("django_colors.views.apps.get_model", side_effect=error),
+            pytest.raises(Http404),
+        ):
+            get_color_field("app.Palette.color")
+
+    def test_not_a_color_field(self) -> None:
+        """
+        Test that other fields are not exposed.
+
+        :return: None
+        """
+        model = Mock()
+        model._meta.get_field.return_value = Mock()
+        with (
+            patch("django_colors.views.apps.get_model", return_value=model),
+            pytest.raises(Http404),
+        ):
+            get_color_field("auth.User.password")
+
+
+def get_request(params: dict | None = None, perms: bool = True) -> Mock:
+    """
+    Build an autocomplete request for a user.
+
+    :param params: The query parameters
+    :param perms: Whether the user has every permission
+    :return: The request
+    """
+    request = RequestFactory().get("/autocomplete/", params or {})
+    request.user = Mock()
+    request.user.has_perm.return_value = perms
+    return request
+
+
+def get_field(autocomplete: bool = True) -> Mock:
+    """
+    Build a color field mock.
+
+    :param autocomplete: Whether autocomplete is enabled for the field
+    :return: The field mock
+    """
+    field = Mock()
+    field.field_config.get.side_effect = {"autocomplete": autocomplete}.get
+    field.model._meta.app_label = "app"
+    field.model._meta.model_name = "palette"
+    field.search_choices.return_value = []
+    return field
+
+
+class TestColorAutocomplete:
+    """Test the autocomplete view."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, 5), ("3", 3), ("0", 5), ("-2", 5), ("x", 5)],
+    )
+    def test_get_positive_int(self, value: str | None, expected: int) -> None:
+        """
+        Test parsing positive integer parameters.
+
+        :param value: The raw parameter
+        :param expected: The expected number
+        :return: None
+        """
+        assert get_positive_int(value, 5) == expected
+
+    def test_results_and_pagination(self) -> None:
+        """
+        Test the select2 formatted response and the page offset.
+
+        :return: None
+        """
+        field = get_field()
+        field.search_choices.return_value = [
+            ("bg-a", "A"),
+            ("bg-b", "B"),
+            ("bg-c", "C"),
+        ]
+        request = get_request(
+            {
+                "field": "app.Palette.color",
+                "q": " bl ",
+                "page": "3",
+                "limit": "2",
+                "match": "prefix",
+            },
+        )
+        with patch("django_colors.views.get_color_field", return_value=field):
+            response = color_autocomplete(request)
+
+        field.search_choices.assert_called_once_with(
+            "bl", limit=3, offset=4, prefix=True, fuzzy=False
+        )
+        assert response.status_code == 200
+        assert json.loads(response.content) == {
+            "results": [
+                {"id": "bg-a", "text": "A"},
+                {"id": "bg-b", "text": "B"},
+            ],
+            "pagination": {"more": True},
+        }
+
+    def test_limit_is_capped(self) -> None:
+        """
+        Test that the page size cannot exceed MAX_LIMIT.
+
+        :return: None
+        """
+        field = get_field()
+        request = get_request({"limit": "100000"})
+        with patch("django_colors.views.get_color_field", return_value=field):
+            response = color_autocomplete(request)
+
+        field.search_choices.assert_called_once_with(
+            "", limit=MAX_LIMIT + 1, offset=0, prefix=False, fuzzy=False
+        )
+        assert json.loads(response.content)["pagination"] == {"more": False}
+
+    def test_fuzzy_match(self) -> None:
+        """
+        Test that match=fuzzy asks for a fuzzy search.
+
+        :return: None
+        """
+        field = get_field()
+        field.search_choices.return_value = [("bg-primary", "Blue")]
+        request = get_request({"q": "bleu", "match": "fuzzy"})
+        with patch("django_colors.views.get_color_field", return_value=field):
+            response = color_autocomplete(request)
+
+        field.search_choices.assert_called_once_with(
+            "bleu", limit=21, offset=0, prefix=False, fuzzy=True
+        )
+        assert json.loads(response.content)["results"] == [
+            {"id": "bg-primary", "text": "Blue"}
+        ]
+
+    def test_only_get(self) -> None:
+        """
+        Test that other methods are not allowed.
+
+        :return: None
+        """
+        request = RequestFactory().post("/autocomplete/")
+
+        assert color_autocomplete(request).status_code == 405
+
+    def test_autocomplete_not_enabled(self) -> None:
+        """
+        Test that fields without autocomplete enabled are not exposed.
+
+        :return: None
+        """
+        field = get_field(autocomplete=False)
+        with (
+            patch("django_colors.views.get_color_field", return_value=field),
+            pytest.raises(Http404),
+        ):
+            color_autocomplete(get_request())
+
+        field.search_choices.assert_not_called()
+
+    def test_permission_denied(self) -> None:
+        """
+        Test that users need the view permission of the field's model.
+
+        :return: None
+        """
+        field = get_field()
+        request = get_request(perms=False)
+        with (
+            patch("django_colors.views.get_color_field", return_value=field),
+            pytest.raises(PermissionDenied),
+        ):
+            color_autocomplete(request)
+
+        request.user.has_perm.assert_called_once_with("app.view_palette")
+        field.search_choices.assert_not_called()
+
+    @pytest.mark.parametrize("with_user", [True, False])
+    def test_anonymous_denied(self, with_user: bool) -> None:
+        """
+        Test that anonymous requests cannot search by default.
+
+        :param with_user: Whether the request has an anonymous user
+        :return: None
+        """
+        request = RequestFactory().get("/autocomplete/")
+        if with_user:
+            request.user = AnonymousUser()
+        with (
+            patch(
+                "django_colors.views.get_color_field", return_value=get_field()
+            ),
+            pytest.raises(PermissionDenied),
+        ):
+            color_autocomplete(request)
+
+    def test_has_perm_override(self) -> None:
+        """
+        Test that subclasses can change who may search.
+
+        :return: None
+        """
+
+        class PublicView(ColorAutocompleteView):
+            def has_perm(self, request: Mock, field: Mock) -> bool:
+                return True
+
+        field = get_field()
+        request = RequestFactory().get("/autocomplete/")
+        with patch("django_colors.views.get_color_field", return_value=field):
+            response = PublicView.as_view()(request)
+
+        assert response.status_code == 200
+        field.search_choices.assert_called_once()
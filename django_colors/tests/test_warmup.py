@@ -0,0 +1,223 @@
+"""Tests for the warmup module and the colors_warmup command."""
+
+from io import StringIO
+from unittest.mock import Mock, call, patch
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+import django_colors
+from django_colors.cache import choices_cache
+from django_colors.tests.models import Palette, Thing
+from django_colors.warmup import (
+    WarmupReport,
+    get_all_color_fields,
+    preload,
+)
+
+WARMUP_CONFIG = {
+    "test_app.Thing": {"cache_choices": True},
+    "test_app.Thing.plain": {"default_color_choices": "missing"},
+}
+
+
+@pytest.fixture
+def tables(palette_tables: pytest.fixture) -> None:
+    """
+    Create the tables of the shared test models with a custom color.
+
+    :param palette_tables: The shared test tables fixture
+    :return: None
+    """
+    palette_tables(("Brand", "bg-brand", "text-brand"))
+    yield
+    choices_cache.clear()
+
+
+@pytest.fixture
+def warmup_config() -> None:
+    """
+    Configure the warmup test fields.
+
+    Only the warmup test fields are warmed, since the test models are not
+    part of an installed app.
+
+    :return: None
+    """
+    fields = [Thing._meta.get_field(name) for name in ("background", "plain")]
+    with (
+        override_settings(COLORS_APP_CONFIG=WARMUP_CONFIG),
+        patch(
+            "django_colors.warmup.get_all_color_fields", return_value=fields
+        ),
+    ):
+        yield
+
+
+class TestGetAllColorFields:
+    """Tests for get_all_color_fields()."""
+
+    def test_lists_color_fields(self) -> None:
+        """
+        Test that the color fields of installed models are listed.
+
+        :return: None
+        """
+        with patch(
+            "django_colors.checks.apps.get_models",
+            return_value=[Palette, Thing],
+        ):
+            color_fields = get_all_color_fields()
+
+        assert color_fields == [
+            Thing._meta.get_field(name)
+            for name in ("background", "text", "plain")
+        ]
+
+
+@pytest.mark.usefixtures("tables", "warmup_config")
+class TestPreload:
+    """Tests for preload()."""
+
+    def test_resolves_and_caches(self) -> None:
+        """
+        Test that fields are resolved and their choices cached.
+
+        :return: None
+        """
+        with patch("django_colors.warmup.gc") as mock_gc:
+            report = preload()
+
+        assert "test_app.Thing.background" in report.fields
+        assert "test_app.Thing.background" in report.choices
+        assert "BootstrapColorChoices" in report.palettes
+        assert report.frozen
+        mock_gc.freeze.assert_called_once_with()
+        assert set(report.timings) == {"fields", "config", "choices", "freeze"}
+        assert report.duration == sum(report.timings.values())
+        assert choices_cache._store.get(Palette)
+
+    def test_records_errors(self) -> None:
+        """
+        Test that configuration errors are reported by field.
+
+        :return: None
+        """
+        report = preload(freeze=False)
+
+        assert "test_app.Thing.plain" not in report.fields
+        assert (
+            "Invalid colors reference"
+            in (report.errors["test_app.Thing.plain"])
+        )
+
+    def test_records_invalid_color_type(self) -> None:
+        """
+        Test that an unknown color type is reported like the system check.
+
+        :return: None
+        """
+        config = {
+            **WARMUP_CONFIG,
+            "test_app.Thing.background": {"color_type": "PURPLE"},
+        }
+        with override_settings(COLORS_APP_CONFIG=config):
+            report = preload(freeze=False)
+
+        assert "test_app.Thing.background" not in report.fields
+        assert (
+            "invalid configuration"
+            in (report.errors["test_app.Thing.background"])
+        )
+
+    def test_closes_connections_before_freeze(self) -> None:
+        """
+        Test that no database connection is left open for the workers.
+
+        :return: None
+        """
+        manager = Mock()
+        with (
+            patch("django_colors.warmup.gc", manager.gc),
+            patch("django_colors.warmup.connections", manager.connections),
+        ):
+            preload()
+
+        assert manager.mock_calls == [
+            call.connections.close_all(),
+            call.gc.freeze(),
+        ]
+
+    def test_without_freeze(self) -> None:
+        """
+        Test that gc.freeze() is only called when asked.
+
+        :return: None
+        """
+        with patch("django_colors.warmup.gc") as mock_gc:
+            report = preload(freeze=False)
+
+        assert not report.frozen
+        assert "freeze" not in report.timings
+        mock_gc.freeze.assert_not_called()
+
+    def test_package_preload(self) -> None:
+        """
+        Test that django_colors.preload() runs the warmup.
+
+        :return: None
+        """
+        report = django_colors.preload(freeze=False)
+
+        assert isinstance(report, WarmupReport)
+        assert "test_app.Thing.background" in report.fields
+
+
+class TestColorsWarmupCommand:
+    """Tests for the colors_warmup command."""
+
+    def test_reports_results(self) -> None:
+        """
+        Test that the command prints the report.
+
+        :return: None
+        """
+        report = WarmupReport(
+            fields=["app.Model.color"],
+            palettes={"BootstrapColorChoices"},
+            choices=["app.Model.color"],
+            timings={"config": 0.5, "choices": 0.25},
+        )
+        stdout = StringIO()
+        with patch(
+            "django_colors.management.commands.colors_warmup.preload",
+            return_value=report,
+        ) as mock_preload:
+            call_command("colors_warmup", stdout=stdout)
+
+        mock_preload.assert_called_once_with(freeze=False)
+        output = stdout.getvalue()
+        assert "Resolved 1 color field(s)" in output
+        assert "in 0.750s" in output
+        assert "config: 0.500s" in output
+
+    def test_fails_on_errors(self) -> None:
+        """
+        Test that the command fails when a field can't be warmed up.
+
+        :return: None
+        """
+        report = WarmupReport(errors={"app.Model.color": "Invalid"})
+        stderr = StringIO()
+        with (
+            patch(
+                "django_colors.management.commands.colors_warmup.preload",
+                return_value=report,
+            ),
+            pytest.raises(CommandError, match="1 color field"),
+        ):
+            call_command("colors_warmup", stdout=StringIO(), stderr=stderr)
+
+        assert "app.Model.color: Invalid" in stderr.getvalue()
@@ -2,9 +2,10 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
 from django import forms
 
-from django_colors.widgets import ColorChoiceWidget
+from django_colors.widgets import ColorAutocompleteWidget, ColorChoiceWidget
 
 
 class TestColorChoiceWidget:
@@ -178,3 +179,104 @@ class TestColorChoiceWidget:
         assert option["selected"] is True
         # Check type and value - index might be returned as a string
         assert str(option["index"]) == "0"  # Convert to string for comparison
+
+
+class TestColorAutocompleteWidget:
+    """Test the ColorAutocompleteWidget class."""
+
+    @pytest.fixture
+    def model_field(self) -> Mock:
+        """
+        Create a mocked model field for the widget.
+
+        :return: Mock model field
+        """
+        model_field = Mock()
+        model_field.model._meta.label = "test_app.Palette"
+        model_field.name = "color"
+        model_field.get_choice_labels.return_value = {"bg-a": "A"}
+        return model_field
+
+    def test_renders_only_selected_option(self, model_field: Mock) -> None:
+        """
+        Test that only the selected option is rendered.
+
+        :param model_field: Mocked model field fixture
+        :return: None
+        """
+        widget = ColorAutocompleteWidget()
+        widget.model_field = model_field
+        widget.is_required = True
+
+        optgroups = widget.optgroups("color", ["bg-a"])
+
+        assert [
+            (option["value"], option["label"], option["selected"])
+            for _, options, _ in optgroups
+            for option in options
+        ] == [("bg-a", "A", True)]
+        model_field.get_choice_labels.assert_called_once_with(["bg-a"])
+
+    def test_optional_keeps_blank_option(self, model_field: Mock) -> None:
+        """
+        Test that an optional widget renders an empty option.
+
+        :param model_field: Mocked model field fixture
+        :return: None
+        """
+        widget = ColorAutocompleteWidget()
+        widget.model_field = model_field
+
+        optgroups = widget.optgroups("color", [""])
+
+        assert [
+            (option["value"], option["selected"])
+            for _, options, _ in optgroups
+            for option in options
+        ] == [("", True)]
+        model_field.get_choice_labels.assert_called_once_with([])
+
+    def test_labels_from_choices_without_model_field(self) -> None:
+        """
+        Test that the labels come from the choices without a model field.
+
+        :return: None
+        """
+        widget = ColorAutocompleteWidget(
+            choices=[("bg-a", "A"), ("bg-b", "B")]
+        )
+
+        assert widget.get_selected_labels(["bg-b"]) == {"bg-b": "B"}
+
+    def test_render_includes_url(self, model_field: Mock) -> None:
+        """
+        Test that the autocomplete url is rendered with the field path.
+
+        :param model_field: Mocked model field fixture
+        :return: None
+        """
+        widget = ColorAutocompleteWidget(limit=10, match="prefix")
+        widget.model_field = model_field
+        widget.is_required = True
+
+        html = widget.render("color", "bg-a")
+
+        assert (
+            'data-autocomplete-url="/colors/autocomplete/?field=test_app.Palette.color'
+            '&amp;limit=10&amp;match=prefix"'
+        ) in html
+        assert html.count("<option") == 1
+
+    def test_custom_url(self, model_field: Mock) -> None:
+        """
+        Test that a custom url is used when given.
+
+        :param model_field: Mocked model field fixture
+        :return: None
+        """
+        widget = ColorAutocompleteWidget(url="/colors/search/")
+        widget.model_field = model_field
+
+        assert widget.get_url() == (
+            "/colors/search/?field=test_app.Palette.color&limit=20"
+        )
@@ -0,0 +1,7 @@
+"""Url configuration for the django_colors tests."""
+
+from django.urls import include, path
+
+urlpatterns = [
+    path("colors/", include("django_colors.urls")),
+]
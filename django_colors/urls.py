@@ -0,0 +1,11 @@
+"""Url configuration for the django_colors app."""
+
+from django.urls import path
+
+from django_colors import views
+
+app_name = "django_colors"
+
+urlpatterns = [
+    path("autocomplete/", views.color_autocomplete, name="autocomplete"),
+]
@@ -0,0 +1,133 @@
+"""Views for the django_colors app."""
+
+from django.apps import apps
+from django.contrib.auth import get_permission_codename
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.http import Http404, HttpRequest, JsonResponse
+from django.views import View
+
+from django_colors.fields import ColorModelField
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def get_color_field(field_path: str) -> ColorModelField:
+    """
+    Get a ColorModelField from its "app_label.Model.field" path.
+
+    :argument field_path: The path of the field
+    :returns: The ColorModelField instance
+    :raises Http404: If the path does not point to a ColorModelField
+    """
+    model_label, _, field_name = field_path.rpartition(".")
+    try:
+        field = apps.get_model(model_label)._meta.get_field(field_name)
+    except (LookupError, ValueError, FieldDoesNotExist):
+        raise Http404(f'No color field "{field_path}".') from None
+    if not isinstance(field, ColorModelField):
+        raise Http404(f'No color field "{field_path}".')
+    return field
+
+
+def get_positive_int(value: str | None, default: int) -> int:
+    """
+    Parse a positive integer query parameter.
+
+    :argument value: The raw parameter value
+    :argument default: The value used when missing or invalid
+    :returns: The parsed integer
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    return number if number > 0 else default
+
+
+class ColorAutocompleteView(View):
+    """
+    Search the choices of a color field.
+
+    Only fields with autocomplete enabled in COLORS_APP_CONFIG can be
+    searched, and only by users passing has_perm. Override has_perm to
+    change who can search the choices, for example to allow anonymous
+    users on public forms.
+
+    Query parameters:
+        field: The "app_label.Model.field" path of the color field
+        q: The text to search for
+        match: "prefix" to match the start of the values and labels,
+            "fuzzy" to add similar choices after the substring matches
+            when the field has a search index, anything else to match any
+            substring
+        page: The page of results, starting at 1
+        limit: The number of results per page, at most MAX_LIMIT
+
+    The response uses the select2 format:
+    {"results": [{"id": value, "text": label}], "pagination": {"more": bool}}
+    """
+
+    http_method_names = ["get"]
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        """
+        Search the choices of the requested field.
+
+        :argument request: The HTTP request
+        :returns: JSON response with the matching choices
+        :raises Http404: If the field is not a color field with
+            autocomplete enabled
+        :raises PermissionDenied: If the user may not search the field
+        """
+        field_path = request.GET.get("field", "")
+        field = get_color_field(field_path)
+        if not field.field_config.get("autocomplete"):
+            raise Http404(f'No color field "{field_path}".')
+        if not self.has_perm(request, field):
+            raise PermissionDenied
+        page = get_positive_int(request.GET.get("page"), 1)
+        limit = min(
+            get_positive_int(request.GET.get("limit"), DEFAULT_LIMIT),
+            MAX_LIMIT,
+        )
+        match = request.GET.get("match")
+        # fetch one extra match to know if there is another page
+        choices = field.search_choices(
+            request.GET.get("q", "").strip(),
+            limit=limit + 1,
+            offset=(page - 1) * limit,
+            prefix=match == "prefix",
+            fuzzy=match == "fuzzy",
+        )
+        return JsonResponse(
+            {
+                "results": [
+                    {"id": value, "text": label}
+                    for value, label in choices[:limit]
+                ],
+                "pagination": {"more": len(choices) > limit},
+            }
+        )
+
+    def has_perm(self, request: HttpRequest, field: ColorModelField) -> bool:
+        """
+        Check if the user may search the choices of a field.
+
+        Like the admin autocomplete, the user needs the view permission of
+        the model the field belongs to.
+
+        :argument request: The HTTP request
+        :argument field: The color field being searched
+        :returns: True if the user may search the choices
+        """
+        user = getattr(request, "user", None)
+        if user is None:
+            return False
+        opts = field.model._meta
+        return user.has_perm(
+            f"{opts.app_label}.{get_permission_codename('view', opts)}"
+        )
+
+
+color_autocomplete = ColorAutocompleteView.as_view()
@@ -0,0 +1,160 @@
+"""Warm up palettes, configurations and choices before serving requests."""
+
+from __future__ import annotations
+
+import gc
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.db import DatabaseError, connections
+
+from django_colors.checks import check_field_config, get_color_fields
+from django_colors.fields import ColorModelField
+
+
+def get_all_color_fields() -> list[ColorModelField]:
+    """
+    Get every ColorModelField of the installed models.
+
+    Fields inherited from concrete parents are only listed on the parent.
+
+    :returns: List of the color fields
+    """
+    return get_color_fields(None)
+
+
+@dataclass
+class WarmupReport:
+    """
+    Summary of what preload() warmed and how long it took.
+
+    Attributes:
+        fields: Labels of the fields whose configuration was resolved
+        palettes: Names of the palette classes that were prepared
+        choices: Labels of the fields whose choices were cached
+        errors: Error messages by field label
+        timings: Seconds spent in each step
+        frozen: Whether the objects were moved to the permanent generation
+    """
+
+    fields: list[str] = field(default_factory=list)
+    palettes: set[str] = field(default_factory=set)
+    choices: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    frozen: bool = False
+
+    @property
+    def duration(self) -> float:
+        """
+        Get the total time spent warming up.
+
+        :returns: The total time in seconds
+        """
+        return sum(self.timings.values())
+
+    @contextmanager
+    def timed(self, step: str) -> Iterator[None]:
+        """
+        Record the time spent in a step.
+
+        :argument step: The name of the step
+        :returns: Iterator yielding once
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[step] = time.perf_counter() - start
+
+
+def resolve_fields(
+    color_fields: list[ColorModelField], report: WarmupReport
+) -> list[ColorModelField]:
+    """
+    Resolve the configuration, palette and choice model of each field.
+
+    Fields are resolved with the same check the system checks run, so the
+    same errors are reported.
+
+    :argument color_fields: The fields to resolve
+    :argument report: The report to record the results in
+    :returns: List of the fields that were resolved without errors
+    """
+    resolved = []
+    for color_field in color_fields:
+        label = str(color_field)
+        messages = check_field_config(color_field)
+        if messages:
+            report.errors[label] = "; ".join(
+                message.msg for message in messages
+            )
+            continue
+        report.fields.append(label)
+        report.palettes.add(
+            color_field.field_config.default_color_choices.__name__
+        )
+        resolved.append(color_field)
+    return resolved
+
+
+def prefill_choices(
+    color_fields: list[ColorModelField], report: WarmupReport
+) -> None:
+    """
+    Build the default choices of the fields that cache them.
+
+    Fields with a search index also get their default index built.
+
+    :argument color_fields: The resolved fields
+    :argument report: The report to record the results in
+    :returns: None
+    """
+    for color_field in color_fields:
+        caches_choices = color_field.get_choices_cache() is not None
+        has_index = color_field.field_config.get("search_index")
+        if color_field.choices is not None or not (
+            caches_choices or has_index
+        ):
+            continue
+        try:
+            if caches_choices:
+                color_field.get_choices()
+            if has_index:
+                color_field.get_search_index()
+        except DatabaseError as error:
+            report.errors[str(color_field)] = str(error)
+            continue
+        report.choices.append(str(color_field))
+
+
+def preload(freeze: bool = True) -> WarmupReport:
+    """
+    Warm up every color field before the workers are forked.
+
+    Resolves the configuration, palette and choice model of each
+    ColorModelField, fills the choices caches and search indexes that are
+    enabled, then moves every tracked object to the permanent generation
+    with gc.freeze(), so forked workers share the warmed data copy-on-write
+    instead of copying it on their first garbage collection. The database
+    connections opened while prefilling are closed first, so no worker
+    inherits a socket shared with its siblings.
+
+    :argument freeze: Whether to call gc.freeze() at the end
+    :returns: The report of what was warmed and how long it took
+    """
+    report = WarmupReport()
+    with report.timed("fields"):
+        color_fields = get_all_color_fields()
+    with report.timed("config"):
+        color_fields = resolve_fields(color_fields, report)
+    with report.timed("choices"):
+        prefill_choices(color_fields, report)
+        connections.close_all()
+    if freeze:
+        with report.timed("freeze"):
+            gc.freeze()
+        report.frozen = True
+    return report
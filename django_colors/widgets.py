@@ -1,6 +1,11 @@
 """Widgets for color selection."""
 
+from urllib.parse import urlencode
+
 from django import forms
+from django.urls import reverse
+
+BLANK_LABEL = "---------"
 
 
 class ColorChoiceWidget(forms.Select):
@@ -8,3 +13,147 @@ class ColorChoiceWidget(forms.Select):
 
     template_name = "color_select.html"
     option_template_name = "color_select_option.html"
+
+
+class ColorAutocompleteWidget(ColorChoiceWidget):
+    """
+    Autocomplete widget for color selection from large palettes.
+
+    Only the selected option is rendered. The other choices are searched
+    with the autocomplete view, whose url is rendered in the
+    data-autocomplete-url attribute.
+    """
+
+    template_name = "color_autocomplete.html"
+    url_name = "django_colors:autocomplete"
+
+    class Media:
+        """Media for the autocomplete widget."""
+
+        js = ("django_colors/color_autocomplete.js",)
+
+    def __init__(
+        self,
+        attrs: dict | None = None,
+        choices: tuple = (),
+        url: str | None = None,
+        limit: int = 20,
+        match: str | None = None,
+    ) -> None:
+        """
+        Initialize the widget.
+
+        :argument attrs: HTML attributes for the select element
+        :argument choices: Choices used when no model field is bound
+        :argument url: Url of the autocomplete view, defaults to the url
+            named "django_colors:autocomplete"
+        :argument limit: Number of results requested per page
+        :argument match: "prefix" to search the start of the values and
+            labels, "fuzzy" to also find similar choices when the field
+            has a search index, None to search any substring
+        :returns: None
+        """
+        super().__init__(attrs, choices)
+        self.url = url
+        self.limit = limit
+        self.match = match
+        self.model_field = None
+
+    @property
+    def field_path(self) -> str | None:
+        """
+        Get the "app_label.Model.field" path of the bound model field.
+
+        :returns: The field path or None if no model field is bound
+        """
+        if self.model_field is None:
+            return None
+        return f"{self.model_field.model._meta.label}.{self.model_field.name}"
+
+    def get_url(self) -> str:
+        """
+        Get the autocomplete url for the bound model field.
+
+        :returns: The url including the query parameters of the field
+        """
+        url = self.url or reverse(self.url_name)
+        params = {"field": self.field_path, "limit": self.limit}
+        if self.match:
+            params["match"] = self.match
+        return f"{url}?{urlencode(params)}"
+
+    def get_context(self, name: str, value: object, attrs: dict) -> dict:
+        """
+        Get the template context, adding the autocomplete url.
+
+        :argument name: The name of the field
+        :argument value: The current value
+        :argument attrs: HTML attributes for the select element
+        :returns: The template context
+        """
+        context = super().get_context(name, value, attrs)
+        if self.model_field is not None:
+            context["widget"]["attrs"]["data-autocomplete-url"] = (
+                self.get_url()
+            )
+        return context
+
+    def get_selected_labels(self, values: list[str]) -> dict[str, str]:
+        """
+        Get the labels of the selected values.
+
+        :argument values: The selected values
+        :returns: Dict mapping each known value to its label
+        """
+        if self.model_field is not None:
+            return self.model_field.get_choice_labels(values)
+        return {
+            str(value): label
+            for value, label in self.choices
+            if str(value) in values
+        }
+
+    def optgroups(
+        self, name: str, value: list[str], attrs: dict | None = None
+    ) -> list[tuple]:
+        """
+        Get the option groups, containing only the selected options.
+
+        :argument name: The name of the field
+        :argument value: The selected values
+        :argument attrs: HTML attributes for the options
+        :returns: List of (group name, options, index) tuples
+        """
+        values = [item for item in value if item not in ("", None)]
+        labels = self.get_selected_labels(values)
+        groups = []
+        if not self.is_required:
+            # keep an empty option so the value can be cleared
+            groups.append(
+                (
+                    None,
+                    [
+                        self.create_option(
+                            name, "", BLANK_LABEL, not values, 0, attrs=attrs
+                        )
+                    ],
+                    0,
+                )
+            )
+        return groups + [
+            (
+                None,
+                [
+                    self.create_option(
+                        name,
+                        item,
+                        labels.get(item, item),
+                        True,
+                        index,
+                        attrs=attrs,
+                    )
+                ],
+                index,
+            )
+            for index, item in enumerate(values, start=len(groups))
+        ]